@@ -8,10 +8,14 @@ Generates comprehensive AGENTS.md from Claude Code project structure:
 - Includes MCP integration
 - Creates command reference table
 - Reference-based: No file duplication, only links to existing files
+
+Sections are memoized against the inputs they were rendered from, so a
+long-lived generator (bridge.py --watch) only re-renders the sections whose
+skills, agents, CLAUDE.md sections or metadata actually changed.
 """
 
 import os
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, List, Optional, Any, Tuple
 from pathlib import Path
 from datetime import datetime
 
@@ -38,6 +42,11 @@ class AgentsMdGenerator:
         self.project_root = Path(project_root).resolve()
         self.skill_documenter = SkillDocumenter()
 
+        # Section name -> (inputs it was rendered from, rendered text)
+        self._sections: Dict[str, Tuple[Tuple, str]] = {}
+        # Sections actually re-rendered by the last generate() call
+        self.rendered_sections: List[str] = []
+
     def generate(
         self,
         metadata: ProjectMetadata,
@@ -64,49 +73,93 @@ class AgentsMdGenerator:
         print("📝 Generating AGENTS.md...")
 
         mcp_servers = mcp_servers or []
+        skills = list(skills)
+        agents = list(agents)
+        claude_md_sections = list(claude_md_sections)
+        today = datetime.now().strftime("%Y-%m-%d")
+        self.rendered_sections = []
 
         # Build AGENTS.md content
         content = []
 
         # Header
-        content.append(self._generate_header(metadata))
+        content.append(self._section(
+            "header", (metadata,),
+            lambda: self._generate_header(metadata)))
 
         # Quick Reference
-        content.append(self._generate_quick_reference(metadata, skills, agents))
+        content.append(self._section(
+            "quick_reference", (metadata, skills, agents),
+            lambda: self._generate_quick_reference(metadata, skills, agents)))
 
         # Project Overview
-        content.append(self._generate_project_overview(metadata, claude_md_sections))
+        content.append(self._section(
+            "project_overview", (metadata, claude_md_sections),
+            lambda: self._generate_project_overview(metadata, claude_md_sections)))
 
         # Available Skills
         if skills:
-            content.append(self._generate_skills_section(skills))
+            content.append(self._section(
+                "skills", (skills,),
+                lambda: self._generate_skills_section(skills)))
 
         # Project Structure
-        content.append(self._generate_structure_section(metadata, structure))
+        content.append(self._section(
+            "structure", (metadata, structure),
+            lambda: self._generate_structure_section(metadata, structure)))
 
         # Workflow Patterns
-        content.append(self._generate_workflow_patterns())
+        content.append(self._section(
+            "workflow_patterns", (), self._generate_workflow_patterns))
 
         # MCP Integration
         if mcp_servers:
-            content.append(self._generate_mcp_section(mcp_servers))
+            content.append(self._section(
+                "mcp", (list(mcp_servers),),
+                lambda: self._generate_mcp_section(mcp_servers)))
 
         # Command Reference
-        content.append(self._generate_command_reference())
+        content.append(self._section(
+            "command_reference", (), self._generate_command_reference))
 
         # Common Operations
-        content.append(self._generate_common_operations())
+        content.append(self._section(
+            "common_operations", (), self._generate_common_operations))
 
         # Best Practices
-        content.append(self._generate_best_practices())
+        content.append(self._section(
+            "best_practices", (), self._generate_best_practices))
 
         # Footer
-        content.append(self._generate_footer(metadata))
+        content.append(self._section(
+            "footer", (metadata, today),
+            lambda: self._generate_footer(metadata)))
 
         print("   ✅ AGENTS.md generated successfully")
 
         return "\n\n".join(content)
 
+    def _section(self, name: str, inputs: Tuple, render: Callable[[], str]) -> str:
+        """
+        Render a section, reusing the previous text if its inputs are equal.
+
+        Args:
+            name: Section name
+            inputs: Values the section is rendered from (compared with ==)
+            render: Renders the section
+
+        Returns:
+            Section text
+        """
+        cached = self._sections.get(name)
+        if cached is not None and cached[0] == inputs:
+            return cached[1]
+
+        text = render()
+        self._sections[name] = (inputs, text)
+        self.rendered_sections.append(name)
+        return text
+
     def _generate_header(self, metadata: ProjectMetadata) -> str:
         """Generate AGENTS.md header."""
         return f"""# AGENTS.md
@@ -8,13 +8,20 @@ Usage:
     python bridge.py                    # Generate AGENTS.md for current directory
     python bridge.py --project /path    # Generate for specific project
     python bridge.py --validate         # Validate environment only
+    python bridge.py --no-cache         # Re-parse everything, ignore .claude/.bridge-cache
+    python bridge.py --watch            # Keep AGENTS.md in sync while editing
 """
 
+import io
 import sys
+import time
+import hashlib
 import argparse
+import contextlib
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 
+from bridge_cache import BridgeCache
 from safety_mechanism import SafetyMechanism
 from project_analyzer import ProjectAnalyzer
 from agents_md_generator import AgentsMdGenerator
@@ -30,19 +37,22 @@ class CodexCliBridge:
     3. AGENTS.md generation (template-based, reference approach)
     """
 
-    def __init__(self, project_root: str, auto_init: bool = True):
+    def __init__(self, project_root: str, auto_init: bool = True, use_cache: bool = True):
         """
         Initialize bridge.
 
         Args:
             project_root: Path to project root directory
             auto_init: Auto-run /init if CLAUDE.md missing (default: True)
+            use_cache: Reuse parsed records from .claude/.bridge-cache (default: True)
         """
         self.project_root = Path(project_root).resolve()
         self.auto_init = auto_init
+        self.use_cache = use_cache
 
         # Components
         self.safety = SafetyMechanism(str(self.project_root))
+        self.cache: Optional[BridgeCache] = None
         self.analyzer: Optional[ProjectAnalyzer] = None
         self.generator: Optional[AgentsMdGenerator] = None
 
@@ -77,33 +87,13 @@ class CodexCliBridge:
         # Step 2: Project analysis
         print("STEP 2: Project Analysis")
         print("-" * 64)
-        self.analyzer = ProjectAnalyzer(str(self.project_root))
-        analysis = self.analyzer.analyze()
+        analysis = self._analyze()
         print()
 
         # Step 3: AGENTS.md generation
         print("STEP 3: AGENTS.md Generation")
         print("-" * 64)
-        self.generator = AgentsMdGenerator(str(self.project_root))
-
-        # Convert analysis dict values to objects
-        from project_analyzer import ProjectMetadata, ProjectStructure
-
-        # Reconstruct metadata and structure from dicts
-        metadata_dict = analysis["metadata"]
-        structure_dict = analysis["structure"]
-
-        metadata = ProjectMetadata(**metadata_dict)
-        structure = ProjectStructure(**structure_dict)
-
-        agents_md_content = self.generator.generate(
-            metadata=metadata,
-            structure=structure,
-            skills=analysis["parsed_data"]["skills"],
-            agents=analysis["parsed_data"]["agents"],
-            claude_md_sections=analysis["parsed_data"]["claude_md_sections"],
-            mcp_servers=analysis["parsed_data"].get("mcp_servers", [])
-        )
+        agents_md_content = self._generate(analysis)
         print()
 
         # Step 4: Write AGENTS.md
@@ -143,6 +133,98 @@ class CodexCliBridge:
             print("=" * 64)
             return False
 
+    def watch(self, interval: float = 0.5) -> bool:
+        """
+        Keep AGENTS.md in sync with the project until interrupted.
+
+        Runs the full workflow once, then polls CLAUDE.md, the skill and agent
+        directories and the documentation tree every ``interval`` seconds.
+        Unchanged files are served from the bridge cache, only sections whose
+        inputs changed are re-rendered, and AGENTS.md is rewritten only when
+        the rendered output differs from what was last written.
+
+        Args:
+            interval: Seconds between polls
+
+        Returns:
+            False if the initial generation failed, True when stopped
+        """
+        if not self.run():
+            return False
+
+        agents_md_path = self.project_root / "AGENTS.md"
+        last_digest = hashlib.sha256(agents_md_path.read_bytes()).hexdigest()
+
+        print(f"👀 Watching {self.project_root} (every {interval:g}s, Ctrl+C to stop)")
+
+        try:
+            while True:
+                time.sleep(interval)
+                started = time.perf_counter()
+
+                try:
+                    content, sections = self._regenerate_quietly()
+                except Exception as e:
+                    print(f"   ⚠️  Regeneration failed: {e}")
+                    continue
+
+                digest = hashlib.sha256(content.encode("utf-8")).hexdigest()
+                if digest == last_digest:
+                    continue
+
+                with open(agents_md_path, "w", encoding="utf-8") as f:
+                    f.write(content)
+                last_digest = digest
+
+                elapsed_ms = (time.perf_counter() - started) * 1000
+                changed = ", ".join(sections) or "no sections"
+                print(f"🔄 AGENTS.md updated ({changed}) in {elapsed_ms:.0f} ms")
+
+        except KeyboardInterrupt:
+            print("\n👋 Watch stopped.")
+
+        return True
+
+    def _regenerate_quietly(self) -> Tuple[str, list]:
+        """
+        Re-analyze and re-render with progress output suppressed.
+
+        Returns:
+            (AGENTS.md content, names of the sections that were re-rendered)
+        """
+        with contextlib.redirect_stdout(io.StringIO()):
+            content = self._generate(self._analyze())
+        return content, self.generator.rendered_sections
+
+    def _analyze(self) -> dict:
+        """Analyze the project, reusing the bridge cache across calls."""
+        if self.use_cache and self.cache is None:
+            self.cache = BridgeCache(str(self.project_root))
+
+        self.analyzer = ProjectAnalyzer(str(self.project_root), cache=self.cache)
+        return self.analyzer.analyze()
+
+    def _generate(self, analysis: dict) -> str:
+        """Render AGENTS.md, reusing the generator (and its section memo) across calls."""
+        if self.generator is None:
+            self.generator = AgentsMdGenerator(str(self.project_root))
+
+        # Convert analysis dict values to objects
+        from project_analyzer import ProjectMetadata, ProjectStructure
+
+        # Reconstruct metadata and structure from dicts
+        metadata = ProjectMetadata(**analysis["metadata"])
+        structure = ProjectStructure(**analysis["structure"])
+
+        return self.generator.generate(
+            metadata=metadata,
+            structure=structure,
+            skills=analysis["parsed_data"]["skills"],
+            agents=analysis["parsed_data"]["agents"],
+            claude_md_sections=analysis["parsed_data"]["claude_md_sections"],
+            mcp_servers=analysis["parsed_data"].get("mcp_servers", [])
+        )
+
     def validate_only(self) -> bool:
         """
         Run validation checks only (no generation).
@@ -206,6 +288,12 @@ Examples:
 
   # Show status report
   python bridge.py --status
+
+  # Ignore the parse cache (.claude/.bridge-cache) and re-parse everything
+  python bridge.py --no-cache
+
+  # Regenerate AGENTS.md whenever CLAUDE.md, skills or agents change
+  python bridge.py --watch --interval 1
         """
     )
 
@@ -227,6 +315,25 @@ Examples:
         help="Don't auto-run /init if CLAUDE.md missing"
     )
 
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Don't reuse parsed records from .claude/.bridge-cache"
+    )
+
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep AGENTS.md in sync: regenerate whenever sources change"
+    )
+
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=0.5,
+        help="Polling interval in seconds for --watch (default: 0.5)"
+    )
+
     parser.add_argument(
         "--status",
         action="store_true",
@@ -238,7 +345,8 @@ Examples:
     # Create bridge
     bridge = CodexCliBridge(
         project_root=args.project,
-        auto_init=not args.no_auto_init
+        auto_init=not args.no_auto_init,
+        use_cache=not args.no_cache
     )
 
     # Execute requested action
@@ -256,6 +364,10 @@ Examples:
         success = bridge.validate_only()
         sys.exit(0 if success else 1)
 
+    elif args.watch:
+        success = bridge.watch(interval=args.interval)
+        sys.exit(0 if success else 1)
+
     else:
         # Full generation
         success = bridge.run()
@@ -0,0 +1,228 @@
+"""
+Bridge Cache - Persistent project-metadata cache for Codex CLI Bridge
+
+Stores parsed CLAUDE.md sections, skills, agents and directory listings in
+.claude/.bridge-cache, together with the mtime/size of every file and
+directory each record was derived from:
+- A record is reused only while all of its source paths are unchanged
+- New or changed files are re-parsed, removed ones drop out of the cache
+- The cache file is rewritten only when its contents change
+
+On an unchanged tree a run is served entirely from stat() calls.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+
+CACHE_VERSION = 1
+DEFAULT_CACHE_PATH = Path(".claude") / ".bridge-cache"
+
+# Files whose mtime falls this close to the last cache write may have been
+# modified again within the same timestamp tick; they are never trusted.
+RACY_WINDOW_NS = 2 * 10**9
+
+# Parsed records depend on the parser code as well as on the files
+_PARSER_SOURCES = ("claude_parser.py", "bridge_cache.py")
+
+
+def stat_signature(path) -> Optional[List[int]]:
+    """
+    Get the change signature of a file or directory.
+
+    Args:
+        path: File or directory path
+
+    Returns:
+        [mtime_ns, size] or None if the path does not exist
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+def _parser_fingerprint() -> str:
+    """Hash of the parser sources, so code changes invalidate the cache."""
+    digest = hashlib.sha256()
+    base = Path(__file__).resolve().parent
+    for name in _PARSER_SOURCES:
+        try:
+            digest.update((base / name).read_bytes())
+        except OSError:
+            pass
+    return digest.hexdigest()[:16]
+
+
+class BridgeCache:
+    """
+    Stat-validated record cache backed by a JSON manifest.
+
+    Records live in named sections (``skills``, ``agents``, ...) under a
+    string key. Each record lists the paths it depends on with their
+    signature at parse time; ``get`` returns the record only if every
+    dependency still has the same signature.
+
+    Callers take signatures *before* reading a path, so a file modified
+    while it is being parsed is re-parsed on the next run.
+    """
+
+    def __init__(self, project_root: str, path: Optional[str] = None):
+        """
+        Initialize cache.
+
+        Args:
+            project_root: Path to project root directory
+            path: Cache file (default: <project_root>/.claude/.bridge-cache)
+        """
+        self.project_root = Path(project_root).resolve()
+        self.path = Path(path) if path else self.project_root / DEFAULT_CACHE_PATH
+        self.hits = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        self._fingerprint = _parser_fingerprint()
+        self._written_at = 0
+        self._old: Dict[str, Dict[str, Dict]] = {}
+        self._new: Dict[str, Dict[str, Dict]] = {}
+        self._racy = False
+        self.load()
+
+    def load(self) -> None:
+        """(Re)load the manifest from disk; a missing or stale one is ignored."""
+        self._old = {}
+        self._new = {}
+        self._written_at = 0
+
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        if (not isinstance(data, dict)
+                or data.get("version") != CACHE_VERSION
+                or data.get("parser") != self._fingerprint):
+            return
+
+        self._old = data.get("sections", {})
+        self._written_at = data.get("written_at", 0)
+
+    def signature(self, path) -> Optional[List[int]]:
+        """Current signature of a path (take it before reading the path)."""
+        return stat_signature(path)
+
+    def get(self, section: str, key: str) -> Optional[Any]:
+        """
+        Look up a record whose dependencies are all unchanged.
+
+        Args:
+            section: Record section name
+            key: Record key
+
+        Returns:
+            The cached value, or None on a miss
+        """
+        entry = self._old.get(section, {}).get(key)
+
+        if entry is not None and self._is_fresh(entry["deps"]):
+            with self._lock:
+                self.hits += 1
+                self._new.setdefault(section, {})[key] = entry
+            return entry["value"]
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, section: str, key: str, deps: Dict[str, Optional[List[int]]],
+            value: Any) -> None:
+        """
+        Store a freshly parsed record.
+
+        Records with a missing dependency, or whose value does not survive
+        a JSON round trip unchanged (e.g. YAML dates), are not cached.
+
+        Args:
+            section: Record section name
+            key: Record key
+            deps: Path -> signature taken before the path was read
+            value: JSON-serializable record
+        """
+        if any(sig is None for sig in deps.values()):
+            return
+
+        try:
+            if json.loads(json.dumps(value)) != value:
+                return
+        except (TypeError, ValueError):
+            return
+
+        with self._lock:
+            self._new.setdefault(section, {})[key] = {
+                "deps": {str(path): sig for path, sig in deps.items()},
+                "value": value
+            }
+
+    @property
+    def dirty(self) -> bool:
+        """True if the manifest on disk no longer matches this run."""
+        return self._racy or self._new != self._old
+
+    def save(self) -> bool:
+        """
+        Write the records used in this run, dropping everything else.
+
+        Returns:
+            True if the manifest was written, False if it was unchanged
+        """
+        if not self.dirty:
+            return False
+
+        payload = {
+            "version": CACHE_VERSION,
+            "parser": self._fingerprint,
+            "written_at": time.time_ns(),
+            "sections": self._new
+        }
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(
+                dir=str(self.path.parent), prefix=".bridge-cache.", suffix=".tmp"
+            )
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(payload, f, separators=(",", ":"))
+                os.replace(tmp_path, self.path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            print(f"   ⚠️  Could not write bridge cache {self.path}: {e}")
+            return False
+
+        self._old = self._new
+        self._new = {}
+        self._written_at = payload["written_at"]
+        self._racy = False
+        return True
+
+    def _is_fresh(self, deps: Dict[str, List[int]]) -> bool:
+        """Check that every dependency still has its recorded signature."""
+        for path, sig in deps.items():
+            current = stat_signature(path)
+            if current != sig:
+                return False
+            if current[0] >= self._written_at - RACY_WINDOW_NS:
+                # Modified too close to the last write to trust the mtime
+                self._racy = True
+                return False
+        return True
@@ -9,14 +9,97 @@ Parses CLAUDE.md and extracts project structure information:
 - MCP server configuration
 
 Returns file paths only - no content duplication (reference-based approach)
+
+Skill and agent files are read only up to the end of their YAML frontmatter,
+and the per-file work is spread over a thread pool. With a BridgeCache,
+records for unchanged files and directories are reused instead of re-parsed.
 """
 
 import os
 import re
 import yaml
-from typing import Dict, List, Optional, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Any
 from pathlib import Path
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, asdict
+
+from bridge_cache import BridgeCache
+
+
+# libyaml-backed loader when PyYAML was built with it, pure Python otherwise
+YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+FRONTMATTER_PATTERN = re.compile(r'^---\s*\n(.*?)\n---\s*\n', re.DOTALL)
+FRONTMATTER_OPENING = re.compile(r'---\s*')
+FRONTMATTER_CLOSING = re.compile(r'\n---\s*\n')
+
+# Give up on the incremental read past this point and parse the whole file
+FRONTMATTER_READ_LIMIT = 64 * 1024
+
+
+def read_frontmatter(path: Path) -> Optional[str]:
+    """
+    Read the YAML frontmatter block of a Markdown file.
+
+    Reads line by line and stops at the closing ``---``, so the body of a
+    large SKILL.md or agent file is never loaded. Returns exactly what
+    ``FRONTMATTER_PATTERN`` would capture on the full file content.
+
+    Args:
+        path: Path to the Markdown file
+
+    Returns:
+        Frontmatter text (without delimiters) or None if there is none
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        first = f.readline()
+        if not first.startswith("---"):
+            return None
+
+        lines = [first]
+        size = len(first)
+        start = None
+
+        for line in f:
+            lines.append(line)
+            size += len(line)
+
+            if line.rstrip() == "---":
+                content = "".join(lines)
+                if start is None:
+                    # The opening's \s* is greedy: the block starts after the
+                    # last newline of the whitespace run that follows "---".
+                    run = content[3:FRONTMATTER_OPENING.match(content).end()]
+                    if "\n" not in run:
+                        return None
+                    start = 3 + run.rindex("\n") + 1
+
+                closing = FRONTMATTER_CLOSING.search(content, start)
+                if closing:
+                    return content[start:closing.start()]
+
+            if size > FRONTMATTER_READ_LIMIT:
+                lines.append(f.read())
+                break
+
+    match = FRONTMATTER_PATTERN.match("".join(lines))
+    return match.group(1) if match else None
+
+
+def parse_frontmatter(block: str) -> Any:
+    """Parse a frontmatter block with the fastest available safe YAML loader."""
+    return yaml.load(block, Loader=YamlLoader)
+
+
+def _subdirectory_names(directory: Path) -> List[str]:
+    """Names of the subdirectories of a directory (symlinks followed)."""
+    with os.scandir(directory) as entries:
+        return [entry.name for entry in entries if entry.is_dir()]
+
+
+def _markdown_names(directory: Path) -> List[str]:
+    """Names matching *.md in a directory, in glob order."""
+    return [path.name for path in directory.glob("*.md")]
 
 
 @dataclass
@@ -72,18 +155,23 @@ class ClaudeProjectParser:
     Returns file paths only - no content duplication.
     """
 
-    def __init__(self, project_root: str):
+    def __init__(self, project_root: str, max_workers: Optional[int] = None,
+                 cache: Optional[BridgeCache] = None):
         """
         Initialize parser.
 
         Args:
             project_root: Path to project root directory
+            max_workers: Thread pool size for skill/agent scanning (default: auto)
+            cache: Optional BridgeCache to reuse records for unchanged files
         """
         self.project_root = Path(project_root).resolve()
+        self.max_workers = max_workers
+        self.cache = cache
         self.claude_md_path = self.project_root / "CLAUDE.md"
 
         # Parsed data
-        self.claude_md_content: Optional[str] = None
+        self._claude_md_content: Optional[str] = None
         self.claude_md_sections: List[ClaudeMdSection] = []
         self.skills: List[SkillInfo] = []
         self.agents: List[AgentInfo] = []
@@ -125,16 +213,38 @@ class ClaudeProjectParser:
             "project_root": str(self.project_root)
         }
 
+    @property
+    def claude_md_content(self) -> Optional[str]:
+        """Raw CLAUDE.md text (read on demand if sections came from the cache)."""
+        if self._claude_md_content is None and self.claude_md_sections:
+            with open(self.claude_md_path, "r", encoding="utf-8") as f:
+                self._claude_md_content = f.read()
+        return self._claude_md_content
+
     def parse_claude_md(self) -> None:
         """Parse CLAUDE.md and extract sections."""
         if not self.claude_md_path.exists():
             raise FileNotFoundError(f"CLAUDE.md not found at {self.claude_md_path}")
 
+        key = str(self.claude_md_path)
+        self._claude_md_content = None
+
+        if self.cache is not None:
+            cached = self.cache.get("claude_md", key)
+            if cached is not None:
+                self.claude_md_sections = [ClaudeMdSection(**s) for s in cached]
+                return
+            signature = self.cache.signature(self.claude_md_path)
+
         with open(self.claude_md_path, "r", encoding="utf-8") as f:
-            self.claude_md_content = f.read()
+            self._claude_md_content = f.read()
 
         # Extract sections by headings
-        self.claude_md_sections = self._extract_sections(self.claude_md_content)
+        self.claude_md_sections = self._extract_sections(self._claude_md_content)
+
+        if self.cache is not None:
+            self.cache.put("claude_md", key, {key: signature},
+                           [asdict(s) for s in self.claude_md_sections])
 
     def _extract_sections(self, content: str) -> List[ClaudeMdSection]:
         """
@@ -185,64 +295,117 @@ class ClaudeProjectParser:
 
         return sections
 
-    def scan_skills(self) -> None:
-        """Scan skill directories and extract metadata."""
-        skills_dirs = [
+    def skill_dirs(self) -> List[Path]:
+        """Directories searched for skills, in priority order."""
+        return [
             self.project_root / ".claude" / "skills",
             Path.home() / ".claude" / "skills",
             self.project_root / "generated-skills",
             self.project_root / "claude-skills-examples"
         ]
 
-        for skills_dir in skills_dirs:
+    def agent_dirs(self) -> List[Path]:
+        """Directories searched for agents, in priority order."""
+        return [
+            self.project_root / ".claude" / "agents",
+            Path.home() / ".claude" / "agents"
+        ]
+
+    def scan_skills(self) -> None:
+        """Scan skill directories and extract metadata."""
+        skill_paths = []
+
+        for skills_dir in self.skill_dirs():
             if not skills_dir.exists():
                 continue
 
             # Scan each directory in skills folder
-            for skill_path in skills_dir.iterdir():
-                if not skill_path.is_dir():
-                    continue
-
-                # Look for SKILL.md
-                skill_md = skill_path / "SKILL.md"
-                if not skill_md.exists():
-                    # Try lowercase
-                    skill_md = skill_path / "skill.md"
-                    if not skill_md.exists():
-                        continue
-
-                # Parse skill
-                skill_info = self._parse_skill(skill_path, skill_md)
-                if skill_info:
-                    self.skills.append(skill_info)
-
-    def _parse_skill(self, skill_path: Path, skill_md: Path) -> Optional[SkillInfo]:
+            skill_paths.extend(
+                skills_dir / name
+                for name in self._list_dir(skills_dir, "skill-dirs", _subdirectory_names)
+            )
+
+        self.skills.extend(self._parse_many(
+            "skills", skill_paths, self._scan_skill_dir,
+            lambda cached: SkillInfo(**cached["info"]) if cached["info"] else None
+        ))
+
+    def _scan_skill_dir(self, skill_path: Path) -> Optional[SkillInfo]:
+        """
+        Parse a skill directory if it contains SKILL.md (or skill.md).
+
+        Lists the directory once to find both the manifest and the Python
+        files.
+
+        Args:
+            skill_path: Path to skill directory
+
+        Returns:
+            SkillInfo object or None if not a skill / parsing fails
+        """
+        key = str(skill_path)
+
+        if self.cache is not None:
+            dir_signature = self.cache.signature(skill_path)
+
+        try:
+            with os.scandir(skill_path) as entries:
+                names = [entry.name for entry in entries]
+        except OSError:
+            return None
+
+        # Look for SKILL.md, then lowercase skill.md
+        if "SKILL.md" in names:
+            skill_md = skill_path / "SKILL.md"
+        elif "skill.md" in names:
+            skill_md = skill_path / "skill.md"
+        else:
+            if self.cache is not None:
+                self.cache.put("skills", key, {key: dir_signature}, {"info": None})
+            return None
+
+        if self.cache is not None:
+            md_signature = self.cache.signature(skill_md)
+
+        python_files = [skill_path / name for name in names if name.endswith(".py")]
+        skill_info = self._parse_skill(skill_path, skill_md, python_files)
+
+        # Failures are not cached, so their warning shows up on every run
+        if self.cache is not None and skill_info:
+            self.cache.put("skills", key, {key: dir_signature, str(skill_md): md_signature},
+                           {"info": asdict(skill_info)})
+
+        return skill_info
+
+    def _parse_skill(self, skill_path: Path, skill_md: Path,
+                     python_paths: Optional[List[Path]] = None) -> Optional[SkillInfo]:
         """
         Parse a single skill.
 
         Args:
             skill_path: Path to skill directory
             skill_md: Path to SKILL.md file
+            python_paths: Python files in the skill directory (listed if omitted)
 
         Returns:
             SkillInfo object or None if parsing fails
         """
         try:
-            with open(skill_md, "r", encoding="utf-8") as f:
-                content = f.read()
-
             # Extract YAML frontmatter
-            yaml_match = re.match(r'^---\s*\n(.*?)\n---\s*\n', content, re.DOTALL)
-            if not yaml_match:
+            block = read_frontmatter(skill_md)
+            if block is None:
                 return None
 
-            frontmatter = yaml.safe_load(yaml_match.group(1))
+            frontmatter = parse_frontmatter(block)
             name = frontmatter.get("name", skill_path.name)
             description = frontmatter.get("description", "")
 
+            if python_paths is None:
+                python_paths = list(skill_path.glob("*.py"))
+
             # Find Python files
             python_files = []
-            for py_file in skill_path.glob("*.py"):
+            for py_file in python_paths:
                 # Get relative path from project root
                 try:
                     rel_path = py_file.relative_to(self.project_root)
@@ -278,20 +441,93 @@ class ClaudeProjectParser:
 
     def scan_agents(self) -> None:
         """Scan agent directories and extract metadata."""
-        agents_dirs = [
-            self.project_root / ".claude" / "agents",
-            Path.home() / ".claude" / "agents"
-        ]
+        agent_files = []
 
-        for agents_dir in agents_dirs:
+        for agents_dir in self.agent_dirs():
             if not agents_dir.exists():
                 continue
 
             # Scan each .md file in agents folder
-            for agent_file in agents_dir.glob("*.md"):
-                agent_info = self._parse_agent(agent_file)
-                if agent_info:
-                    self.agents.append(agent_info)
+            agent_files.extend(
+                agents_dir / name
+                for name in self._list_dir(agents_dir, "agent-files", _markdown_names)
+            )
+
+        self.agents.extend(self._parse_many(
+            "agents", agent_files, self._scan_agent_file,
+            lambda cached: AgentInfo(**cached)
+        ))
+
+    def _parse_many(self, section: str, paths: List[Path],
+                    parse: Callable[[Path], Any], from_cache: Callable[[Any], Any]) -> List[Any]:
+        """
+        Parse paths on the thread pool, serving unchanged ones from the cache.
+
+        Cache hits are resolved inline (a stat per dependency); only the
+        misses are handed to the pool.
+
+        Args:
+            section: Cache section for the records
+            paths: Paths to parse
+            parse: Parser for one path (runs on a worker thread)
+            from_cache: Builds the result from a cached record
+
+        Returns:
+            Non-empty results in path order
+        """
+        results: List[Any] = [None] * len(paths)
+        pending = []
+
+        for index, path in enumerate(paths):
+            cached = self.cache.get(section, str(path)) if self.cache is not None else None
+            if cached is not None:
+                results[index] = from_cache(cached)
+            else:
+                pending.append(index)
+
+        if pending:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                parsed = pool.map(parse, [paths[index] for index in pending])
+                for index, result in zip(pending, parsed):
+                    results[index] = result
+
+        return [result for result in results if result]
+
+    def _scan_agent_file(self, agent_file: Path) -> Optional[AgentInfo]:
+        """Parse an agent file and cache the record."""
+        if self.cache is None:
+            return self._parse_agent(agent_file)
+
+        key = str(agent_file)
+        signature = self.cache.signature(agent_file)
+        agent_info = self._parse_agent(agent_file)
+        if agent_info:
+            self.cache.put("agents", key, {key: signature}, asdict(agent_info))
+        return agent_info
+
+    def _list_dir(self, directory: Path, kind: str,
+                  lister: Callable[[Path], List[str]]) -> List[str]:
+        """
+        List entry names of a directory, cached while the directory is unchanged.
+
+        Args:
+            directory: Directory to list
+            kind: Listing kind (part of the cache key)
+            lister: Function returning the entry names for a directory
+
+        Returns:
+            Entry names in listing order
+        """
+        if self.cache is None:
+            return lister(directory)
+
+        key = f"{kind}:{directory}"
+        names = self.cache.get("listings", key)
+        if names is None:
+            signature = self.cache.signature(directory)
+            names = lister(directory)
+            self.cache.put("listings", key, {str(directory): signature}, names)
+        return names
 
     def _parse_agent(self, agent_file: Path) -> Optional[AgentInfo]:
         """
@@ -304,15 +540,12 @@ class ClaudeProjectParser:
             AgentInfo object or None if parsing fails
         """
         try:
-            with open(agent_file, "r", encoding="utf-8") as f:
-                content = f.read()
-
             # Extract YAML frontmatter
-            yaml_match = re.match(r'^---\s*\n(.*?)\n---\s*\n', content, re.DOTALL)
-            if not yaml_match:
+            block = read_frontmatter(agent_file)
+            if block is None:
                 return None
 
-            frontmatter = yaml.safe_load(yaml_match.group(1))
+            frontmatter = parse_frontmatter(block)
             name = frontmatter.get("name", agent_file.stem)
             description = frontmatter.get("description", "")
             tools = frontmatter.get("tools", [])
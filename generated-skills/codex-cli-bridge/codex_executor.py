@@ -7,15 +7,110 @@ Python wrappers for Codex CLI commands with intelligent features:
 - Sandbox mode helpers (read-only, workspace-write, danger-full-access)
 - Session management (start, resume, list)
 - Error handling and user notifications
+- Concurrent execution (AsyncCodexExecutor: bounded job queue, per-job
+  timeouts, cancellation, results as they complete)
+- Streaming output (line callbacks / async iterator; results keep a
+  size-capped tail of stdout and stderr)
 """
 
+import asyncio
+import inspect
+import itertools
+import os
+import signal
 import subprocess
+import sys
 import json
-from typing import Dict, Optional, List, Tuple
+import threading
+import time
+from collections import deque
+from typing import (
+    Any, AsyncIterator, Callable, Deque, Dict, Iterable, Optional, List, Set, Tuple, Union
+)
 from dataclasses import dataclass
 from enum import Enum
 
 
+DEFAULT_TIMEOUT = 300  # 5 minutes
+
+# CodexResult keeps at most this many characters of stdout/stderr (the tail)
+DEFAULT_OUTPUT_LIMIT = 1_000_000
+
+# Longer lines reach streaming callbacks in pieces of this many bytes
+STREAM_LINE_LIMIT = 64 * 1024
+
+CODEX_NOT_FOUND_MESSAGE = """
+Codex CLI not found!
+
+Please ensure:
+1. Codex CLI is installed
+2. Codex is in your PATH
+3. Try: which codex
+
+Installation:
+  Visit: https://github.com/openai/codex
+"""
+
+
+def _describe_timeout(seconds: float) -> str:
+    """Human-readable timeout ("5 minutes", "90 seconds")."""
+    if seconds >= 60 and seconds % 60 == 0:
+        minutes = int(seconds // 60)
+        return f"{minutes} minute{'s' if minutes != 1 else ''}"
+    return f"{seconds:g} second{'s' if seconds != 1 else ''}"
+
+
+def _kill_process_group(process) -> None:
+    """Kill a Codex process and, on POSIX, the process group it leads."""
+    try:
+        if os.name == "posix":
+            os.killpg(process.pid, signal.SIGKILL)
+        elif process.returncode is None:
+            process.kill()
+    except ProcessLookupError:
+        pass
+
+
+class OutputTail:
+    """
+    Size-capped ring buffer holding the last ``limit`` characters of a stream.
+
+    Lines are appended as they arrive and the oldest output is dropped once
+    the total exceeds the limit, so memory stays bounded however much a
+    Codex run prints.
+    """
+
+    def __init__(self, limit: int = DEFAULT_OUTPUT_LIMIT):
+        self.limit = limit
+        self.truncated = False
+        self._lines: Deque[str] = deque()
+        self._size = 0
+
+    def append(self, text: str) -> None:
+        """Add a line, evicting the oldest output beyond the limit."""
+        if len(text) > self.limit:
+            text = text[len(text) - self.limit:]
+            self.truncated = True
+
+        self._lines.append(text)
+        self._size += len(text)
+
+        while self._size > self.limit:
+            self.truncated = True
+            excess = self._size - self.limit
+            oldest = self._lines.popleft()
+            if len(oldest) > excess:
+                # Keep the end of a partially evicted line
+                self._lines.appendleft(oldest[excess:])
+                self._size -= excess
+            else:
+                self._size -= len(oldest)
+
+    def getvalue(self) -> str:
+        """The buffered tail as one string."""
+        return "".join(self._lines)
+
+
 class CodexModel(Enum):
     """Codex model types."""
     GPT5 = "gpt-5"  # General high reasoning
@@ -36,6 +131,18 @@ class ReasoningEffort(Enum):
     HIGH = "high"  # Default
 
 
+@dataclass
+class OutputLine:
+    """One line of Codex output, as passed to streaming callbacks."""
+    stream: str  # "stdout" or "stderr"
+    text: str  # Includes the trailing newline, if any
+    job_id: Optional[str] = None
+
+
+# Called for every output line; async executors also await a returned awaitable
+OutputCallback = Callable[[OutputLine], Any]
+
+
 @dataclass
 class CodexResult:
     """Result from Codex CLI execution."""
@@ -46,6 +153,22 @@ class CodexResult:
     command: str
     session_id: Optional[str] = None
     model_used: Optional[str] = None
+    job_id: Optional[str] = None
+    duration: Optional[float] = None  # Seconds (async executor)
+    truncated: bool = False  # stdout/stderr hold only the tail of the output
+
+
+@dataclass
+class CodexJob:
+    """A `codex exec` invocation queued on AsyncCodexExecutor."""
+    prompt: str
+    model: CodexModel = CodexModel.GPT5
+    sandbox: SandboxMode = SandboxMode.READ_ONLY
+    reasoning: ReasoningEffort = ReasoningEffort.HIGH
+    enable_search: bool = False
+    full_auto: bool = False
+    timeout: Optional[float] = None  # Seconds; None uses the executor default
+    job_id: Optional[str] = None
 
 
 class CodexExecutor:
@@ -56,14 +179,26 @@ class CodexExecutor:
     Plain `codex` fails in Claude Code (non-terminal environment).
     """
 
-    def __init__(self, working_dir: Optional[str] = None):
+    def __init__(
+        self,
+        working_dir: Optional[str] = None,
+        timeout: float = DEFAULT_TIMEOUT,
+        on_output: Optional[OutputCallback] = None,
+        output_limit: int = DEFAULT_OUTPUT_LIMIT
+    ):
         """
         Initialize Codex executor.
 
         Args:
             working_dir: Optional working directory for Codex commands
+            timeout: Seconds before a Codex command is killed (default: 300)
+            on_output: Optional callback receiving each OutputLine as it is printed
+            output_limit: Characters of stdout/stderr kept in CodexResult (the tail)
         """
         self.working_dir = working_dir
+        self.timeout = timeout
+        self.on_output = on_output
+        self.output_limit = output_limit
 
     def exec_analysis(
         self,
@@ -202,6 +337,40 @@ class CodexExecutor:
         Returns:
             CodexResult with execution details
         """
+        cmd = self.build_exec_command(
+            prompt=prompt,
+            model=model,
+            sandbox=sandbox,
+            reasoning=reasoning,
+            enable_search=enable_search,
+            full_auto=full_auto
+        )
+
+        return self._run_command(cmd, command_type="exec", model=model.value)
+
+    def build_exec_command(
+        self,
+        prompt: str,
+        model: CodexModel,
+        sandbox: SandboxMode,
+        reasoning: ReasoningEffort,
+        enable_search: bool = False,
+        full_auto: bool = False
+    ) -> List[str]:
+        """
+        Build the argument list for a `codex exec` invocation.
+
+        Args:
+            prompt: Task description
+            model: Codex model
+            sandbox: Sandbox mode
+            reasoning: Reasoning effort
+            enable_search: Enable web search
+            full_auto: Full auto mode
+
+        Returns:
+            Command list
+        """
         # Build command - ALWAYS use `codex exec`
         cmd = [
             "codex",
@@ -228,7 +397,7 @@ class CodexExecutor:
         # Add prompt
         cmd.append(prompt)
 
-        return self._run_command(cmd, command_type="exec", model=model.value)
+        return cmd
 
     def _run_command(
         self,
@@ -254,79 +423,116 @@ class CodexExecutor:
         print(f"   {cmd_str}")
         print()
 
-        try:
-            # Execute command
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=300  # 5 minute timeout
-            )
-
-            success = result.returncode == 0
-
-            if success:
-                print("✅ Codex execution successful")
-            else:
-                print(f"❌ Codex execution failed (exit code {result.returncode})")
-
-            return CodexResult(
-                success=success,
-                stdout=result.stdout,
-                stderr=result.stderr,
-                return_code=result.returncode,
-                command=cmd_str,
-                model_used=model
-            )
-
-        except subprocess.TimeoutExpired:
-            error_msg = "Codex command timed out after 5 minutes"
+        def failed(error_msg: str, stdout: str = "") -> CodexResult:
             print(f"❌ {error_msg}")
-
             return CodexResult(
                 success=False,
-                stdout="",
+                stdout=stdout,
                 stderr=error_msg,
                 return_code=-1,
                 command=cmd_str,
                 model_used=model
             )
 
+        try:
+            process = subprocess.Popen(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                # Own process group, so a kill also reaches Codex's children
+                start_new_session=(os.name == "posix")
+            )
         except FileNotFoundError:
-            error_msg = """
-Codex CLI not found!
-
-Please ensure:
-1. Codex CLI is installed
-2. Codex is in your PATH
-3. Try: which codex
+            return failed(CODEX_NOT_FOUND_MESSAGE)
+        except Exception as e:
+            return failed(f"Unexpected error: {str(e)}")
+
+        # Stream both pipes line by line instead of buffering them whole
+        stdout_tail = OutputTail(self.output_limit)
+        stderr_tail = OutputTail(self.output_limit)
+        callback_lock = threading.Lock()
+        readers = [
+            threading.Thread(
+                target=self._pump_output,
+                args=(process.stdout, "stdout", stdout_tail, callback_lock),
+                daemon=True
+            ),
+            threading.Thread(
+                target=self._pump_output,
+                args=(process.stderr, "stderr", stderr_tail, callback_lock),
+                daemon=True
+            )
+        ]
+        for reader in readers:
+            reader.start()
 
-Installation:
-  Visit: https://github.com/openai/codex
-"""
-            print(f"❌ {error_msg}")
+        deadline = time.monotonic() + self.timeout
+        try:
+            return_code = process.wait(timeout=self.timeout)
+            for reader in readers:
+                # Children that inherited the pipes may keep them open
+                reader.join(max(0, deadline - time.monotonic()))
+                if reader.is_alive():
+                    raise subprocess.TimeoutExpired(cmd, self.timeout)
 
-            return CodexResult(
-                success=False,
-                stdout="",
-                stderr=error_msg,
-                return_code=-1,
-                command=cmd_str,
-                model_used=model
+        except subprocess.TimeoutExpired:
+            _kill_process_group(process)
+            process.wait()
+            for reader in readers:
+                reader.join()
+            return failed(
+                f"Codex command timed out after {_describe_timeout(self.timeout)}",
+                stdout=stdout_tail.getvalue()
             )
 
-        except Exception as e:
-            error_msg = f"Unexpected error: {str(e)}"
-            print(f"❌ {error_msg}")
+        except BaseException:
+            # Codex runs in its own session and does not see Ctrl+C itself
+            _kill_process_group(process)
+            raise
 
-            return CodexResult(
-                success=False,
-                stdout="",
-                stderr=error_msg,
-                return_code=-1,
-                command=cmd_str,
-                model_used=model
-            )
+        success = return_code == 0
+
+        if success:
+            print("✅ Codex execution successful")
+        else:
+            print(f"❌ Codex execution failed (exit code {return_code})")
+
+        return CodexResult(
+            success=success,
+            stdout=stdout_tail.getvalue(),
+            stderr=stderr_tail.getvalue(),
+            return_code=return_code,
+            command=cmd_str,
+            model_used=model,
+            truncated=stdout_tail.truncated or stderr_tail.truncated
+        )
+
+    def _pump_output(self, pipe, stream: str, tail: OutputTail, callback_lock) -> None:
+        """
+        Read one pipe line by line into its tail buffer (reader thread).
+
+        Args:
+            pipe: Binary pipe from the Codex process
+            stream: "stdout" or "stderr"
+            tail: Buffer receiving the lines
+            callback_lock: Serializes on_output calls across both readers
+        """
+        on_output = self.on_output
+
+        with pipe:
+            for raw in iter(lambda: pipe.readline(STREAM_LINE_LIMIT), b""):
+                line = OutputLine(stream, raw.decode("utf-8", errors="replace"))
+                tail.append(line.text)
+
+                if on_output is None:
+                    continue
+                try:
+                    with callback_lock:
+                        on_output(line)
+                except Exception as e:
+                    # Keep draining the pipe so Codex never blocks on a full buffer
+                    print(f"⚠️  Output callback failed ({stream}): {e}")
+                    on_output = None
 
     def generate_command_string(
         self,
@@ -370,6 +576,465 @@ Installation:
         return cmd
 
 
+class AsyncCodexExecutor:
+    """
+    Run many `codex exec` jobs concurrently on an asyncio event loop.
+
+    Jobs wait on a semaphore, so at most ``max_concurrency`` Codex processes
+    run at once; the rest stay queued. Each job has its own timeout, after
+    which its process is killed. Cancelling a job's task (or calling
+    ``cancel_all``) kills its process as well.
+
+    Output is read line by line as it is produced: pass ``on_output`` to see
+    it live, or iterate ``stream(job)``. Results keep only the last
+    ``output_limit`` characters of each stream.
+
+    Example:
+        executor = AsyncCodexExecutor(max_concurrency=4)
+        async for result in executor.submit_many(prompts):
+            print(result.job_id, result.success)
+    """
+
+    def __init__(
+        self,
+        working_dir: Optional[str] = None,
+        max_concurrency: int = 4,
+        timeout: float = DEFAULT_TIMEOUT,
+        output_limit: int = DEFAULT_OUTPUT_LIMIT
+    ):
+        """
+        Initialize async Codex executor.
+
+        Args:
+            working_dir: Optional working directory for Codex commands
+            max_concurrency: Maximum number of Codex processes at once (default: 4)
+            timeout: Default per-job timeout in seconds (default: 300)
+            output_limit: Characters of stdout/stderr kept in CodexResult (the tail)
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        self.working_dir = working_dir
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.output_limit = output_limit
+
+        self._commands = CodexExecutor(working_dir=working_dir, timeout=timeout)
+        self._job_ids = itertools.count(1)
+        self._tasks: Set[asyncio.Task] = set()
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._semaphore_loop = None
+
+    async def run(
+        self,
+        job: Union[str, CodexJob],
+        on_output: Optional[OutputCallback] = None
+    ) -> CodexResult:
+        """
+        Run one job, waiting for a free slot first.
+
+        Args:
+            job: CodexJob, or a prompt for a read-only analysis job
+            on_output: Optional callback receiving each OutputLine; if it
+                returns an awaitable, reading pauses until it completes
+
+        Returns:
+            CodexResult with execution details (never raises for Codex failures)
+        """
+        job = self._as_job(job)
+        cmd = self._commands.build_exec_command(
+            prompt=job.prompt,
+            model=job.model,
+            sandbox=job.sandbox,
+            reasoning=job.reasoning,
+            enable_search=job.enable_search,
+            full_auto=job.full_auto
+        )
+        timeout = job.timeout if job.timeout is not None else self.timeout
+
+        async with self._get_semaphore():
+            return await self._run_process(cmd, job, timeout, on_output)
+
+    def submit(
+        self,
+        job: Union[str, CodexJob],
+        on_output: Optional[OutputCallback] = None
+    ) -> asyncio.Task:
+        """
+        Queue a job on the running event loop.
+
+        Args:
+            job: CodexJob, or a prompt for a read-only analysis job
+            on_output: Optional callback receiving each OutputLine
+
+        Returns:
+            Task resolving to the job's CodexResult (cancel it to kill the job)
+        """
+        task = asyncio.ensure_future(self.run(job, on_output))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def submit_many(
+        self,
+        prompts: Iterable[Union[str, CodexJob]],
+        on_output: Optional[OutputCallback] = None
+    ) -> AsyncIterator[CodexResult]:
+        """
+        Queue all jobs and yield their results as they complete.
+
+        Results arrive in completion order; use ``CodexResult.job_id`` to match
+        them to jobs. Closing the generator early (``await gen.aclose()``, or
+        breaking out of the loop and letting it be finalized) cancels and
+        kills the jobs that have not finished yet.
+
+        Args:
+            prompts: Prompts and/or CodexJob instances
+            on_output: Optional callback receiving every job's OutputLines
+                (``OutputLine.job_id`` tells them apart)
+
+        Yields:
+            CodexResult for each job
+        """
+        tasks = [self.submit(prompt, on_output) for prompt in prompts]
+
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def stream(self, job: Union[str, CodexJob]) -> "CodexStream":
+        """
+        Run a job and iterate over its output lines as they are printed.
+
+        Example:
+            output = executor.stream("Summarize the repository layout")
+            async for line in output:
+                print(line.text, end="")
+            print(output.result.return_code)
+
+        Args:
+            job: CodexJob, or a prompt for a read-only analysis job
+
+        Returns:
+            CodexStream (async iterator of OutputLine; ``result`` once exhausted)
+        """
+        return CodexStream(self, self._as_job(job))
+
+    def run_many(
+        self,
+        prompts: Iterable[Union[str, CodexJob]],
+        on_output: Optional[OutputCallback] = None
+    ) -> List[CodexResult]:
+        """
+        Blocking helper: run all jobs concurrently, results in input order.
+
+        Args:
+            prompts: Prompts and/or CodexJob instances
+            on_output: Optional callback receiving every job's OutputLines
+
+        Returns:
+            List of CodexResult, one per job
+        """
+        jobs = [self._as_job(prompt) for prompt in prompts]
+
+        async def run_all():
+            return await asyncio.gather(*(self.run(job, on_output) for job in jobs))
+
+        return list(asyncio.run(run_all()))
+
+    def cancel_all(self) -> int:
+        """
+        Cancel every queued or running job.
+
+        Returns:
+            Number of jobs cancelled
+        """
+        pending = [task for task in self._tasks if not task.done()]
+        for task in pending:
+            task.cancel()
+        return len(pending)
+
+    def _as_job(self, job: Union[str, CodexJob]) -> CodexJob:
+        """Wrap a bare prompt in a read-only analysis job and assign a job id."""
+        if isinstance(job, str):
+            job = CodexJob(prompt=job)
+        if job.job_id is None:
+            job.job_id = f"job-{next(self._job_ids)}"
+        return job
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Concurrency semaphore for the running event loop."""
+        loop = asyncio.get_event_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphore_loop = loop
+        return self._semaphore
+
+    async def _run_process(
+        self,
+        cmd: List[str],
+        job: CodexJob,
+        timeout: float,
+        on_output: Optional[OutputCallback] = None
+    ) -> CodexResult:
+        """
+        Spawn a Codex process and stream its output.
+
+        Args:
+            cmd: Command list
+            job: Job being run
+            timeout: Seconds before the process is killed
+            on_output: Optional callback receiving each OutputLine
+
+        Returns:
+            CodexResult with execution details
+        """
+        cmd_str = " ".join(cmd)
+        started = time.monotonic()
+        stdout_tail = OutputTail(self.output_limit)
+        stderr_tail = OutputTail(self.output_limit)
+
+        def failed(error_msg: str) -> CodexResult:
+            print(f"❌ [{job.job_id}] {error_msg}")
+            return CodexResult(
+                success=False,
+                stdout=stdout_tail.getvalue(),
+                stderr=error_msg,
+                return_code=-1,
+                command=cmd_str,
+                model_used=job.model.value,
+                job_id=job.job_id,
+                duration=time.monotonic() - started,
+                truncated=stdout_tail.truncated
+            )
+
+        print(f"🚀 [{job.job_id}] {cmd_str}")
+
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                # Own process group, so a kill also reaches Codex's children
+                start_new_session=(os.name == "posix")
+            )
+        except FileNotFoundError:
+            return failed(CODEX_NOT_FOUND_MESSAGE)
+        except Exception as e:
+            return failed(f"Unexpected error: {str(e)}")
+
+        async def collect() -> int:
+            await asyncio.gather(
+                self._pump_output(process.stdout, "stdout", stdout_tail, job.job_id, on_output),
+                self._pump_output(process.stderr, "stderr", stderr_tail, job.job_id, on_output)
+            )
+            return await process.wait()
+
+        try:
+            return_code = await asyncio.wait_for(collect(), timeout)
+        except asyncio.TimeoutError:
+            await self._kill(process)
+            return failed(f"Codex command timed out after {_describe_timeout(timeout)}")
+        except asyncio.CancelledError:
+            print(f"⚠️  [{job.job_id}] Cancelled")
+            await self._kill(process)
+            raise
+
+        duration = time.monotonic() - started
+        success = return_code == 0
+
+        if success:
+            print(f"✅ [{job.job_id}] Codex execution successful ({duration:.1f}s)")
+        else:
+            print(f"❌ [{job.job_id}] Codex execution failed (exit code {return_code})")
+
+        return CodexResult(
+            success=success,
+            stdout=stdout_tail.getvalue(),
+            stderr=stderr_tail.getvalue(),
+            return_code=return_code,
+            command=cmd_str,
+            model_used=job.model.value,
+            job_id=job.job_id,
+            duration=duration,
+            truncated=stdout_tail.truncated or stderr_tail.truncated
+        )
+
+    @staticmethod
+    async def _pump_output(
+        reader: asyncio.StreamReader,
+        stream: str,
+        tail: OutputTail,
+        job_id: str,
+        on_output: Optional[OutputCallback]
+    ) -> None:
+        """
+        Split one pipe into lines, feeding its tail buffer and the callback.
+
+        Args:
+            reader: Pipe from the Codex process
+            stream: "stdout" or "stderr"
+            tail: Buffer receiving the lines
+            job_id: Job the output belongs to
+            on_output: Optional callback receiving each OutputLine
+        """
+        pending = b""
+        eof = False
+
+        while not eof:
+            chunk = await reader.read(STREAM_LINE_LIMIT)
+            eof = not chunk
+
+            pieces = (pending + chunk).split(b"\n")
+            pending = pieces.pop()
+            lines = [piece + b"\n" for piece in pieces]
+            if pending and (eof or len(pending) >= STREAM_LINE_LIMIT):
+                lines.append(pending)
+                pending = b""
+
+            for raw in lines:
+                line = OutputLine(stream, raw.decode("utf-8", errors="replace"), job_id)
+                tail.append(line.text)
+
+                if on_output is None:
+                    continue
+                try:
+                    delivered = on_output(line)
+                    if inspect.isawaitable(delivered):
+                        await delivered
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    # Keep draining the pipe so Codex never blocks on a full buffer
+                    print(f"⚠️  [{job_id}] Output callback failed ({stream}): {e}")
+                    on_output = None
+
+    @staticmethod
+    async def _kill(process) -> None:
+        """Kill a Codex process (and its process group) and reap it."""
+        _kill_process_group(process)
+        await process.wait()
+
+
+class CodexStream:
+    """
+    Async iterator over the output lines of one running Codex job.
+
+    The job is queued on the first iteration. Lines are handed over through
+    a bounded queue, so a slow consumer pauses reading instead of buffering
+    the whole output. Once iteration ends, ``result`` holds the job's
+    CodexResult. Call ``aclose()`` to stop early (kills the job).
+    """
+
+    def __init__(self, executor: AsyncCodexExecutor, job: CodexJob, max_pending: int = 1000):
+        self.job = job
+        self.result: Optional[CodexResult] = None
+        self._executor = executor
+        self._max_pending = max_pending
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def __aiter__(self) -> "CodexStream":
+        return self
+
+    async def __anext__(self) -> OutputLine:
+        if self._task is None:
+            self._queue = asyncio.Queue(maxsize=self._max_pending)
+            self._task = self._executor.submit(self.job, on_output=self._queue.put)
+
+        while True:
+            if not self._queue.empty():
+                return self._queue.get_nowait()
+
+            if self._task.done():
+                # Every line is queued before the job finishes
+                self.result = self._task.result()
+                raise StopAsyncIteration
+
+            getter = asyncio.ensure_future(self._queue.get())
+            try:
+                await asyncio.wait([getter, self._task], return_when=asyncio.FIRST_COMPLETED)
+            finally:
+                if not getter.done():
+                    getter.cancel()
+
+            if getter.done() and not getter.cancelled():
+                return getter.result()
+
+    async def aclose(self) -> None:
+        """Stop iterating and kill the job if it is still running."""
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+
+
+def print_output_line(line: OutputLine) -> None:
+    """Echo a streamed output line to the matching console stream (--stream)."""
+    target = sys.stderr if line.stream == "stderr" else sys.stdout
+    prefix = f"[{line.job_id}] " if line.job_id else ""
+    text = line.text if line.text.endswith("\n") else line.text + "\n"
+    target.write(prefix + text)
+    target.flush()
+
+
+def run_batch(args, model: CodexModel) -> None:
+    """Run every prompt in --prompts-file concurrently (batch action)."""
+    if not args.prompts_file:
+        print("❌ --prompts-file is required for batch")
+        return
+
+    with open(args.prompts_file, "r", encoding="utf-8") as f:
+        prompts = [line.strip() for line in f if line.strip()]
+
+    jobs = [CodexJob(prompt=prompt, model=model) for prompt in prompts]
+
+    executor = AsyncCodexExecutor(
+        working_dir=args.working_dir,
+        max_concurrency=args.concurrency,
+        timeout=args.timeout,
+        output_limit=args.output_limit
+    )
+
+    if args.dry_run:
+        for job in jobs:
+            print(" ".join(executor._commands.build_exec_command(
+                prompt=job.prompt,
+                model=job.model,
+                sandbox=job.sandbox,
+                reasoning=job.reasoning
+            )))
+        return
+
+    async def run_all():
+        results = []
+        on_output = print_output_line if args.stream else None
+        async for result in executor.submit_many(jobs, on_output=on_output):
+            results.append(result)
+        return results
+
+    started = time.monotonic()
+    results = asyncio.run(run_all())
+    failed = [r for r in results if not r.success]
+
+    print("\n" + "=" * 64)
+    print("BATCH RESULT")
+    print("=" * 64)
+    print(f"Jobs: {len(results)} ({len(results) - len(failed)} succeeded, {len(failed)} failed)")
+    print(f"Elapsed: {time.monotonic() - started:.1f}s (concurrency {args.concurrency})")
+
+    for result in sorted(results, key=lambda r: int(r.job_id.split("-")[-1])):
+        status = "✅" if result.success else "❌"
+        print(f"\n{status} {result.job_id} (exit code {result.return_code})")
+        output = result.stdout if result.success else result.stderr
+        if output and not args.stream:
+            print(output.rstrip())
+
+
 def main():
     """Demo usage of CodexExecutor."""
     import argparse
@@ -377,7 +1042,7 @@ def main():
     parser = argparse.ArgumentParser(description="Codex CLI Execution Helper")
     parser.add_argument(
         "action",
-        choices=["analysis", "edit", "search", "resume"],
+        choices=["analysis", "edit", "search", "resume", "batch"],
         help="Action to perform"
     )
     parser.add_argument(
@@ -394,6 +1059,33 @@ def main():
         "--working-dir",
         help="Working directory"
     )
+    parser.add_argument(
+        "--prompts-file",
+        help="File with one prompt per line (required for batch)"
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=4,
+        help="Maximum concurrent Codex processes for batch (default: 4)"
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=DEFAULT_TIMEOUT,
+        help="Per-command timeout in seconds (default: 300)"
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Print Codex output line by line as it is produced"
+    )
+    parser.add_argument(
+        "--output-limit",
+        type=int,
+        default=DEFAULT_OUTPUT_LIMIT,
+        help="Characters of stdout/stderr kept in the result (default: 1000000)"
+    )
     parser.add_argument(
         "--dry-run",
         action="store_true",
@@ -402,7 +1094,12 @@ def main():
 
     args = parser.parse_args()
 
-    executor = CodexExecutor(working_dir=args.working_dir)
+    executor = CodexExecutor(
+        working_dir=args.working_dir,
+        timeout=args.timeout,
+        on_output=print_output_line if args.stream else None,
+        output_limit=args.output_limit
+    )
 
     # Map string to enum
     model_map = {
@@ -411,6 +1108,10 @@ def main():
     }
     model = model_map[args.model]
 
+    if args.action == "batch":
+        run_batch(args, model)
+        return
+
     if args.action in ["analysis", "edit", "search"] and not args.prompt:
         print("❌ --prompt is required for this action")
         return
@@ -465,6 +1166,13 @@ def main():
     print(f"Model: {result.model_used}")
     print(f"Command: {result.command}")
 
+    if result.truncated:
+        print(f"Output: last {args.output_limit} characters shown")
+
+    if args.stream:
+        # Already printed line by line
+        return
+
     if result.stdout:
         print("\nStdout:")
         print(result.stdout)
@@ -70,6 +70,7 @@ cp "${SKILL_DIR}/bridge.py" "${PACKAGE_ROOT}/"
 cp "${SKILL_DIR}/safety_mechanism.py" "${PACKAGE_ROOT}/"
 cp "${SKILL_DIR}/claude_parser.py" "${PACKAGE_ROOT}/"
 cp "${SKILL_DIR}/project_analyzer.py" "${PACKAGE_ROOT}/"
+cp "${SKILL_DIR}/bridge_cache.py" "${PACKAGE_ROOT}/"
 cp "${SKILL_DIR}/agents_md_generator.py" "${PACKAGE_ROOT}/"
 cp "${SKILL_DIR}/skill_documenter.py" "${PACKAGE_ROOT}/"
 cp "${SKILL_DIR}/codex_executor.py" "${PACKAGE_ROOT}/"
@@ -7,6 +7,9 @@ Analyzes Claude Code project structure:
 - Generate project metadata
 - Build reference map
 - Categorize skills by type
+
+With a BridgeCache, unchanged skills, agents, CLAUDE.md sections and the
+documentation file list are reused from .claude/.bridge-cache.
 """
 
 import os
@@ -15,6 +18,7 @@ from typing import Dict, List, Optional, Any
 from pathlib import Path
 from dataclasses import dataclass, field, asdict
 
+from bridge_cache import BridgeCache
 from claude_parser import ClaudeProjectParser, SkillInfo, AgentInfo
 
 
@@ -47,15 +51,17 @@ class ProjectAnalyzer:
     Combines parsing with analysis to build complete project understanding.
     """
 
-    def __init__(self, project_root: str):
+    def __init__(self, project_root: str, cache: Optional[BridgeCache] = None):
         """
         Initialize analyzer.
 
         Args:
             project_root: Path to project root directory
+            cache: Optional BridgeCache (saved at the end of analyze())
         """
         self.project_root = Path(project_root).resolve()
-        self.parser = ClaudeProjectParser(str(self.project_root))
+        self.cache = cache
+        self.parser = ClaudeProjectParser(str(self.project_root), cache=cache)
 
         # Analysis results
         self.metadata: Optional[ProjectMetadata] = None
@@ -88,6 +94,9 @@ class ProjectAnalyzer:
         print(f"   📁 Type: {self.metadata.type}")
         print(f"   📦 Skills: {self.metadata.skill_count} ({len(functional_skills)} functional, {len(prompt_skills)} prompt-only)")
         print(f"   🤖 Agents: {self.metadata.agent_count}")
+        if self.cache is not None:
+            self.cache.save()
+            print(f"   ⚡ Cache: {self.cache.hits} reused, {self.cache.misses} parsed")
         print()
 
         return {
@@ -193,9 +202,7 @@ class ProjectAnalyzer:
         # Documentation files
         docs_dir = self.project_root / "documentation"
         if docs_dir.exists():
-            for doc_file in docs_dir.rglob("*.md"):
-                rel_path = doc_file.relative_to(self.project_root)
-                documentation_files.append(str(rel_path))
+            documentation_files = self._find_documentation_files(docs_dir)
 
         return ProjectStructure(
             folders=folders,
@@ -203,6 +210,56 @@ class ProjectAnalyzer:
             documentation_files=documentation_files
         )
 
+    def _find_documentation_files(self, docs_dir: Path) -> List[str]:
+        """
+        List Markdown files under the documentation folder.
+
+        The cached list is reused while no directory in the tree changed
+        (adding, removing or renaming an entry updates its parent's mtime).
+
+        Args:
+            docs_dir: Documentation directory
+
+        Returns:
+            Paths relative to the project root, in rglob order
+        """
+        key = str(docs_dir)
+
+        if self.cache is not None:
+            cached = self.cache.get("documentation", key)
+            if cached is not None:
+                return cached
+            deps = self._directory_signatures(docs_dir)
+
+        documentation_files = [
+            str(doc_file.relative_to(self.project_root))
+            for doc_file in docs_dir.rglob("*.md")
+        ]
+
+        if self.cache is not None:
+            self.cache.put("documentation", key, deps, documentation_files)
+
+        return documentation_files
+
+    def _directory_signatures(self, root: Path) -> Dict[str, Optional[List[int]]]:
+        """Signatures of a directory and all its subdirectories (symlinks not followed)."""
+        signatures = {}
+        stack = [str(root)]
+
+        while stack:
+            directory = stack.pop()
+            signatures[directory] = self.cache.signature(directory)
+            try:
+                with os.scandir(directory) as entries:
+                    stack.extend(
+                        entry.path for entry in entries
+                        if entry.is_dir(follow_symlinks=False)
+                    )
+            except OSError:
+                continue
+
+        return signatures
+
     def get_skill_by_name(self, name: str) -> Optional[SkillInfo]:
         """
         Find skill by name.
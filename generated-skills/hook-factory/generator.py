@@ -1,7 +1,9 @@
 """
 Hook Generator - Template substitution and hook creation for Claude Code hooks.
 
-Generates production-ready hook configurations from templates.
+Generates production-ready hook configurations from templates. Templates come
+from the process-wide catalog in template_catalog.py, so constructing a
+generator does not re-read templates.json.
 """
 
 import json
@@ -11,6 +13,8 @@ from typing import Dict, List, Optional
 from dataclasses import dataclass
 from datetime import datetime
 
+from template_catalog import CompiledTemplate, SubstitutionPlan, TemplateCatalog, get_catalog
+
 
 @dataclass
 class HookRequirements:
@@ -56,17 +60,22 @@ class HookGenerator:
             templates_path = os.path.join(script_dir, 'templates.json')
 
         self.templates_path = templates_path
-        self.templates = self._load_templates()
+        self._catalog = get_catalog(templates_path)
+
+    @property
+    def catalog(self) -> TemplateCatalog:
+        """Template catalog, reloaded only if templates.json changed on disk."""
+        self._catalog = get_catalog(self.templates_path)
+        return self._catalog
+
+    @property
+    def templates(self) -> Dict:
+        """Raw template definitions keyed by template name."""
+        return self.catalog.templates
 
     def _load_templates(self) -> Dict:
-        """Load hook templates from JSON file."""
-        try:
-            with open(self.templates_path, 'r') as f:
-                return json.load(f)
-        except FileNotFoundError:
-            raise FileNotFoundError(f"Templates file not found: {self.templates_path}")
-        except json.JSONDecodeError as e:
-            raise ValueError(f"Invalid JSON in templates file: {str(e)}")
+        """Load hook templates from JSON file (served from the catalog cache)."""
+        return self.catalog.templates
 
     def list_templates(self) -> List[Dict]:
         """List available templates with metadata."""
@@ -99,10 +108,11 @@ class HookGenerator:
             ValueError: If template not found or requirements invalid
         """
         # Validate template exists
-        if requirements.template_name not in self.templates:
+        templates = self.catalog.templates
+        if requirements.template_name not in templates:
             raise ValueError(f"Template not found: {requirements.template_name}")
 
-        template = self.templates[requirements.template_name]
+        template = templates[requirements.template_name]
 
         # Generate hook name if not provided
         if not requirements.hook_name:
@@ -160,29 +170,12 @@ class HookGenerator:
         Returns:
             Substituted hook configuration
         """
-        template_config = template['template']
-        variables = template.get('variables', {})
-
-        # Start with template structure
-        hook_config = {
-            'matcher': template_config.get('matcher', {}),
-            'hooks': []
-        }
-
-        # Process each hook in template
-        for hook in template_config.get('hooks', []):
-            command = hook.get('command', '')
+        compiled = self._catalog.get(requirements.template_name)
+        if compiled is None or compiled.raw is not template:
+            # Template not from the catalog (e.g. built by a caller): compile ad hoc
+            compiled = CompiledTemplate.compile(requirements.template_name, template)
 
-            # Substitute variables
-            command = self._substitute_variables(command, variables, requirements)
-
-            hook_config['hooks'].append({
-                'type': hook.get('type', 'command'),
-                'command': command,
-                'timeout': hook.get('timeout', 60)
-            })
-
-        return hook_config
+        return compiled.render(requirements.language)
 
     def _substitute_variables(self, command: str, variables: Dict, requirements: HookRequirements) -> str:
         """
@@ -196,57 +189,7 @@ class HookGenerator:
         Returns:
             Substituted command string
         """
-        # Find all {{VARIABLE}} placeholders
-        placeholders = re.findall(r'\{\{(\w+)\}\}', command)
-
-        for placeholder in placeholders:
-            if placeholder not in variables:
-                continue
-
-            var_def = variables[placeholder]
-
-            # Get value based on variable type
-            if 'options' in var_def:
-                # Language-specific option
-                value = self._get_language_option(var_def, requirements.language)
-            elif 'patterns' in var_def:
-                # Language-specific pattern
-                value = self._get_language_pattern(var_def, requirements.language)
-            else:
-                # Default value or from requirements
-                value = var_def.get('default', '')
-
-            # Replace placeholder
-            command = command.replace(f'{{{{{placeholder}}}}}', str(value))
-
-        return command
-
-    def _get_language_option(self, var_def: Dict, language: str) -> str:
-        """Get language-specific option value."""
-        options = var_def.get('options', {})
-
-        if language in options:
-            value = options[language]
-            # If value is a list, convert to JSON array string
-            if isinstance(value, list):
-                return json.dumps(value)
-            return value
-
-        # Fallback to default
-        return var_def.get('default', '')
-
-    def _get_language_pattern(self, var_def: Dict, language: str) -> str:
-        """Get language-specific pattern."""
-        patterns = var_def.get('patterns', {})
-
-        if language in patterns:
-            return patterns[language]
-
-        # Fallback to first pattern
-        if patterns:
-            return list(patterns.values())[0]
-
-        return ''
+        return SubstitutionPlan(command, variables).render(requirements.language)
 
     def _generate_hook_name(self, template_name: str, language: str) -> str:
         """
@@ -6,15 +6,33 @@ This is the main entry point for the hook-factory skill.
 """
 
 import os
+import re
 import sys
 import json
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 
 from generator import HookGenerator, HookRequirements, HookPackage, generate_hook_from_request
 from validator import HookValidator, ValidationResult
 
 
+# Per-run stamps that change on every generation; ignored when deciding whether
+# a package on disk already matches the freshly rendered content.
+VOLATILE_CONTENT_PATTERNS = (
+    re.compile(r'"generated_at": "[^"]*"'),
+    re.compile(r'(\*\*Generated by hook-factory\*\* \| )\d{4}-\d{2}-\d{2}'),
+)
+
+
+def content_fingerprint(text: str) -> str:
+    """SHA-256 of rendered file content with generation timestamps masked."""
+    for pattern in VOLATILE_CONTENT_PATTERNS:
+        text = pattern.sub(lambda m: m.group(1) if m.groups() else '', text)
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
 class HookFactory:
     """Main orchestrator for hook generation."""
 
@@ -159,31 +177,264 @@ class HookFactory:
 
         return result
 
-    def _save_package(self, package: HookPackage) -> dict:
+    def create_hooks_from_manifest(self, manifest_path: str,
+                                   max_workers: Optional[int] = None) -> Dict[str, List[dict]]:
         """
-        Save hook package to disk.
+        Generate every hook listed in a batch manifest.
+
+        Packages are generated and validated concurrently (one shared
+        HookValidator and template catalog), then written through a thread
+        pool. A package whose rendered files already match what is on disk,
+        ignoring generation timestamps, is left untouched.
+
+        Manifest format (JSON)::
+
+            {"hooks": [
+                {"template": "post_tool_use_format",
+                 "languages": ["python", "go"]},
+                {"template": "post_tool_use_git_add", "language": "all",
+                 "hook_name": "git-add-all", "options": {}}
+            ]}
+
+        A bare list of entries is accepted too. ``languages`` expands one entry
+        into one package per language.
 
         Args:
-            package: HookPackage to save
+            manifest_path: Path to the manifest JSON file
+            max_workers: Thread pool size (default: ThreadPoolExecutor default)
 
         Returns:
-            Dictionary with file paths
+            Dict with 'written', 'unchanged' and 'failed' lists of results
+
+        Raises:
+            ValueError: If the manifest cannot be read or is malformed
+        """
+        requirements_list = self._load_manifest(manifest_path)
+
+        print(f"🏭 Hook Factory: Batch generating {len(requirements_list)} hook(s)...")
+        print(f"   Manifest: {manifest_path}\n")
+
+        summary = {'written': [], 'unchanged': [], 'failed': []}
+
+        # Package-level tasks (generate, then write) run on package_pool; the
+        # individual file writes fan out to file_pool so a package task never
+        # waits on its own pool.
+        with ThreadPoolExecutor(max_workers=max_workers) as package_pool, \
+                ThreadPoolExecutor(max_workers=max_workers) as file_pool:
+            built = list(package_pool.map(self._build_batch_package, requirements_list))
+
+            # Reject duplicate names before anything touches the disk
+            seen = {}
+            for index, (requirements, package, error) in enumerate(built):
+                if package is None:
+                    continue
+                if package.hook_name in seen:
+                    built[index] = (requirements, None,
+                                    f"Duplicate hook name in manifest: {package.hook_name}")
+                else:
+                    seen[package.hook_name] = index
+
+            writes = []
+            for requirements, package, error in built:
+                if package is None:
+                    writes.append((requirements, None, error))
+                else:
+                    writes.append((requirements, package,
+                                   package_pool.submit(self._write_batch_package, package, file_pool)))
+
+            for requirements, package, outcome in writes:
+                label = f"{requirements.template_name}/{requirements.language}"
+                if package is None:
+                    print(f"❌ {label}: {outcome}")
+                    summary['failed'].append({'template': requirements.template_name,
+                                              'language': requirements.language,
+                                              'error': outcome})
+                    continue
+
+                try:
+                    result, changed = outcome.result()
+                except (OSError, ValueError) as e:
+                    print(f"❌ {package.hook_name}: {str(e)}")
+                    summary['failed'].append({'template': requirements.template_name,
+                                              'language': requirements.language,
+                                              'hook_name': package.hook_name,
+                                              'error': str(e)})
+                    continue
+
+                if changed:
+                    print(f"✅ {package.hook_name} → {result['output_dir']}")
+                    summary['written'].append(result)
+                else:
+                    print(f"⏭️  {package.hook_name} (unchanged)")
+                    summary['unchanged'].append(result)
+
+        print(f"\n📦 Batch complete: {len(summary['written'])} written, "
+              f"{len(summary['unchanged'])} unchanged, {len(summary['failed'])} failed")
+
+        return summary
+
+    def _load_manifest(self, manifest_path: str) -> List[HookRequirements]:
+        """
+        Read a batch manifest and expand it into hook requirements.
+
+        Args:
+            manifest_path: Path to the manifest JSON file
+
+        Returns:
+            List of HookRequirements in manifest order
+
+        Raises:
+            ValueError: If the manifest cannot be read or is malformed
+        """
+        try:
+            with open(manifest_path, 'r') as f:
+                manifest = json.load(f)
+        except FileNotFoundError:
+            raise ValueError(f"Manifest file not found: {manifest_path}")
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON in manifest: {str(e)}")
+
+        entries = manifest.get('hooks') if isinstance(manifest, dict) else manifest
+        if not isinstance(entries, list):
+            raise ValueError("Manifest must be a list of entries or an object with a 'hooks' list")
+
+        requirements_list = []
+        for position, entry in enumerate(entries, 1):
+            if not isinstance(entry, dict) or not entry.get('template'):
+                raise ValueError(f"Manifest entry {position} must be an object with a 'template' key")
+
+            languages = entry.get('languages') or [entry.get('language', 'python')]
+            if not isinstance(languages, list):
+                raise ValueError(f"Manifest entry {position}: 'languages' must be a list")
+
+            options = entry.get('options') or {}
+            if not isinstance(options, dict):
+                raise ValueError(f"Manifest entry {position}: 'options' must be an object")
+
+            hook_name = entry.get('hook_name', '')
+            for language in languages:
+                # An explicit name shared by several languages gets the language
+                # appended, as generated names do, so the packages stay distinct
+                requirements_list.append(HookRequirements(
+                    template_name=entry['template'],
+                    language=language,
+                    hook_name=f"{hook_name}-{language}" if hook_name and len(languages) > 1 else hook_name,
+                    additional_options=dict(options)
+                ))
+
+        return requirements_list
+
+    def _build_batch_package(self, requirements: HookRequirements
+                             ) -> Tuple[HookRequirements, Optional[HookPackage], Optional[str]]:
+        """
+        Generate and validate one manifest entry (runs on a worker thread).
+
+        Returns:
+            (requirements, package, None) on success, or
+            (requirements, None, error message) on failure
+        """
+        try:
+            package = self.generator.generate_hook(requirements)
+            self._sanitize_hook_name(package.hook_name)
+        except ValueError as e:
+            return requirements, None, str(e)
+
+        validation = self.validator.validate_hook(package.hook_config)
+        if not validation.is_valid:
+            return requirements, None, "validation failed: " + "; ".join(
+                error.message for error in validation.errors
+            )
+
+        return requirements, package, None
+
+    def _write_batch_package(self, package: HookPackage,
+                             file_pool: ThreadPoolExecutor) -> Tuple[dict, bool]:
+        """
+        Write a package's files unless their content is unchanged on disk.
+
+        Args:
+            package: Validated HookPackage
+            file_pool: Pool used for the per-file writes
+
+        Returns:
+            (result dict, True if any file was written)
+        """
+        output_dir = self._resolve_output_dir(package.hook_name)
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        contents = {
+            'hook.json': package.hook_json,
+            'README.md': package.readme_md,
+        }
+        pending = {
+            name: file_pool.submit(self._write_if_changed, output_dir / name, text)
+            for name, text in contents.items()
+        }
+        changed = [future.result() for future in pending.values()]
+
+        result = {
+            'output_dir': str(output_dir),
+            'hook_name': package.hook_name,
+            'files': {name: str(output_dir / name) for name in contents}
+        }
+        return result, any(changed)
+
+    @staticmethod
+    def _write_if_changed(path: Path, text: str) -> bool:
+        """Write text to path unless the file already holds the same content."""
+        try:
+            existing = path.read_text(encoding='utf-8')
+        except (FileNotFoundError, UnicodeDecodeError):
+            existing = None
+
+        if existing is not None and content_fingerprint(existing) == content_fingerprint(text):
+            return False
+
+        with open(path, 'w') as f:
+            f.write(text)
+        return True
+
+    def _resolve_output_dir(self, hook_name: str) -> Path:
+        """
+        Resolve the output directory for a hook, rejecting path traversal.
+
+        Args:
+            hook_name: Hook name from the generated package
+
+        Returns:
+            Resolved directory path inside output_base
+
+        Raises:
+            ValueError: If the hook name is invalid or escapes output_base
         """
         # Validate hook_name for path traversal
-        hook_name = self._sanitize_hook_name(package.hook_name)
+        safe_name = self._sanitize_hook_name(hook_name)
 
         # Create output directory
-        output_dir = self.output_base / hook_name
+        output_dir = self.output_base / safe_name
 
         # Validate path is within output_base (prevent path traversal)
         try:
             output_dir = output_dir.resolve()
             output_base_resolved = self.output_base.resolve()
             if not str(output_dir).startswith(str(output_base_resolved)):
-                raise ValueError(f"Invalid hook name: path traversal detected in '{package.hook_name}'")
+                raise ValueError(f"Invalid hook name: path traversal detected in '{hook_name}'")
         except (ValueError, OSError) as e:
             raise ValueError(f"Invalid hook name: {str(e)}")
 
+        return output_dir
+
+    def _save_package(self, package: HookPackage) -> dict:
+        """
+        Save hook package to disk.
+
+        Args:
+            package: HookPackage to save
+
+        Returns:
+            Dictionary with file paths
+        """
+        output_dir = self._resolve_output_dir(package.hook_name)
         output_dir.mkdir(parents=True, exist_ok=True)
 
         files = {}
@@ -628,6 +879,9 @@ Examples:
   python hook_factory.py -t post_tool_use_format -l python
   python hook_factory.py -t subagent_stop_test_runner -l javascript
 
+  # Regenerate every hook listed in a manifest (unchanged packages are skipped)
+  python hook_factory.py --batch hooks-manifest.json
+
   # List available templates
   python hook_factory.py --list
         """
@@ -648,6 +902,12 @@ Examples:
     parser.add_argument('-i', '--interactive',
                         action='store_true',
                         help='Interactive mode with guided questions')
+    parser.add_argument('-b', '--batch',
+                        metavar='MANIFEST',
+                        help='Generate all hooks listed in a JSON manifest')
+    parser.add_argument('-w', '--workers',
+                        type=int,
+                        help='Worker threads for --batch (default: auto)')
     parser.add_argument('--project-root',
                         help='Project root directory (default: auto-detect)')
 
@@ -664,6 +924,15 @@ Examples:
         factory.list_templates()
         return 0
 
+    # Batch generation from manifest
+    if args.batch:
+        try:
+            summary = factory.create_hooks_from_manifest(args.batch, max_workers=args.workers)
+        except ValueError as e:
+            print(f"❌ Error: {str(e)}")
+            return 1
+        return 1 if summary['failed'] else 0
+
     # Generate from request
     if args.request:
         result = factory.create_hook_from_request(args.request)
@@ -6,7 +6,11 @@ Provides safe installation, uninstallation, and listing of hooks with:
 - JSON validation before/after changes
 - Support for user-level (~/.claude/settings.json) and project-level (.claude/settings.json)
 - Automatic backup creation with timestamps
-- Rollback on failure
+- Rollback on failure (nothing is written unless the whole change succeeds)
+- In-memory settings model (settings_store.py) loaded once per session, with
+  hooks indexed by (event_type, matcher, command fingerprint)
+- Safe concurrent installs: saves take an fcntl lock on settings.json.lock
+  and merge hooks saved by other installers instead of overwriting them
 
 macOS/Linux only (Windows not supported in this version)
 """
@@ -16,8 +20,8 @@ import shutil
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime
-import tempfile
-import os
+
+from settings_store import SettingsStore, entry_problems
 
 
 class HookInstaller:
@@ -26,6 +30,7 @@ class HookInstaller:
     def __init__(self):
         self.user_settings_path = Path.home() / '.claude' / 'settings.json'
         self.project_settings_path = Path('.claude') / 'settings.json'
+        self._stores: Dict[Path, SettingsStore] = {}
 
     def get_settings_path(self, level: str = 'user') -> Path:
         """
@@ -47,6 +52,25 @@ class HookInstaller:
         else:
             raise ValueError(f"Invalid level '{level}'. Must be 'user' or 'project'")
 
+    def get_store(self, level: str = 'user') -> SettingsStore:
+        """
+        Settings model for the level, loaded once per session.
+
+        The store is reloaded only if settings.json changed on disk since it
+        was last loaded or saved.
+
+        Raises:
+            ValueError: If level is invalid
+            json.JSONDecodeError: If settings.json is malformed
+        """
+        settings_path = self.get_settings_path(level)
+        store = self._stores.get(settings_path)
+        if store is None:
+            store = self._stores[settings_path] = SettingsStore(settings_path)
+        elif store.is_stale():
+            store.load()
+        return store
+
     def backup_settings(self, settings_path: Path) -> Optional[Path]:
         """
         Create timestamped backup of settings.json.
@@ -77,115 +101,29 @@ class HookInstaller:
     def _cleanup_old_backups(self, settings_path: Path, keep: int = 5):
         """Keep only the most recent N backups."""
         backup_pattern = f"{settings_path.name}.backup.*"
-        backups = sorted(settings_path.parent.glob(backup_pattern), key=lambda p: p.stat().st_mtime, reverse=True)
+        backups = []
+        for backup in settings_path.parent.glob(backup_pattern):
+            try:
+                backups.append((backup.stat().st_mtime, backup))
+            except FileNotFoundError:
+                # Removed by a concurrent installer
+                continue
+        backups.sort(reverse=True)
 
         # Remove old backups beyond keep limit
-        for old_backup in backups[keep:]:
-            old_backup.unlink()
+        for _, old_backup in backups[keep:]:
+            try:
+                old_backup.unlink()
+            except FileNotFoundError:
+                continue
             print(f"🗑️  Removed old backup: {old_backup.name}")
 
-    def restore_settings(self, backup_path: Path) -> bool:
-        """
-        Restore settings.json from backup.
-
-        Args:
-            backup_path: Path to backup file
-
-        Returns:
-            True if successful, False otherwise
-        """
-        if not backup_path.exists():
-            print(f"❌ Backup not found: {backup_path}")
-            return False
-
-        # Determine original settings path
-        settings_path = backup_path.parent / 'settings.json'
-
-        try:
-            shutil.copy2(backup_path, settings_path)
-            print(f"✅ Restored from backup: {backup_path}")
-            return True
-        except Exception as e:
-            print(f"❌ Restore failed: {e}")
-            return False
-
-    def load_settings(self, settings_path: Path) -> Tuple[Dict, bool]:
-        """
-        Load settings.json safely.
-
-        Args:
-            settings_path: Path to settings.json
-
-        Returns:
-            Tuple of (settings_dict, file_existed)
-            If file doesn't exist, returns empty dict with hooks structure
-
-        Raises:
-            json.JSONDecodeError: If JSON is malformed
-        """
-        if not settings_path.exists():
-            # Create minimal settings structure
-            return {'hooks': {}}, False
-
-        try:
-            with open(settings_path, 'r', encoding='utf-8') as f:
-                settings = json.load(f)
-
-            # Ensure hooks key exists
-            if 'hooks' not in settings:
-                settings['hooks'] = {}
-
-            return settings, True
-
-        except json.JSONDecodeError as e:
-            raise json.JSONDecodeError(
-                f"Malformed JSON in {settings_path}: {e.msg}",
-                e.doc,
-                e.pos
-            )
-
-    def save_settings(self, settings_path: Path, settings: Dict) -> bool:
-        """
-        Save settings.json atomically (write to temp, then rename).
-
-        Args:
-            settings_path: Path to settings.json
-            settings: Settings dictionary to save
-
-        Returns:
-            True if successful, False otherwise
-        """
-        try:
-            # Ensure parent directory exists
-            settings_path.parent.mkdir(parents=True, exist_ok=True)
-
-            # Write to temporary file first (atomic operation)
-            with tempfile.NamedTemporaryFile(
-                mode='w',
-                encoding='utf-8',
-                dir=settings_path.parent,
-                delete=False,
-                suffix='.tmp'
-            ) as tmp_file:
-                json.dump(settings, tmp_file, indent=2, ensure_ascii=False)
-                tmp_file.write('\n')  # Add trailing newline
-                tmp_path = Path(tmp_file.name)
-
-            # Validate JSON before replacing
-            with open(tmp_path, 'r', encoding='utf-8') as f:
-                json.load(f)  # Will raise if invalid
-
-            # Atomic rename (replaces existing file)
-            tmp_path.replace(settings_path)
-            print(f"✅ Settings saved: {settings_path}")
-            return True
-
-        except Exception as e:
-            print(f"❌ Save failed: {e}")
-            # Clean up temp file if it exists
-            if 'tmp_path' in locals() and tmp_path.exists():
-                tmp_path.unlink()
-            return False
+    def _save_store(self, store: SettingsStore):
+        """Save a settings store, reporting changes merged from other installers."""
+        store.save()
+        if store.merged:
+            print(f"🔀 Merged with changes saved concurrently to {store.path}")
+        print(f"✅ Settings saved: {store.path}")
 
     def load_hook_config(self, hook_path: Path) -> Tuple[Dict, str]:
         """
@@ -256,7 +194,7 @@ class HookInstaller:
         print(f"\n📦 Installing hook: {hook_name}")
         print(f"📍 Location: {settings_path}")
 
-        backup_path = None
+        store = None
 
         try:
             # 1. Load hook configuration
@@ -265,21 +203,18 @@ class HookInstaller:
 
             # 2. Backup existing settings
             if settings_path.exists():
-                backup_path = self.backup_settings(settings_path)
+                self.backup_settings(settings_path)
 
-            # 3. Load current settings
-            settings, file_existed = self.load_settings(settings_path)
+            # 3. Load current settings (once per session)
+            store = self.get_store(level)
 
             # 4. Merge hook into settings
-            # Ensure event type array exists in hooks
-            if event_type not in settings['hooks']:
-                settings['hooks'][event_type] = []
-
-            # Get hook entry for this event type
             hook_entry = hook_config[event_type]
+            new_entries = hook_entry if isinstance(hook_entry, list) else [hook_entry]
 
-            # Check for duplicate (by matcher/command similarity)
-            if self._is_duplicate_hook(settings['hooks'][event_type], hook_entry):
+            # Check for duplicates (same matcher and command fingerprint)
+            duplicates = [existing for entry in new_entries for existing in store.find(event_type, entry)]
+            if duplicates:
                 print(f"⚠️  Similar hook already exists for {event_type}")
                 response = input("Replace existing hook? (y/n): ").strip().lower()
                 if response != 'y':
@@ -287,20 +222,14 @@ class HookInstaller:
                     return False
 
                 # Remove old version before adding new
-                settings['hooks'][event_type] = [
-                    h for h in settings['hooks'][event_type]
-                    if not self._is_matching_hook(h, hook_entry)
-                ]
+                store.remove(event_type, duplicates)
 
             # Add hook(s) to event type array
-            if isinstance(hook_entry, list):
-                settings['hooks'][event_type].extend(hook_entry)
-            else:
-                settings['hooks'][event_type].append(hook_entry)
+            for entry in new_entries:
+                store.add(event_type, entry)
 
             # 5. Save settings atomically
-            if not self.save_settings(settings_path, settings):
-                raise Exception("Failed to save settings")
+            self._save_store(store)
 
             print(f"✅ Hook installed successfully!")
             print(f"📝 Hook name: {hook_name}")
@@ -312,42 +241,98 @@ class HookInstaller:
         except Exception as e:
             print(f"\n❌ Installation failed: {e}")
 
-            # Rollback from backup if available
-            if backup_path and backup_path.exists():
-                print("🔄 Rolling back from backup...")
-                self.restore_settings(backup_path)
+            # Rollback: saves are atomic, so settings.json is unchanged after a
+            # failure (restoring the backup could drop hooks saved meanwhile by
+            # other installers); only the unsaved in-memory changes are dropped
+            print("↩️  settings.json left unchanged")
+            if store is not None:
+                store.load()
 
             return False
 
-    def _is_duplicate_hook(self, existing_hooks: List[Dict], new_hook: Dict) -> bool:
-        """Check if hook already exists (by matcher/command similarity)."""
-        if isinstance(new_hook, list):
-            new_hook = new_hook[0] if new_hook else {}
+    def install_many(self, hook_paths: List[str], level: str = 'user', replace_existing: bool = True) -> bool:
+        """
+        Install several hooks as one transaction.
 
-        for hook in existing_hooks:
-            if self._is_matching_hook(hook, new_hook):
-                return True
-        return False
+        Args:
+            hook_paths: Paths to hook folders (each contains hook.json)
+            level: 'user' for ~/.claude or 'project' for .claude
+            replace_existing: Replace installed duplicates (same matcher and
+                command) instead of skipping them, so re-running a bundle is safe
 
-    def _is_matching_hook(self, hook1: Dict, hook2: Dict) -> bool:
-        """Check if two hooks are similar enough to be duplicates."""
-        # Compare matchers
-        matcher1 = hook1.get('matcher', {})
-        matcher2 = hook2.get('matcher', {})
+        Returns:
+            True if all hooks were installed; False leaves settings.json unchanged
 
-        if matcher1 == matcher2:
-            # Same matcher - check if commands are similar
-            hooks1 = hook1.get('hooks', [])
-            hooks2 = hook2.get('hooks', [])
+        Process:
+            1. Load every hook.json (any failure aborts before changes)
+            2. Load current settings once
+            3. Merge all hooks in memory and validate them
+            4. One backup and one atomic save
+            5. Rollback on failure
+        """
+        settings_path = self.get_settings_path(level)
 
-            if hooks1 and hooks2:
-                cmd1 = hooks1[0].get('command', '').strip()[:50]  # First 50 chars
-                cmd2 = hooks2[0].get('command', '').strip()[:50]
+        print(f"\n📦 Installing {len(hook_paths)} hooks")
+        print(f"📍 Location: {settings_path}")
 
-                if cmd1 == cmd2:
-                    return True
+        store = None
 
-        return False
+        try:
+            # 1. Load hook configurations
+            configs = []
+            for hook_path in map(Path, hook_paths):
+                hook_config, event_type = self.load_hook_config(hook_path)
+                hook_entry = hook_config[event_type]
+                new_entries = hook_entry if isinstance(hook_entry, list) else [hook_entry]
+                configs.append((hook_path.name, event_type, new_entries))
+
+            # 2. Load current settings (once per session)
+            store = self.get_store(level)
+
+            # 3. Merge and validate in memory
+            problems = []
+            installed = skipped = 0
+            for name, event_type, new_entries in configs:
+                for entry in new_entries:
+                    problems.extend(f"{name}: {problem}" for problem in entry_problems(event_type, entry))
+
+                duplicates = [existing for entry in new_entries for existing in store.find(event_type, entry)]
+                if duplicates and not replace_existing:
+                    print(f"⏭️  {name} ({event_type}) - similar hook already installed")
+                    skipped += 1
+                    continue
+
+                store.remove(event_type, duplicates)
+                for entry in new_entries:
+                    store.add(event_type, entry)
+                installed += 1
+                print(f"{'🔁' if duplicates else '➕'} {name} ({event_type})")
+
+            if problems:
+                raise ValueError("Invalid hooks:\n  " + "\n  ".join(problems))
+
+            # 4. One backup, one atomic save
+            if installed:
+                if settings_path.exists():
+                    self.backup_settings(settings_path)
+                self._save_store(store)
+
+            print(f"✅ Installed {installed} hook(s), skipped {skipped}")
+            print(f"📍 Location: {level} ({settings_path})")
+
+            return True
+
+        except Exception as e:
+            print(f"\n❌ Bulk installation failed: {e}")
+
+            # Rollback: saves are atomic, so settings.json is unchanged after a
+            # failure (restoring the backup could drop hooks saved meanwhile by
+            # other installers); only the unsaved in-memory changes are dropped
+            print("↩️  settings.json left unchanged")
+            if store is not None:
+                store.load()
+
+            return False
 
     def uninstall_hook(self, hook_name: str, level: str = 'user', event_type: Optional[str] = None) -> bool:
         """
@@ -372,43 +357,28 @@ class HookInstaller:
         print(f"\n🗑️  Uninstalling hook: {hook_name}")
         print(f"📍 Location: {settings_path}")
 
-        backup_path = None
+        store = None
 
         try:
             # 1. Backup settings
-            backup_path = self.backup_settings(settings_path)
-
-            # 2. Load settings
-            settings, _ = self.load_settings(settings_path)
-
-            # 3. Find and remove hook
-            removed = False
-            event_types_to_check = [event_type] if event_type else settings['hooks'].keys()
-
-            for et in event_types_to_check:
-                if et not in settings['hooks']:
-                    continue
+            self.backup_settings(settings_path)
 
-                original_count = len(settings['hooks'][et])
+            # 2. Load settings (once per session)
+            store = self.get_store(level)
 
-                # Remove hooks matching the name
-                settings['hooks'][et] = [
-                    h for h in settings['hooks'][et]
-                    if not self._hook_matches_name(h, hook_name)
-                ]
+            # 3. Find and remove hook (one pass per event type)
+            removed = store.remove_where(lambda h: self._hook_matches_name(h, hook_name),
+                                         [event_type] if event_type else None)
 
-                removed_count = original_count - len(settings['hooks'][et])
-                if removed_count > 0:
-                    print(f"✅ Removed {removed_count} hook(s) from {et}")
-                    removed = True
+            for et, removed_count in removed.items():
+                print(f"✅ Removed {removed_count} hook(s) from {et}")
 
             if not removed:
                 print(f"⚠️  Hook '{hook_name}' not found")
                 return False
 
             # 4. Save settings
-            if not self.save_settings(settings_path, settings):
-                raise Exception("Failed to save settings")
+            self._save_store(store)
 
             print(f"✅ Hook uninstalled successfully!")
             return True
@@ -416,10 +386,12 @@ class HookInstaller:
         except Exception as e:
             print(f"\n❌ Uninstallation failed: {e}")
 
-            # Rollback
-            if backup_path and backup_path.exists():
-                print("🔄 Rolling back from backup...")
-                self.restore_settings(backup_path)
+            # Rollback: saves are atomic, so settings.json is unchanged after a
+            # failure (restoring the backup could drop hooks saved meanwhile by
+            # other installers); only the unsaved in-memory changes are dropped
+            print("↩️  settings.json left unchanged")
+            if store is not None:
+                store.load()
 
             return False
 
@@ -453,11 +425,11 @@ class HookInstaller:
             return []
 
         try:
-            settings, _ = self.load_settings(settings_path)
+            store = self.get_store(level)
             hooks_info = []
 
-            for event_type, hooks in settings.get('hooks', {}).items():
-                for hook in hooks:
+            for event_type in store.event_types():
+                for hook in store.entries(event_type):
                     matcher = hook.get('matcher', {})
                     hook_commands = hook.get('hooks', [])
 
@@ -487,6 +459,7 @@ def main():
     if len(sys.argv) < 2:
         print("Usage:")
         print("  python installer.py install <hook_path> [user|project]")
+        print("  python installer.py install-many <hook_path>... [user|project]")
         print("  python installer.py uninstall <hook_name> [user|project]")
         print("  python installer.py list [user|project]")
         sys.exit(1)
@@ -505,6 +478,16 @@ def main():
         success = installer.install_hook(hook_path, level)
         sys.exit(0 if success else 1)
 
+    elif command == 'install-many':
+        args = sys.argv[2:]
+        level = args.pop() if args and args[-1] in ('user', 'project') else 'user'
+        if not args:
+            print("Error: at least one hook_path required")
+            sys.exit(1)
+
+        success = installer.install_many(args, level)
+        sys.exit(0 if success else 1)
+
     elif command == 'uninstall':
         if len(sys.argv) < 3:
             print("Error: hook_name required")
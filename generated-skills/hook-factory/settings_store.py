@@ -0,0 +1,377 @@
+"""
+Settings Store - In-memory model of a Claude Code settings.json.
+
+Loads settings.json once and indexes every hook entry by
+(event_type, matcher, command fingerprint), so duplicate detection is a
+dict lookup instead of a scan of every hook of the event type. Removals are
+applied to the index at once and to the event lists in one pass when they
+are next read or saved, which keeps bulk install/uninstall linear.
+
+Writes go to a temporary file in the same folder, are fsynced and then
+renamed over settings.json, so readers never see a partial file.
+
+Several installers (IDE sessions, CI jobs) may share one settings.json.
+Saving takes an advisory fcntl lock on settings.json.lock, waiting at most
+`lock_timeout` seconds, and holds it only for the read-check-write step.
+If the file's content hash no longer matches the one it was loaded with,
+the store reloads it and replays its own pending adds and removes on top
+(merge-retry) instead of overwriting the other writer's changes.
+
+macOS/Linux only (Windows not supported in this version)
+"""
+
+import os
+import json
+import stat
+import time
+import fcntl
+import hashlib
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+
+# Two hooks with the same matcher whose first commands share this prefix
+# (after stripping) are considered the same hook
+COMMAND_FINGERPRINT_LENGTH = 50
+
+# (event_type, canonical matcher JSON, command prefix)
+HookKey = Tuple[str, str, str]
+
+# Bounded wait for the settings lock (seconds)
+LOCK_TIMEOUT = 10.0
+LOCK_POLL_INTERVAL = 0.02
+
+# Merges attempted when writers that don't take the lock keep changing the file
+MAX_SAVE_ATTEMPTS = 5
+
+
+class SettingsLockTimeout(TimeoutError):
+    """Another process held the settings lock for longer than the timeout."""
+
+
+class SettingsConflictError(RuntimeError):
+    """settings.json kept changing while saving, even after merging."""
+
+
+def hook_key(event_type: str, entry: Dict) -> Optional[HookKey]:
+    """Index key of a settings hook entry; None if it has no commands to compare."""
+    if not isinstance(entry, dict):
+        return None
+    hooks = entry.get('hooks') or []
+    if not isinstance(hooks, list) or not hooks or not isinstance(hooks[0], dict):
+        return None
+    matcher = json.dumps(entry.get('matcher', {}), sort_keys=True)
+    command = str(hooks[0].get('command', '')).strip()[:COMMAND_FINGERPRINT_LENGTH]
+    return event_type, matcher, command
+
+
+def entry_problems(event_type: str, entry: Dict) -> List[str]:
+    """Reasons a hook entry cannot go into settings.json (empty if it is well-formed)."""
+    where = f"{event_type} hook"
+    if not isinstance(entry, dict):
+        return [f"{where} must be an object"]
+    if not isinstance(entry.get('matcher', {}), dict):
+        return [f"{where} matcher must be an object"]
+    hooks = entry.get('hooks')
+    if not isinstance(hooks, list) or not hooks:
+        return [f"{where} needs a non-empty 'hooks' list"]
+
+    problems = []
+    for idx, hook in enumerate(hooks):
+        if not isinstance(hook, dict):
+            problems.append(f"{where} hooks[{idx}] must be an object")
+        elif hook.get('type', 'command') == 'command' and not hook.get('command'):
+            problems.append(f"{where} hooks[{idx}] has no command")
+    return problems
+
+
+def _parse_settings(data: Optional[bytes], settings_path: Path) -> Dict:
+    """settings.json bytes (None if missing) as a dict with a 'hooks' key."""
+    if data is None:
+        return {'hooks': {}}
+
+    try:
+        settings = json.loads(data.decode('utf-8'))
+    except json.JSONDecodeError as e:
+        raise json.JSONDecodeError(f"Malformed JSON in {settings_path}: {e.msg}", e.doc, e.pos)
+
+    # Ensure hooks key exists
+    settings.setdefault('hooks', {})
+    return settings
+
+
+def _read_bytes(path: Path) -> Optional[bytes]:
+    try:
+        return Path(path).read_bytes()
+    except FileNotFoundError:
+        return None
+
+
+def _digest(data: Optional[bytes]) -> Optional[bytes]:
+    return hashlib.sha256(data).digest() if data is not None else None
+
+
+def _canonical(entry: Dict) -> str:
+    return json.dumps(entry, sort_keys=True)
+
+
+def read_settings(settings_path: Path) -> Tuple[Dict, bool]:
+    """
+    Read settings.json.
+
+    Returns:
+        Tuple of (settings_dict, file_existed); a missing file gives
+        {'hooks': {}}
+
+    Raises:
+        json.JSONDecodeError: If JSON is malformed
+    """
+    data = _read_bytes(settings_path)
+    return _parse_settings(data, settings_path), data is not None
+
+
+def dump_settings(settings: Dict) -> str:
+    """settings.json text: 2-space indent and a trailing newline."""
+    return json.dumps(settings, indent=2, ensure_ascii=False) + '\n'
+
+
+def write_atomic(path: Path, text: str, precondition: Optional[Callable[[], bool]] = None) -> bool:
+    """
+    Write `text` to a temp file next to `path`, fsync it and rename it over `path`.
+
+    `precondition` is checked right before the rename; if it returns False
+    the temp file is discarded, `path` is left alone and False is returned.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f'.{path.name}.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as tmp_file:
+            tmp_file.write(text)
+            tmp_file.flush()
+            os.fsync(tmp_file.fileno())
+        # mkstemp creates 0600 files: keep the permissions of the file being replaced
+        try:
+            os.chmod(tmp_name, stat.S_IMODE(path.stat().st_mode))
+        except FileNotFoundError:
+            pass
+        if precondition is not None and not precondition():
+            os.unlink(tmp_name)
+            return False
+        os.replace(tmp_name, path)
+        return True
+    except BaseException:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+        raise
+
+
+@contextmanager
+def settings_lock(settings_path: Path, timeout: float = LOCK_TIMEOUT) -> Iterator[None]:
+    """
+    Advisory exclusive lock on `<settings_path>.lock`.
+
+    A separate lock file is used because settings.json itself is replaced
+    by rename on every save.
+
+    Raises:
+        SettingsLockTimeout: If the lock is not acquired within `timeout` seconds
+    """
+    lock_path = Path(settings_path).with_name(Path(settings_path).name + '.lock')
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+
+    with open(lock_path, 'a') as lock_file:
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                break
+            except BlockingIOError:
+                if time.monotonic() >= deadline:
+                    raise SettingsLockTimeout(f"Timed out after {timeout}s waiting for {lock_path}")
+                time.sleep(LOCK_POLL_INTERVAL)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+def _stat_signature(path: Path) -> Optional[Tuple[int, int, int]]:
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return st.st_mtime_ns, st.st_size, st.st_ino
+
+
+class SettingsStore:
+    """settings.json loaded once, with hook entries indexed for O(1) duplicate lookups."""
+
+    def __init__(self, settings_path: Path, lock_timeout: float = LOCK_TIMEOUT):
+        self.path = Path(settings_path)
+        self.lock_timeout = lock_timeout
+        self.settings: Dict = {'hooks': {}}
+        self.existed = False
+        self._index: Dict[HookKey, List[Dict]] = {}
+        # id()s of removed entries, per event type, not yet dropped from the lists
+        self._removed: Dict[str, Set[int]] = {}
+        self._signature = None
+        # Content hash settings.json had when loaded (None: file missing)
+        self._digest: Optional[bytes] = None
+        # Unsaved changes, replayed if another writer saved in the meantime
+        self._pending: List[Tuple[str, str, object]] = []
+        # Number of concurrent changes merged by the last save()
+        self.merged = 0
+        self.load()
+
+    def load(self):
+        """(Re)read settings.json and rebuild the index, discarding unsaved changes."""
+        signature = _stat_signature(self.path)
+        self._load_bytes(_read_bytes(self.path))
+        self._signature = signature
+
+    def _load_bytes(self, data: Optional[bytes]):
+        self.settings = _parse_settings(data, self.path)
+        self.existed = data is not None
+        self._digest = _digest(data)
+        self._pending = []
+        self._removed = {}
+        self._index = {}
+        for event_type, entries in self.hooks.items():
+            if isinstance(entries, list):
+                for entry in entries:
+                    self._index_entry(event_type, entry)
+
+    def is_stale(self) -> bool:
+        """Whether settings.json changed on disk since it was loaded or saved."""
+        return _stat_signature(self.path) != self._signature
+
+    @property
+    def hooks(self) -> Dict[str, List[Dict]]:
+        return self.settings['hooks']
+
+    def _index_entry(self, event_type: str, entry: Dict):
+        key = hook_key(event_type, entry)
+        if key is not None:
+            self._index.setdefault(key, []).append(entry)
+
+    def _compact(self, event_type: str):
+        removed = self._removed.pop(event_type, None)
+        if removed:
+            self.hooks[event_type] = [entry for entry in self.hooks[event_type] if id(entry) not in removed]
+
+    def event_types(self) -> List[str]:
+        return list(self.hooks)
+
+    def entries(self, event_type: str) -> List[Dict]:
+        """Hook entries of one event type, in settings order."""
+        self._compact(event_type)
+        return self.hooks.get(event_type, [])
+
+    def find(self, event_type: str, entry: Dict) -> List[Dict]:
+        """Installed entries that duplicate `entry` (same matcher and command fingerprint)."""
+        key = hook_key(event_type, entry)
+        return list(self._index.get(key, ())) if key is not None else []
+
+    def add(self, event_type: str, entry: Dict):
+        """Append a hook entry to the event type's list."""
+        self.hooks.setdefault(event_type, []).append(entry)
+        self._index_entry(event_type, entry)
+        self._pending.append(('add', event_type, entry))
+
+    def remove(self, event_type: str, entries: Iterable[Dict]) -> int:
+        """Remove these entry objects (as returned by find()/entries()) from an event type."""
+        removed = self._removed.setdefault(event_type, set())
+        count = 0
+        for entry in entries:
+            if id(entry) in removed:
+                continue
+            removed.add(id(entry))
+            count += 1
+            self._pending.append(('remove', event_type, _canonical(entry)))
+            key = hook_key(event_type, entry)
+            if key in self._index:
+                self._index[key] = [indexed for indexed in self._index[key] if indexed is not entry]
+                if not self._index[key]:
+                    del self._index[key]
+        return count
+
+    def remove_where(self, predicate: Callable[[Dict], bool],
+                     event_types: Optional[Iterable[str]] = None) -> Dict[str, int]:
+        """
+        Remove every entry for which `predicate` is true.
+
+        Returns:
+            {event_type: removed count} for event types that lost entries
+        """
+        counts = {}
+        for event_type in list(event_types or self.event_types()):
+            if not isinstance(self.hooks.get(event_type), list):
+                continue
+            count = self.remove(event_type, [entry for entry in self.entries(event_type) if predicate(entry)])
+            if count:
+                counts[event_type] = count
+        return counts
+
+    def _rebase(self, data: Optional[bytes]):
+        """Reload from `data` (written by someone else) and replay the pending changes on top."""
+        pending = self._pending
+        self._load_bytes(data)
+
+        # canonical JSON -> entries, per event type, built on first use
+        by_content: Dict[str, Dict[str, List[Dict]]] = {}
+
+        def entries_by_content(event_type: str) -> Dict[str, List[Dict]]:
+            if event_type not in by_content:
+                by_content[event_type] = {}
+                for entry in self.entries(event_type):
+                    by_content[event_type].setdefault(_canonical(entry), []).append(entry)
+            return by_content[event_type]
+
+        for op, event_type, payload in pending:
+            if not isinstance(self.hooks.get(event_type, []), list):
+                continue
+            if op == 'add':
+                # The other writer may have installed the same hook
+                content = _canonical(payload)
+                if not entries_by_content(event_type).get(content):
+                    self.add(event_type, payload)
+                    entries_by_content(event_type)[content] = [payload]
+            else:
+                matches = entries_by_content(event_type).pop(payload, [])
+                self.remove(event_type, matches)
+
+    def save(self):
+        """
+        Write settings.json atomically, merging changes saved by other processes.
+
+        Raises:
+            SettingsLockTimeout: If the settings lock could not be acquired in time
+            SettingsConflictError: If the file kept changing after MAX_SAVE_ATTEMPTS merges
+        """
+        self.merged = 0
+        with settings_lock(self.path, self.lock_timeout):
+            for _ in range(MAX_SAVE_ATTEMPTS):
+                current = _read_bytes(self.path)
+                if _digest(current) != self._digest:
+                    self._rebase(current)
+                    self.merged += 1
+
+                for event_type in list(self._removed):
+                    self._compact(event_type)
+
+                # Writers that don't take the lock may still change the file
+                # while the temp file is written: merge again if they did
+                text = dump_settings(self.settings)
+                if write_atomic(self.path, text, precondition=lambda: _read_bytes(self.path) == current):
+                    break
+            else:
+                raise SettingsConflictError(f"{self.path} kept changing while saving")
+
+            self._digest = _digest(text.encode('utf-8'))
+            self._signature = _stat_signature(self.path)
+        self.existed = True
+        self._pending = []
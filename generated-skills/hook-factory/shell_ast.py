@@ -0,0 +1,654 @@
+"""
+Shell AST - Lightweight parser for hook commands.
+
+Tokenizes a hook command once into words, redirections and control
+operators, then groups them into simple commands, pipelines (`|`) and
+chains (`&&`, `||`, `;`, `&`, newline). Quoting is resolved while lexing,
+so rules can tell `rm -rf build` from `echo "never rm -rf build"`.
+
+Command substitutions (`$(...)`, backticks) and scripts passed to
+`sh -c` / `bash -c` / `eval` are parsed recursively, since their contents
+run as code, up to MAX_NESTING_DEPTH levels; deeper scripts are left
+unparsed and the AST is marked `too_deep`.
+
+This is not a full shell grammar: compound commands (if/for/case, subshells,
+{ ...; }) are flattened into the simple commands they contain, which is all
+the validation rules need.
+
+Usage:
+    from shell_ast import parse_command
+
+    ast = parse_command('command -v black && black . 2>/dev/null || exit 0')
+    ast.command_names       # frozenset({'command', 'black', 'exit'})
+"""
+
+import re
+import shlex
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import FrozenSet, Iterator, List, Optional, Tuple
+
+
+# One token at a time; the alternative that matches names its kind.
+# Redirects are [fd]op: >, >>, <, <<, <<-, <<<, >&, <&, &>, &>>, >|, <>, and
+# control operators are longest first; blanks after either are taken with it.
+# A run of words made only of plain characters (up to a comment or a
+# redirect's fd) is matched whole; any other word is left to _WORD_PART_PATTERN
+_TOKEN_PATTERN = re.compile(
+    r'(?P<blank>[ \t]+)'
+    r'|(?P<continuation>\\\n)'
+    r'|(?P<comment>#[^\n]*)'
+    r'|(?P<newline>\n)'
+    r'|(?:(?P<redirect>(?P<fd>\d*)(?P<op>&>>|&>|>>|>&|>\||<<<|<<-|<<|<&|<>|>|<))'
+    r'|(?P<operator>&&|\|\||;;|\|&|[|;&()]))[ \t]*'
+    r'''|(?P<plain>(?:(?!#|\d+(?:&>|[<>]))[^ \t\n|&;()<>\\'"`$]+(?![^ \t\n|&;()<>])[ \t]*)+)''')
+
+_PLAIN_WORD_PATTERN = re.compile(r'[^ \t]+')
+
+# Parts of a word; a metacharacter (space, tab, newline or |&;()<>) ends it
+_WORD_PART_PATTERN = re.compile(
+    r'''(?P<plain>[^ \t\n|&;()<>\\'"`$]+|\$(?![A-Za-z_{(]))'''
+    r'|(?P<escape>\\(?s:.)?)'
+    r"|'(?P<single>[^']*)(?P<closed>')?"
+    r'|(?P<double>")'
+    r'|(?P<substitution>`|\$\()'
+    r'|(?P<variable>\$\{[^}]*\}?|\$[A-Za-z_][A-Za-z0-9_]*)')
+
+# Parts of a double-quoted string after the opening quote
+_DOUBLE_QUOTED_PART_PATTERN = re.compile(
+    r'(?P<text>[^"\\`$]+|\$(?!\()|\\(?![\\"$`\n]))'
+    r'|\\(?P<escaped>[\\"$`\n])'
+    r'|(?P<substitution>`|\$\()'
+    r'|(?P<end>")')
+
+_BACKTICK_PATTERN = re.compile(r'`(?P<script>[^`\\]*(?:\\(?s:.)?[^`\\]*)*)`?')
+
+# Inside $(...): characters that change the paren depth or start a quote
+_SUBSTITUTION_STOP_PATTERN = re.compile(r'''[()'"\\]''')
+_QUOTED_SPAN_PATTERNS = {
+    "'": re.compile(r"'[^']*'"),
+    '"': re.compile(r'"[^"\\]*(?:\\(?s:.)[^"\\]*)*"'),
+}
+
+_ASSIGNMENT_PATTERN = re.compile(r'[A-Za-z_][A-Za-z0-9_]*(\[[^\]]*\])?\+?=')
+
+# Words that open or close compound commands rather than naming a command
+_RESERVED_PREFIXES = frozenset(('!', '{', '}', 'if', 'then', 'else', 'elif', 'fi',
+                                'do', 'done', 'while', 'until', 'time'))
+_RESERVED_NON_COMMANDS = frozenset(('for', 'case', 'esac', 'select', 'function', 'in', '[[', ']]'))
+
+# Commands that run the rest of their arguments as a command: the options
+# that take a separate value, and the operands before the command
+# (`timeout 5 rm ...`, `chroot /srv rm ...`)
+_WRAPPERS = {
+    'sudo': (frozenset(('-u', '-g', '-h', '-p', '-C', '-D', '-r', '-t', '-U')), 0),
+    'doas': (frozenset(('-u', '-C')), 0),
+    'env': (frozenset(('-u', '-C', '--unset', '--chdir')), 0),
+    'nohup': (frozenset(), 0),
+    'exec': (frozenset(('-a',)), 0),
+    'nice': (frozenset(('-n', '--adjustment')), 0),
+    'ionice': (frozenset(('-c', '-n', '-p', '-P', '-u')), 0),
+    'time': (frozenset(('-f', '-o')), 0),
+    'command': (frozenset(), 0),
+    'builtin': (frozenset(), 0),
+    'timeout': (frozenset(('-s', '-k', '--signal', '--kill-after')), 1),
+    'stdbuf': (frozenset(('-i', '-o', '-e')), 0),
+    'setsid': (frozenset(), 0),
+    'chroot': (frozenset(('--userspec', '--groups')), 1),
+    'flock': (frozenset(('-w', '-E', '--timeout', '--conflict-exit-code')), 1),
+    'xargs': (frozenset(('-a', '-d', '-E', '-I', '-L', '-n', '-P', '-s', '--arg-file',
+                         '--delimiter', '--max-args', '--max-lines', '--max-procs')), 0),
+}
+WRAPPER_COMMANDS = frozenset(_WRAPPERS)
+
+# Shells: their -c script, or the text fed to their stdin, is parsed as code
+_SHELLS = frozenset(('sh', 'bash', 'zsh', 'dash', 'ksh'))
+
+# Commands that run code given as arguments or on stdin (see _command_scripts)
+_ARGUMENT_RUNNERS = _SHELLS | frozenset(('eval', 'su', 'ssh', 'docker', 'podman', 'kubectl',
+                                         'watch', 'parallel', 'find'))
+
+# Options of runners that take a separate value
+_SSH_VALUE_OPTIONS = frozenset(('-b', '-c', '-D', '-E', '-e', '-F', '-I', '-i', '-J', '-L', '-l',
+                                '-m', '-O', '-o', '-p', '-Q', '-R', '-S', '-W', '-w'))
+_DOCKER_EXEC_VALUE_OPTIONS = frozenset(('-e', '--env', '--env-file', '-u', '--user', '-w',
+                                        '--workdir', '--detach-keys'))
+_KUBECTL_EXEC_VALUE_OPTIONS = frozenset(('-c', '--container', '-n', '--namespace', '-f',
+                                         '--filename', '--context', '--pod-running-timeout'))
+_WATCH_VALUE_OPTIONS = frozenset(('-n', '--interval', '-q', '--equexit'))
+_PARALLEL_VALUE_OPTIONS = frozenset(('-a', '--arg-file', '--colsep', '-d', '--delimiter', '--delay',
+                                     '-I', '-j', '--jobs', '--joblog', '-n', '-N', '--results',
+                                     '-S', '--sshlogin', '--timeout', '--tmpdir'))
+
+# Levels of $(...), backticks, sh -c and eval parsed below the hook command
+MAX_NESTING_DEPTH = 16
+
+
+@dataclass(frozen=True)
+class Word:
+    """A shell word: `text` as written, `value` with quotes and escapes removed."""
+    text: str
+    value: str
+    quoted: bool = False
+    unquoted_expansion: bool = False  # $VAR or ${VAR} outside any quotes
+
+    @property
+    def is_assignment(self) -> bool:
+        return '=' in self.text and bool(_ASSIGNMENT_PATTERN.match(self.text))
+
+
+@dataclass(frozen=True)
+class Redirect:
+    """A redirection such as `2>/dev/null`; fd is '' when implicit."""
+    fd: str
+    op: str
+    target: Optional[str]  # None when the operator is not followed by a word
+    body: Optional[str] = None  # here-document text, for << and <<-
+
+
+@dataclass(frozen=True)
+class SimpleCommand:
+    """One command: its words in order and its redirections."""
+    words: Tuple[Word, ...]
+    redirects: Tuple[Redirect, ...] = ()
+    # Word values from the command name on (no keywords or assignments);
+    # computed once, as every rule reads it
+    argv: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+    # argv of the command actually run, wrappers removed
+    # (`sudo -u ci timeout 5 rm -rf x` -> rm -rf x)
+    run_argv: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        words = self.words
+        start = 0
+        while start < len(words) and (words[start].value in _RESERVED_PREFIXES or
+                                      words[start].is_assignment):
+            start += 1
+        if start < len(words) and words[start].value in _RESERVED_NON_COMMANDS:
+            argv = ()
+        else:
+            argv = tuple(word.value for word in words[start:])
+        object.__setattr__(self, 'argv', argv)
+        object.__setattr__(self, 'run_argv', _unwrap(argv)[-1] if argv[:1] and argv[0] in _WRAPPERS
+                           else argv)
+
+    @property
+    def name(self) -> Optional[str]:
+        argv = self.argv
+        return argv[0] if argv else None
+
+
+def _unwrap(argv: Tuple[str, ...]) -> List[Tuple[str, ...]]:
+    """argv, then the command each wrapper runs (`nice sudo rm` -> 3 entries)."""
+    layers = [argv]
+    while argv and argv[0] in _WRAPPERS:
+        value_options, operands = _WRAPPERS[argv[0]]
+        index = 1
+        while index < len(argv):
+            arg = argv[index]
+            if argv[0] == 'command' and arg in ('-v', '-V'):
+                return layers  # command -v only looks the name up
+            if arg == '--':
+                index += 1
+                break
+            if arg.startswith('-') and len(arg) > 1:
+                index += 2 if arg in value_options else 1
+            elif argv[0] in ('env', 'sudo') and _ASSIGNMENT_PATTERN.match(arg):
+                index += 1
+            else:
+                break
+        argv = argv[index + operands:]
+        if not argv:
+            break
+        layers.append(argv)
+    return layers
+
+
+@dataclass(frozen=True)
+class Pipeline:
+    """Commands joined by `|` or `|&`."""
+    commands: Tuple[SimpleCommand, ...]
+
+
+@dataclass(frozen=True)
+class ChainLink:
+    """A pipeline and the control operator before it (None for the first)."""
+    operator: Optional[str]
+    pipeline: Pipeline
+
+
+@dataclass(frozen=True)
+class ShellAST:
+    """Parsed hook command."""
+    source: str
+    chain: Tuple[ChainLink, ...]
+    # Source with the contents of quoted strings removed ('echo ""')
+    code: str
+    # Quote character left open at the end of the command, if any
+    unclosed_quote: Optional[str]
+    # Command substitutions and sh -c / eval scripts
+    nested: Tuple['ShellAST', ...] = ()
+    # Names of every command run, nested and wrapped ones included
+    # (`sudo rm` -> sudo, rm)
+    command_names: FrozenSet[str] = frozenset()
+    # `code` of this AST and every nested one, one per line
+    all_code: str = ''
+    # Scripts nested deeper than MAX_NESTING_DEPTH were left unparsed
+    too_deep: bool = False
+    # Some command runs a quoted argument as code that could not be picked
+    # out and parsed (see _command_scripts); rules fall back to the source
+    unparsed_scripts: bool = False
+
+    def walk(self) -> Iterator['ShellAST']:
+        """This AST and every nested one."""
+        yield self
+        for nested in self.nested:
+            yield from nested.walk()
+
+    def commands(self) -> Iterator[SimpleCommand]:
+        """Every simple command, including nested ones."""
+        for ast in self.walk():
+            for link in ast.chain:
+                yield from link.pipeline.commands
+
+
+@lru_cache(maxsize=1024)
+def _plain_word(text: str) -> Word:
+    """Word without quotes or expansions; shared, as the same few recur."""
+    return Word(text, text)
+
+
+class _Lexer:
+    """Single pass over the command: tokens, quote-free code and nested scripts."""
+
+    def __init__(self, source: str):
+        self.source = source
+        self.pos = 0
+        # Words, ('redirect', fd, op, here-document body) tuples and operator strings
+        self.tokens: List[object] = []
+        self.code: List[str] = []
+        self.unclosed_quote: Optional[str] = None
+        self.nested_sources: List[str] = []
+        # Delimiter, <<- flag and token index of each here-document awaiting its body
+        self._heredocs: List[Tuple[str, bool, int]] = []
+
+    def run(self):
+        source = self.source
+        tokens = self.tokens
+        code = self.code
+        pos = 0
+        while pos < len(source):
+            match = _TOKEN_PATTERN.match(source, pos)
+            if not match:
+                self.pos = pos
+                words = [self._word()]
+                pos = self.pos
+            else:
+                kind = match.lastgroup
+                pos = match.end()
+                if kind != 'plain':
+                    if kind == 'redirect':
+                        tokens.append(('redirect', match.group('fd'), match.group('op'), None))
+                        code.append(match.group())
+                    elif kind == 'operator':
+                        tokens.append(match.group(kind))
+                        code.append(match.group())
+                    elif kind == 'blank':
+                        code.append(match.group())
+                    elif kind == 'newline':
+                        tokens.append('\n')
+                        code.append('\n')
+                        if self._heredocs:
+                            self.pos = pos
+                            self._read_heredocs()
+                            pos = self.pos
+                    # Comments and line continuations leave no token
+                    continue
+                words = [_plain_word(text) for text in _PLAIN_WORD_PATTERN.findall(match.group())]
+                code.append(match.group())
+
+            previous = tokens[-1] if tokens else None
+            if isinstance(previous, tuple) and previous[2] in ('<<', '<<-'):
+                # Here-document body starts after the next newline
+                self._heredocs.append((words[0].value, previous[2] == '<<-', len(tokens) - 1))
+            tokens.extend(words)
+        self.pos = pos
+
+    def _word(self) -> Word:
+        source = self.source
+        start = self.pos
+        value: List[str] = []
+        quoted = expansion = False
+        while True:
+            match = _WORD_PART_PATTERN.match(source, self.pos)
+            if not match:
+                break
+            kind = match.lastgroup
+            if kind == 'double':
+                self.pos = match.end()
+                quoted = True
+                value.append(self._double_quoted())
+                self.code.append('""')
+                continue
+            if kind == 'substitution':
+                text = self._substitution()
+                value.append(text)
+                self.code.append(text)
+                continue
+
+            self.pos = match.end()
+            if kind == 'plain':
+                value.append(match.group())
+                self.code.append(match.group())
+            elif kind == 'escape':
+                value.append(match.group()[1:])
+                self.code.append(match.group())
+            elif kind == 'variable':
+                expansion = True
+                value.append(match.group())
+                self.code.append(match.group())
+            else:
+                quoted = True
+                value.append(match.group('single'))
+                self.code.append("''")
+                if not match.group('closed'):
+                    self.unclosed_quote = "'"
+        return Word(source[start:self.pos], ''.join(value), quoted, expansion)
+
+    def _double_quoted(self) -> str:
+        """Scan "... after the opening quote; returns the unquoted value."""
+        source = self.source
+        value: List[str] = []
+        while self.pos < len(source):
+            match = _DOUBLE_QUOTED_PART_PATTERN.match(source, self.pos)
+            kind = match.lastgroup
+            if kind == 'substitution':
+                value.append(self._substitution())
+                continue
+            self.pos = match.end()
+            if kind == 'end':
+                return ''.join(value)
+            value.append(match.group(kind))
+        self.unclosed_quote = '"'
+        return ''.join(value)
+
+    def _substitution(self) -> str:
+        """Scan $(...) or `...`; the inner script is parsed as nested code."""
+        source = self.source
+        start = self.pos
+        if source[start] == '`':
+            match = _BACKTICK_PATTERN.match(source, start)
+            self.nested_sources.append(match.group('script'))
+            self.pos = match.end()
+        else:
+            depth = 0
+            end = start + 1
+            while True:
+                stop = _SUBSTITUTION_STOP_PATTERN.search(source, end)
+                if not stop:
+                    end = len(source)
+                    break
+                end = stop.start()
+                char = source[end]
+                if char == '(':
+                    depth += 1
+                elif char == ')':
+                    depth -= 1
+                    if depth == 0:
+                        break
+                elif char == '\\':
+                    end += 1
+                else:
+                    quoted = _QUOTED_SPAN_PATTERNS[char].match(source, end)
+                    if not quoted:
+                        end = len(source)
+                        break
+                    end = quoted.end() - 1
+                end += 1
+            self.nested_sources.append(source[start + 2:end])
+            self.pos = min(end + 1, len(source))
+        return source[start:self.pos]
+
+    def _read_heredocs(self):
+        """Take the bodies of here-documents opened on the previous line out of the code."""
+        for delimiter, strip_tabs, index in self._heredocs:
+            lines = []
+            while self.pos < len(self.source):
+                end = self.source.find('\n', self.pos)
+                end = len(self.source) if end == -1 else end
+                line = self.source[self.pos:end]
+                self.pos = min(end + 1, len(self.source))
+                if strip_tabs:
+                    line = line.lstrip('\t')
+                if line == delimiter:
+                    break
+                lines.append(line)
+            self.tokens[index] = self.tokens[index][:3] + ('\n'.join(lines),)
+        self._heredocs = []
+
+
+def _parse(tokens: List[object]) -> Tuple[ChainLink, ...]:
+    """Group tokens into commands, pipelines and chain links."""
+    chain: List[ChainLink] = []
+    pipeline: List[SimpleCommand] = []
+    words: List[Word] = []
+    redirects: List[Redirect] = []
+    operator: Optional[str] = None
+
+    def end_command():
+        if words or redirects:
+            pipeline.append(SimpleCommand(tuple(words), tuple(redirects)))
+        words.clear()
+        redirects.clear()
+
+    def end_pipeline(next_operator: Optional[str]):
+        nonlocal operator
+        end_command()
+        if pipeline:
+            chain.append(ChainLink(operator, Pipeline(tuple(pipeline))))
+            pipeline.clear()
+            operator = next_operator
+        elif next_operator in ('&&', '||'):
+            operator = next_operator
+
+    index = 0
+    while index < len(tokens):
+        token = tokens[index]
+        token_type = type(token)
+        if token_type is Word:
+            words.append(token)
+        elif token_type is tuple:
+            _, fd, op, body = token
+            target = tokens[index + 1] if index + 1 < len(tokens) else None
+            if isinstance(target, Word):
+                redirects.append(Redirect(fd, op, target.value, body))
+                index += 1
+            else:
+                redirects.append(Redirect(fd, op, None))
+        elif token in ('|', '|&'):
+            end_command()
+        elif token in ('(', ')'):
+            # Subshell boundaries are flattened: "a || (exit 0)" keeps its ||
+            if words or redirects or pipeline:
+                end_pipeline(None)
+        elif words or redirects or pipeline:
+            end_pipeline(token)
+        elif token in ('&&', '||'):
+            operator = token
+        index += 1
+
+    end_pipeline(None)
+    return tuple(chain)
+
+
+def _join(argv: Tuple[str, ...]) -> str:
+    """An argv as the shell command that runs it."""
+    return ' '.join(shlex.quote(arg) for arg in argv)
+
+
+def _skip_options(args: Tuple[str, ...], value_options: FrozenSet[str]) -> int:
+    """Index of the first operand in args, past options and their values."""
+    index = 0
+    while index < len(args) and args[index].startswith('-') and len(args[index]) > 1:
+        if args[index] == '--':
+            return index + 1
+        index += 2 if args[index] in value_options else 1
+    return index
+
+
+def _stdin_text(command: SimpleCommand, previous: Optional[SimpleCommand]) -> Optional[str]:
+    """Text fed to a command by a here-string, a here-document or `echo ... |`."""
+    for source in (command, previous):
+        if source is None:
+            continue
+        for redirect in source.redirects:
+            if redirect.op == '<<<':
+                return redirect.target
+            if redirect.op in ('<<', '<<-'):
+                return redirect.body
+    if previous is not None and previous.run_argv[:1] in (('echo',), ('printf',)):
+        args = previous.run_argv[1:]
+        if previous.run_argv[0] == 'echo':
+            args = args[_skip_options(args, frozenset()):]
+        return ' '.join(args)
+    return None
+
+
+def _command_scripts(argv: Tuple[str, ...], stdin: Optional[str]) -> Optional[List[str]]:
+    """
+    Scripts run by one of _ARGUMENT_RUNNERS, given its argv with wrappers
+    removed and the text fed to its stdin.
+
+    Returns None for commands that do not run code given to them, and an
+    empty list when the code could not be picked out.
+    """
+    name = argv[0].rsplit('/', 1)[-1]
+    args = argv[1:]
+
+    if name == 'eval':
+        return [' '.join(args)]
+    if name in _SHELLS:
+        index = 0
+        while index < len(args) and args[index].startswith(('-', '+')) and args[index] != '-':
+            arg = args[index]
+            if not arg.startswith('--') and 'c' in arg[1:]:
+                return list(args[index + 1:index + 2])
+            index += 2 if arg in ('-o', '+o', '-O', '+O') else 1
+        if index < len(args) and args[index] != '-':
+            return None  # runs a script file
+        return [stdin] if stdin is not None else []
+    if name == 'su':
+        for index, arg in enumerate(args):
+            if arg in ('-c', '--command'):
+                return list(args[index + 1:index + 2])
+            if arg.startswith('--command='):
+                return [arg[len('--command='):]]
+        return [stdin] if stdin is not None else None
+    if name == 'ssh':
+        index = _skip_options(args, _SSH_VALUE_OPTIONS)
+        if index + 1 < len(args):
+            return [' '.join(args[index + 1:])]
+        return [stdin] if stdin is not None else None
+    if name in ('docker', 'podman'):
+        if args[:1] != ('exec',):
+            return None
+        index = _skip_options(args[1:], _DOCKER_EXEC_VALUE_OPTIONS) + 1
+        return [_join(args[index + 1:])] if index + 1 < len(args) else []
+    if name == 'kubectl':
+        if args[:1] != ('exec',):
+            return None
+        if '--' in args:
+            command = args[args.index('--') + 1:]
+        else:
+            index = _skip_options(args[1:], _KUBECTL_EXEC_VALUE_OPTIONS) + 1
+            command = args[index + 1:]
+        return [_join(command)] if command else []
+    if name == 'watch':
+        index = _skip_options(args, _WATCH_VALUE_OPTIONS)
+        command = args[index:]
+        if not command:
+            return []
+        return [_join(command) if {'-x', '--exec'} & set(args[:index]) else ' '.join(command)]
+    if name == 'parallel':
+        index = _skip_options(args, _PARALLEL_VALUE_OPTIONS)
+        command = []
+        for arg in args[index:]:
+            if arg.startswith(':::'):
+                break
+            command.append(arg)
+        return [' '.join(command)] if command else []
+
+    # find: each -exec / -execdir / -ok / -okdir command, up to ; or +
+    scripts = []
+    command = None
+    for arg in args:
+        if command is not None:
+            if arg in (';', '+'):
+                scripts.append(_join(tuple(command)))
+                command = None
+            else:
+                command.append(arg)
+        elif arg in ('-exec', '-execdir', '-ok', '-okdir'):
+            command = []
+    if command:
+        scripts.append(_join(tuple(command)))
+    return scripts or None
+
+
+def _nested_scripts(chain: Tuple[ChainLink, ...]) -> Tuple[List[str], bool]:
+    """
+    Scripts run by the commands in chain (`sh -c`, `eval`, `ssh host ...`,
+    `find -exec`, `echo ... | sh`, ...), and whether some command runs a
+    quoted argument as code that could not be picked out.
+    """
+    scripts: List[str] = []
+    unparsed = False
+    for link in chain:
+        commands = link.pipeline.commands
+        for index, command in enumerate(commands):
+            argv = command.run_argv
+            if not argv or argv[0].rsplit('/', 1)[-1] not in _ARGUMENT_RUNNERS:
+                continue
+            found = _command_scripts(argv, _stdin_text(command, commands[index - 1] if index else None))
+            if found is None:
+                continue
+            scripts.extend(found)
+            if not found and any(word.quoted for word in command.words):
+                unparsed = True
+    return scripts, unparsed
+
+
+@lru_cache(maxsize=4096)
+def parse_command(command: str) -> ShellAST:
+    """
+    Parse a hook command.
+
+    Results are memoized per command string; the AST is immutable, so it can
+    be shared by every rule that inspects the command.
+    """
+    return _parse_script(command, 0)
+
+
+def _parse_script(command: str, depth: int) -> ShellAST:
+    """Parse a command found `depth` substitutions / sh -c / eval levels down."""
+    lexer = _Lexer(command)
+    lexer.run()
+    chain = _parse(lexer.tokens)
+    run_scripts, unparsed_scripts = _nested_scripts(chain)
+    scripts = [script for script in lexer.nested_sources + run_scripts if script.strip()]
+    too_deep = bool(scripts) and depth >= MAX_NESTING_DEPTH
+    nested = () if too_deep else tuple(_parse_script(script, depth + 1) for script in scripts)
+    code = ''.join(lexer.code)
+
+    names = set()
+    for link in chain:
+        for simple in link.pipeline.commands:
+            names.update(argv[0] for argv in _unwrap(simple.argv) if argv)
+    for ast in nested:
+        names.update(ast.command_names)
+        too_deep = too_deep or ast.too_deep
+        unparsed_scripts = unparsed_scripts or ast.unparsed_scripts
+
+    return ShellAST(command, chain, code, lexer.unclosed_quote, nested, frozenset(names),
+                    '\n'.join([code] + [ast.all_code for ast in nested]), too_deep,
+                    unparsed_scripts)
@@ -0,0 +1,264 @@
+"""
+Template Catalog - Process-wide index of hook templates.
+
+Parses templates.json once per process, indexes templates by event type
+and language, and precompiles every hook command into a substitution plan
+so generating a hook is a list join instead of a regex scan plus one
+str.replace per placeholder.
+
+The catalog is cached at module level keyed by the templates path and is
+rebuilt only when the file's mtime or size changes.
+"""
+
+import json
+import os
+import re
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+
+PLACEHOLDER_PATTERN = re.compile(r'\{\{(\w+)\}\}')
+
+
+def _copy_json(value):
+    """Copy a JSON-shaped value (much cheaper than copy.deepcopy)."""
+    if isinstance(value, dict):
+        return {k: _copy_json(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_copy_json(v) for v in value]
+    return value
+
+
+def resolve_variable(var_def: Dict, language: str) -> str:
+    """
+    Resolve a template variable to its value for a language.
+
+    Args:
+        var_def: Variable definition from templates.json
+        language: Requested language (or option key)
+
+    Returns:
+        Substitution value as a string
+    """
+    if 'options' in var_def:
+        # Language-specific option
+        options = var_def.get('options', {})
+        if language in options:
+            value = options[language]
+            # If value is a list, convert to JSON array string
+            if isinstance(value, list):
+                value = json.dumps(value)
+        else:
+            value = var_def.get('default', '')
+    elif 'patterns' in var_def:
+        # Language-specific pattern, falling back to the first one
+        patterns = var_def.get('patterns', {})
+        if language in patterns:
+            value = patterns[language]
+        elif patterns:
+            value = next(iter(patterns.values()))
+        else:
+            value = ''
+    else:
+        value = var_def.get('default', '')
+
+    return str(value)
+
+
+class SubstitutionPlan:
+    """
+    Precompiled substitution plan for one command template.
+
+    The command is split once into literal fragments and variable slots.
+    Placeholders without a variable definition stay in the literal
+    fragments, exactly as the old per-call substitution left them.
+    Rendered commands are memoized per language.
+    """
+
+    __slots__ = ('source', '_parts', '_slots', '_variables', '_rendered')
+
+    def __init__(self, source: str, variables: Dict):
+        self.source = source
+        self._variables = variables
+        self._rendered: Dict[str, str] = {}
+
+        pieces = PLACEHOLDER_PATTERN.split(source)
+        parts: List[str] = [pieces[0]]
+        slots: List[Tuple[int, str]] = []
+        for i in range(1, len(pieces), 2):
+            name = pieces[i]
+            if name in variables:
+                slots.append((len(parts), name))
+                parts.append('')
+                parts.append(pieces[i + 1])
+            else:
+                parts[-1] += f'{{{{{name}}}}}' + pieces[i + 1]
+
+        self._parts = parts
+        self._slots = slots
+
+    @property
+    def variable_names(self) -> List[str]:
+        """Variables referenced by this command, in order of appearance."""
+        return [name for _, name in self._slots]
+
+    def render(self, language: str) -> str:
+        """Render the command for a language."""
+        rendered = self._rendered.get(language)
+        if rendered is not None:
+            return rendered
+
+        if not self._slots:
+            rendered = self.source
+        else:
+            parts = list(self._parts)
+            values: Dict[str, str] = {}
+            for index, name in self._slots:
+                if name not in values:
+                    values[name] = resolve_variable(self._variables[name], language)
+                parts[index] = values[name]
+            rendered = ''.join(parts)
+
+        self._rendered[language] = rendered
+        return rendered
+
+
+@dataclass
+class CompiledTemplate:
+    """A template with its hook commands compiled into substitution plans."""
+    key: str
+    raw: Dict
+    event_type: str
+    languages: frozenset
+    hooks: List[Tuple[SubstitutionPlan, str, int]] = field(default_factory=list)
+
+    @classmethod
+    def compile(cls, key: str, raw: Dict) -> 'CompiledTemplate':
+        variables = raw.get('variables', {})
+        template_config = raw.get('template', {})
+
+        hooks = [
+            (
+                SubstitutionPlan(hook.get('command', ''), variables),
+                hook.get('type', 'command'),
+                hook.get('timeout', 60),
+            )
+            for hook in template_config.get('hooks', [])
+        ]
+
+        languages = set()
+        for var_def in variables.values():
+            languages.update(var_def.get('options', {}))
+            languages.update(var_def.get('patterns', {}))
+
+        return cls(
+            key=key,
+            raw=raw,
+            event_type=raw.get('metadata', {}).get('event_type', 'PostToolUse'),
+            languages=frozenset(languages),
+            hooks=hooks,
+        )
+
+    def render(self, language: str) -> Dict:
+        """
+        Build the hook configuration for a language.
+
+        Returns a fresh dict each call so callers may mutate it without
+        touching the cached template.
+        """
+        return {
+            'matcher': _copy_json(self.raw['template'].get('matcher', {})),
+            'hooks': [
+                {'type': hook_type, 'command': plan.render(language), 'timeout': timeout}
+                for plan, hook_type, timeout in self.hooks
+            ]
+        }
+
+
+class TemplateCatalog:
+    """Parsed templates.json with compiled templates and lookup indexes."""
+
+    def __init__(self, path: str, templates: Dict, signature: Tuple[int, int]):
+        self.path = path
+        self.templates = templates
+        self.signature = signature
+        self.compiled: Dict[str, CompiledTemplate] = {}
+        self.by_event: Dict[str, List[str]] = {}
+        self.by_language: Dict[str, List[str]] = {}
+
+        for key, raw in templates.items():
+            compiled = CompiledTemplate.compile(key, raw)
+            self.compiled[key] = compiled
+            self.by_event.setdefault(compiled.event_type, []).append(key)
+            for language in compiled.languages:
+                self.by_language.setdefault(language, []).append(key)
+
+    def get(self, key: str) -> Optional[CompiledTemplate]:
+        """Return the compiled template for a key, or None."""
+        return self.compiled.get(key)
+
+    def keys_for_event(self, event_type: str) -> List[str]:
+        """Template keys registered for an event type."""
+        return list(self.by_event.get(event_type, []))
+
+    def keys_for_language(self, language: str) -> List[str]:
+        """Template keys with a language-specific variant for a language."""
+        return list(self.by_language.get(language, []))
+
+
+_catalogs: Dict[str, TemplateCatalog] = {}
+_catalogs_lock = threading.Lock()
+
+
+def _file_signature(path: str) -> Tuple[int, int]:
+    st = os.stat(path)
+    return (st.st_mtime_ns, st.st_size)
+
+
+def get_catalog(path: str) -> TemplateCatalog:
+    """
+    Return the cached catalog for a templates file, reloading if it changed.
+
+    Args:
+        path: Path to templates.json
+
+    Returns:
+        TemplateCatalog for the current file contents
+
+    Raises:
+        FileNotFoundError: If the templates file does not exist
+        ValueError: If the templates file is not valid JSON
+    """
+    key = os.path.abspath(path)
+    try:
+        signature = _file_signature(key)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Templates file not found: {path}")
+
+    catalog = _catalogs.get(key)
+    if catalog is not None and catalog.signature == signature:
+        return catalog
+
+    with _catalogs_lock:
+        catalog = _catalogs.get(key)
+        if catalog is not None and catalog.signature == signature:
+            return catalog
+
+        try:
+            with open(key, 'r') as f:
+                templates = json.load(f)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Templates file not found: {path}")
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON in templates file: {str(e)}")
+
+        catalog = TemplateCatalog(key, templates, signature)
+        _catalogs[key] = catalog
+        return catalog
+
+
+def clear_catalog_cache() -> None:
+    """Drop all cached catalogs (next get_catalog call re-parses)."""
+    with _catalogs_lock:
+        _catalogs.clear()
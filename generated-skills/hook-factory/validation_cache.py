@@ -0,0 +1,123 @@
+"""
+Validation Cache - Persistent results for unchanged hooks.
+
+Stores serialized validation results in SQLite (default:
+.claude/.cache/hook-validation.sqlite3), keyed by the SHA-256 of the
+canonicalized hook config plus the validator ruleset version. Only edited
+hooks are validated again, and any change to the validation rules
+invalidates every entry.
+
+Entries not used for `max_age_days` are evicted, and the least recently
+used entries are dropped past `max_entries` or `max_bytes`.
+"""
+
+import json
+import time
+import hashlib
+import sqlite3
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+DEFAULT_CACHE_PATH = Path('.claude') / '.cache' / 'hook-validation.sqlite3'
+
+# _metadata fields that change on every generation but never affect validation
+VOLATILE_METADATA_KEYS = ('generated_at',)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    key TEXT PRIMARY KEY,
+    result TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created REAL NOT NULL,
+    used REAL NOT NULL
+)
+"""
+
+
+def canonicalize(hook_config: Dict[str, Any]) -> str:
+    """Stable JSON for a hook config: sorted keys, no whitespace, no volatile metadata."""
+    metadata = hook_config.get('_metadata')
+    if isinstance(metadata, dict):
+        hook_config = {**hook_config, '_metadata': {
+            key: value for key, value in metadata.items() if key not in VOLATILE_METADATA_KEYS
+        }}
+    return json.dumps(hook_config, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+
+
+class ValidationCache:
+    """SQLite-backed cache of validation results keyed by hook content."""
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, max_age_days: float = 30,
+                 max_entries: int = 10000, max_bytes: int = 64 * 1024 * 1024):
+        self.path = Path(path)
+        self.max_age_days = max_age_days
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Concurrent CI jobs may share the file: wait for locks instead of failing
+        self._conn = sqlite3.connect(str(self.path), timeout=30)
+        self._conn.execute(_SCHEMA)
+        self._conn.commit()
+
+    @staticmethod
+    def key_for(hook_config: Dict[str, Any], ruleset_version: str) -> str:
+        """SHA-256 of the canonical config and the ruleset it was validated with."""
+        payload = f"{ruleset_version}\n{canonicalize(hook_config)}"
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the stored result for `key`, or None on a miss."""
+        row = self._conn.execute('SELECT result FROM results WHERE key = ?', (key,)).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._conn.execute('UPDATE results SET used = ? WHERE key = ?', (time.time(), key))
+        return json.loads(row[0])
+
+    def put(self, key: str, result: Dict[str, Any]):
+        """Store a serialized result (committed by commit(), prune() or close())."""
+        payload = json.dumps(result)
+        now = time.time()
+        self._conn.execute(
+            'INSERT OR REPLACE INTO results (key, result, size, created, used) VALUES (?, ?, ?, ?, ?)',
+            (key, payload, len(payload), now, now)
+        )
+
+    def commit(self):
+        self._conn.commit()
+
+    def prune(self) -> int:
+        """Evict entries by age, then least recently used past the count and size limits."""
+        with self._conn:
+            removed = self._conn.execute(
+                'DELETE FROM results WHERE used < ?',
+                (time.time() - self.max_age_days * 86400,)
+            ).rowcount
+
+            total_bytes = 0
+            stale = []
+            rows = self._conn.execute('SELECT key, size FROM results ORDER BY used DESC')
+            for count, (key, size) in enumerate(rows, 1):
+                total_bytes += size
+                if count > self.max_entries or total_bytes > self.max_bytes:
+                    stale.append((key,))
+
+            self._conn.executemany('DELETE FROM results WHERE key = ?', stale)
+        return removed + len(stale)
+
+    def close(self):
+        """Commit pending results, apply the eviction limits and close the database."""
+        self.prune()
+        self._conn.close()
+
+    def __enter__(self) -> 'ValidationCache':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
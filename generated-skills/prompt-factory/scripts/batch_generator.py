@@ -8,34 +8,203 @@ Perfect for team-wide rollouts and standardization.
 Usage:
     python batch_generator.py --input team-prompts.csv --format xml --mode core --output-dir ./prompts/
     python batch_generator.py --input batch-config.json --format all --parallel 5 --output-dir ./output/
+    python batch_generator.py --input nightly.csv --format all --executor process --parallel 8 --output-dir ./output/
+    python batch_generator.py --input million-rows.jsonl --format xml --stream --output-dir ./output/
+    python batch_generator.py --input team.csv --format all --cache-dir .prompt-cache --output-dir ./output/
 """
 
+import re
 import csv
 import json
 import argparse
+import itertools
 import concurrent.futures
+from collections import deque
+from functools import partial
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable, Iterator
 from datetime import datetime
 from generate_prompt import PromptGenerator, create_markdown_document
+from prompt_cache import PromptCache, file_matches
+
+
+EXECUTOR_TYPES = ('thread', 'process')
+
+# Input suffixes read line-by-line as JSON Lines
+JSONL_SUFFIXES = ('.jsonl', '.ndjson')
+
+# Process chunk size when the batch length is unknown (streamed input)
+DEFAULT_STREAM_CHUNK_SIZE = 16
+
+# Runs that become one '-' in output filenames
+_SLUG_SEPARATORS = re.compile(r'[\s/\\]+')
+
+# Worker-local generator, created once per process by _init_process_worker
+_worker_generator = None
+
+
+def _init_process_worker():
+    """Create the PromptGenerator owned by a process-pool worker."""
+    global _worker_generator
+    _worker_generator = PromptGenerator()
+
+
+def _generate_chunk_in_worker(configs: List[Dict[str, Any]], format_type: str, mode: str,
+                              output_dir: Path, cache: PromptCache = None) -> List[Dict[str, Any]]:
+    """Process-pool entry point: generate a chunk of configs with the worker's generator."""
+    return [generate_to_file(_worker_generator, config, format_type, mode, output_dir, cache)
+            for config in configs]
+
+
+def _chunked(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """Lazily split an iterable into lists of at most `size` items."""
+    iterator = iter(items)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def generate_to_file(generator: PromptGenerator, config: Dict[str, Any], format_type: str,
+                     mode: str, output_dir: Path, cache: PromptCache = None) -> Dict[str, Any]:
+    """
+    Generate a single prompt from configuration and write it to output_dir.
+
+    With a cache, unchanged configs reuse the stored document and the output
+    file is only rewritten when its content differs.
+    """
+    try:
+        # Rows may start from a preset and override individual answers
+        config = generator.apply_preset(config)
+
+        # Extract metadata
+        name = config.get('name', f"prompt-{datetime.now().timestamp()}")
+
+        # Create output filename
+        # (preset roles such as "HR Manager / HR Business Partner" contain slashes)
+        role_slug = _SLUG_SEPARATORS.sub('-', config.get('role', 'assistant').lower())
+        output_file = output_dir / f"{name}-{role_slug}.md"
+
+        cache_key = cache.key_for(config, format_type, mode) if cache else None
+        entry = cache.get(cache_key) if cache else None
+        cached = entry is not None
+
+        if entry is None:
+            print(f"📝 Generating: {name}")
+
+            # Generate prompt
+            result = generator.generate(config, format_type, mode)
+
+            # Create markdown document
+            markdown_doc = create_markdown_document(result, mode)
+            validation = result['validation']
+
+            if cache:
+                entry = cache.put(cache_key, result, markdown_doc)
+        else:
+            markdown_doc = entry['document']
+            validation = entry['validation']
+
+        # Write to file (skipped when a cached document is already on disk)
+        if not (entry and file_matches(output_file, entry['document_sha256'])):
+            output_file.write_text(markdown_doc)
+
+        # Validation summary
+        validation_summary = {
+            fmt: val['passed']
+            for fmt, val in validation.items()
+        }
+
+        return {
+            'name': name,
+            'status': 'success',
+            'cached': cached,
+            'output_file': str(output_file),
+            'validation': validation_summary
+        }
+
+    except Exception as e:
+        return {
+            'name': config.get('name', 'unknown'),
+            'status': 'error',
+            'error': str(e)
+        }
 
 
 class BatchGenerator:
     """Generate multiple prompts in batch mode."""
 
-    def __init__(self, parallel_workers: int = 3):
+    def __init__(self, parallel_workers: int = 3, executor: str = 'thread',
+                 chunk_size: int = None, max_pending: int = None,
+                 cache: PromptCache = None):
+        """
+        Args:
+            parallel_workers: Number of pool workers
+            executor: 'thread' (I/O friendly, default) or 'process' (CPU-bound
+                generation sharded across cores)
+            chunk_size: Configs sent to a process worker per round trip
+                (None = derived from batch size and worker count)
+            max_pending: Upper bound on queued tasks, which bounds memory when
+                configs are streamed (None = 4 per worker)
+            cache: Optional PromptCache so unchanged configs skip generation
+        """
+        if executor not in EXECUTOR_TYPES:
+            raise ValueError(f"Unknown executor: {executor} (use one of {', '.join(EXECUTOR_TYPES)})")
+
         self.parallel_workers = parallel_workers
+        self.executor = executor
+        self.chunk_size = chunk_size
+        self.max_pending = max_pending or parallel_workers * 4
+        self.cache = cache
         self.generator = PromptGenerator()
         self.results = []
 
     def load_csv_batch(self, filepath: str) -> List[Dict[str, Any]]:
         """Load batch configuration from CSV file."""
-        configs = []
+        return list(self.iter_csv_batch(filepath))
+
+    def iter_csv_batch(self, filepath: str) -> Iterator[Dict[str, Any]]:
+        """Yield batch configurations from a CSV file one row at a time."""
+        with open(filepath, 'r', newline='') as f:
+            for row in csv.DictReader(f):
+                yield dict(row)
+
+    def load_jsonl_batch(self, filepath: str) -> List[Dict[str, Any]]:
+        """Load batch configuration from a JSON Lines file."""
+        return list(self.iter_jsonl_batch(filepath))
+
+    def iter_jsonl_batch(self, filepath: str) -> Iterator[Dict[str, Any]]:
+        """Yield batch configurations from a JSON Lines file (one object per line)."""
         with open(filepath, 'r') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                configs.append(dict(row))
-        return configs
+            for line_number, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    config = json.loads(line)
+                except json.JSONDecodeError as e:
+                    raise ValueError(f"Invalid JSON on line {line_number}: {e}") from e
+                if not isinstance(config, dict):
+                    raise ValueError(f"Line {line_number} must be a JSON object")
+                yield config
+
+    def iter_batch(self, filepath: str) -> Iterator[Dict[str, Any]]:
+        """
+        Yield batch configurations lazily, choosing the reader by file suffix.
+
+        CSV and JSON Lines are read incrementally; a plain JSON document has to
+        be parsed whole before its configs can be yielded.
+        """
+        suffix = Path(filepath).suffix
+        if suffix == '.csv':
+            return self.iter_csv_batch(filepath)
+        elif suffix in JSONL_SUFFIXES:
+            return self.iter_jsonl_batch(filepath)
+        elif suffix == '.json':
+            return iter(self.load_json_batch(filepath))
+        else:
+            raise ValueError(f"Unsupported file format: {suffix} (use .csv, .json or .jsonl)")
 
     def load_json_batch(self, filepath: str) -> List[Dict[str, Any]]:
         """Load batch configuration from JSON file."""
@@ -53,44 +222,7 @@ class BatchGenerator:
     def generate_single(self, config: Dict[str, Any], format_type: str, mode: str,
                        output_dir: Path) -> Dict[str, Any]:
         """Generate a single prompt from configuration."""
-        try:
-            # Extract metadata
-            name = config.get('name', f"prompt-{datetime.now().timestamp()}")
-
-            print(f"📝 Generating: {name}")
-
-            # Generate prompt
-            result = self.generator.generate(config, format_type, mode)
-
-            # Create output filename
-            role_slug = config.get('role', 'assistant').lower().replace(' ', '-')
-            output_file = output_dir / f"{name}-{role_slug}.md"
-
-            # Create markdown document
-            markdown_doc = create_markdown_document(result, mode)
-
-            # Write to file
-            output_file.write_text(markdown_doc)
-
-            # Validation summary
-            validation_summary = {
-                fmt: val['passed']
-                for fmt, val in result['validation'].items()
-            }
-
-            return {
-                'name': name,
-                'status': 'success',
-                'output_file': str(output_file),
-                'validation': validation_summary
-            }
-
-        except Exception as e:
-            return {
-                'name': config.get('name', 'unknown'),
-                'status': 'error',
-                'error': str(e)
-            }
+        return generate_to_file(self.generator, config, format_type, mode, output_dir, self.cache)
 
     def generate_batch(self, configs: List[Dict[str, Any]], format_type: str,
                       mode: str, output_dir: Path) -> Dict[str, Any]:
@@ -99,37 +231,26 @@ class BatchGenerator:
         print(f"   Prompts: {len(configs)}")
         print(f"   Format: {format_type}")
         print(f"   Mode: {mode}")
-        print(f"   Workers: {self.parallel_workers}")
+        print(f"   Workers: {self.parallel_workers} ({self.executor})")
         print(f"   Output: {output_dir}")
         print()
 
-        # Ensure output directory exists
-        output_dir.mkdir(parents=True, exist_ok=True)
-
         # Generate prompts in parallel
-        with concurrent.futures.ThreadPoolExecutor(max_workers=self.parallel_workers) as executor:
-            futures = {
-                executor.submit(self.generate_single, config, format_type, mode, output_dir): config
-                for config in configs
-            }
-
-            results = []
-            for future in concurrent.futures.as_completed(futures):
-                result = future.result()
-                results.append(result)
-
-                # Print progress
-                status_emoji = "✅" if result['status'] == 'success' else "❌"
-                print(f"{status_emoji} {result['name']}: {result['status']}")
+        results = []
+        for result in self.generate_stream(configs, format_type, mode, output_dir):
+            results.append(result)
+            _print_progress(result)
 
         # Generate summary
         successful = sum(1 for r in results if r['status'] == 'success')
         failed = len(results) - successful
+        self._prune_cache()
 
         summary = {
             'total': len(configs),
             'successful': successful,
             'failed': failed,
+            'cached': sum(1 for r in results if r.get('cached')),
             'output_dir': str(output_dir),
             'generated_at': datetime.now().isoformat(),
             'results': results
@@ -137,6 +258,124 @@ class BatchGenerator:
 
         return summary
 
+    def generate_batch_streaming(self, configs: Iterable[Dict[str, Any]], format_type: str,
+                                 mode: str, output_dir: Path) -> Dict[str, Any]:
+        """
+        Generate prompts from a lazily read config stream in constant memory.
+
+        Only counts and failed results are kept, so the summary does not grow
+        with the number of successful prompts.
+        """
+        print(f"\n🚀 Starting streaming batch generation:")
+        print(f"   Format: {format_type}")
+        print(f"   Mode: {mode}")
+        print(f"   Workers: {self.parallel_workers} ({self.executor})")
+        print(f"   Output: {output_dir}")
+        print()
+
+        total = 0
+        successful = 0
+        cached = 0
+        failures = []
+        for result in self.generate_stream(configs, format_type, mode, output_dir):
+            total += 1
+            if result['status'] == 'success':
+                successful += 1
+                cached += result['cached']
+            else:
+                failures.append(result)
+            _print_progress(result)
+
+        self._prune_cache()
+
+        return {
+            'total': total,
+            'successful': successful,
+            'failed': len(failures),
+            'cached': cached,
+            'output_dir': str(output_dir),
+            'generated_at': datetime.now().isoformat(),
+            'streamed': True,
+            'results': failures
+        }
+
+    def generate_stream(self, configs: Iterable[Dict[str, Any]], format_type: str,
+                        mode: str, output_dir: Path) -> Iterator[Dict[str, Any]]:
+        """
+        Yield per-prompt results while configs are pulled from `configs` on demand.
+
+        At most `max_pending` tasks are queued at any time, so an iterator over
+        a huge input file is never materialised. Each document is written by
+        its worker as soon as it is generated.
+        """
+        # Ensure output directory exists
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        if self.executor == 'process':
+            return self._generate_in_processes(configs, format_type, mode, output_dir)
+        return self._generate_in_threads(configs, format_type, mode, output_dir)
+
+    def _generate_in_threads(self, configs: Iterable[Dict[str, Any]], format_type: str,
+                             mode: str, output_dir: Path) -> Iterator[Dict[str, Any]]:
+        """Yield results as thread-pool workers complete them."""
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.parallel_workers) as executor:
+            pending = set()
+            for config in configs:
+                if len(pending) >= self.max_pending:
+                    done, pending = concurrent.futures.wait(
+                        pending, return_when=concurrent.futures.FIRST_COMPLETED)
+                    for future in done:
+                        yield future.result()
+                pending.add(executor.submit(self.generate_single, config, format_type,
+                                            mode, output_dir))
+
+            for future in concurrent.futures.as_completed(pending):
+                yield future.result()
+
+    def _generate_in_processes(self, configs: Iterable[Dict[str, Any]], format_type: str,
+                               mode: str, output_dir: Path) -> Iterator[Dict[str, Any]]:
+        """
+        Yield results from a process pool in input order.
+
+        Configs are submitted in chunks so each worker amortises pickling over
+        several prompts; every worker builds its own PromptGenerator once.
+        """
+        chunk_size = self.chunk_size or self._default_chunk_size(configs)
+        max_pending_chunks = max(self.parallel_workers, self.max_pending // chunk_size)
+        worker = partial(_generate_chunk_in_worker, format_type=format_type, mode=mode,
+                         output_dir=output_dir, cache=self.cache)
+
+        with concurrent.futures.ProcessPoolExecutor(max_workers=self.parallel_workers,
+                                                    initializer=_init_process_worker) as executor:
+            pending = deque()
+            for chunk in _chunked(configs, chunk_size):
+                if len(pending) >= max_pending_chunks:
+                    yield from pending.popleft().result()
+                pending.append(executor.submit(worker, chunk))
+
+            while pending:
+                yield from pending.popleft().result()
+
+    def _prune_cache(self):
+        """Apply cache size limits once per batch rather than per prompt."""
+        if self.cache:
+            evicted = self.cache.prune()
+            if evicted:
+                print(f"🧹 Evicted {evicted} cached prompt(s)")
+
+    def _default_chunk_size(self, configs: Iterable[Dict[str, Any]]) -> int:
+        """Aim for ~4 chunks per worker, capped so progress stays visible."""
+        if not hasattr(configs, '__len__'):
+            return DEFAULT_STREAM_CHUNK_SIZE
+        return max(1, min(64, len(configs) // (self.parallel_workers * 4)))
+
+
+def _print_progress(result: Dict[str, Any]):
+    """Print a one-line status for a finished prompt."""
+    status_emoji = "✅" if result['status'] == 'success' else "❌"
+    suffix = " (cached)" if result.get('cached') else ""
+    print(f"{status_emoji} {result['name']}: {result['status']}{suffix}")
+
 
 def create_summary_report(summary: Dict[str, Any], output_dir: Path):
     """Create a summary report of batch generation."""
@@ -150,9 +389,10 @@ def create_summary_report(summary: Dict[str, Any], output_dir: Path):
 - **Total Prompts:** {summary['total']}
 - **Successful:** {summary['successful']} ✅
 - **Failed:** {summary['failed']} ❌
+- **From Cache:** {summary.get('cached', 0)}
 - **Success Rate:** {(summary['successful'] / summary['total'] * 100):.1f}%
 
-## Details
+## {'Failures' if summary.get('streamed') else 'Details'}
 
 """
 
@@ -197,17 +437,34 @@ JSON Format Example:
     ]
   }
 
+Preset Rows (start from templates/presets/, non-empty columns override):
+  name,preset,tech_stack
+  platform-api,fullstack-engineer,"Go,PostgreSQL"
+
+JSONL Format Example (one config per line, best for --stream):
+  {"name": "backend-api", "role": "Senior Backend Engineer", ...}
+  {"name": "frontend-ui", "role": "Frontend Engineer", ...}
+
 Examples:
   # From CSV
   python batch_generator.py --input team.csv --format xml --mode core --output-dir ./prompts/
 
   # From JSON with parallel processing
   python batch_generator.py --input batch.json --format all --parallel 10 --output-dir ./output/
+
+  # Large batches: shard across CPU cores
+  python batch_generator.py --input nightly.csv --format all --executor process --parallel 8 --output-dir ./output/
+
+  # Million-row batches in constant memory
+  python batch_generator.py --input million-rows.jsonl --format xml --stream --output-dir ./output/
+
+  # Incremental reruns: only changed rows are regenerated
+  python batch_generator.py --input team.csv --format all --cache-dir .prompt-cache --output-dir ./output/
 """
     )
 
     parser.add_argument('--input', required=True,
-                       help='Input CSV or JSON file with batch configuration')
+                       help='Input CSV, JSON or JSONL file with batch configuration')
     parser.add_argument('--format', required=True,
                        choices=['xml', 'claude', 'chatgpt', 'gemini', 'all'],
                        help='Output format for all prompts')
@@ -217,6 +474,16 @@ Examples:
                        help='Output directory for generated prompts')
     parser.add_argument('--parallel', type=int, default=3,
                        help='Number of parallel workers (default: 3)')
+    parser.add_argument('--executor', default='thread', choices=EXECUTOR_TYPES,
+                       help='Worker pool type: thread, or process for CPU-bound batches (default: thread)')
+    parser.add_argument('--chunk-size', type=int,
+                       help='Configs per process-worker task (default: auto)')
+    parser.add_argument('--stream', action='store_true',
+                       help='Read configs lazily and keep only failures in memory (for very large batches)')
+    parser.add_argument('--cache-dir',
+                       help='Reuse generated prompts for unchanged configs from this cache directory')
+    parser.add_argument('--cache-max-mb', type=int, default=256,
+                       help='Evict least-recently-used cache entries above this size (default: 256)')
     parser.add_argument('--report', action='store_true',
                        help='Generate summary report (default: True)')
 
@@ -228,22 +495,34 @@ Examples:
         parser.error(f"Input file not found: {args.input}")
 
     # Load configurations
-    batch_gen = BatchGenerator(parallel_workers=args.parallel)
-
-    if input_path.suffix == '.csv':
-        print(f"📄 Loading CSV batch configuration...")
-        configs = batch_gen.load_csv_batch(args.input)
-    elif input_path.suffix == '.json':
-        print(f"📄 Loading JSON batch configuration...")
-        configs = batch_gen.load_json_batch(args.input)
+    cache = PromptCache(args.cache_dir, max_bytes=args.cache_max_mb * 1024 * 1024) if args.cache_dir else None
+    batch_gen = BatchGenerator(parallel_workers=args.parallel, executor=args.executor,
+                               chunk_size=args.chunk_size, cache=cache)
+    output_dir = Path(args.output_dir)
+
+    if input_path.suffix not in ('.csv', '.json') + JSONL_SUFFIXES:
+        parser.error(f"Unsupported file format: {input_path.suffix} (use .csv, .json or .jsonl)")
+
+    if args.stream:
+        # Stream configs straight from disk into the worker queue
+        print(f"📄 Streaming batch configuration from {input_path.name}...")
+        configs = batch_gen.iter_batch(args.input)
+        summary = batch_gen.generate_batch_streaming(configs, args.format, args.mode, output_dir)
     else:
-        parser.error(f"Unsupported file format: {input_path.suffix} (use .csv or .json)")
+        if input_path.suffix == '.csv':
+            print(f"📄 Loading CSV batch configuration...")
+            configs = batch_gen.load_csv_batch(args.input)
+        elif input_path.suffix == '.json':
+            print(f"📄 Loading JSON batch configuration...")
+            configs = batch_gen.load_json_batch(args.input)
+        else:
+            print(f"📄 Loading JSONL batch configuration...")
+            configs = batch_gen.load_jsonl_batch(args.input)
 
-    print(f"✓ Loaded {len(configs)} prompt configurations")
+        print(f"✓ Loaded {len(configs)} prompt configurations")
 
-    # Generate batch
-    output_dir = Path(args.output_dir)
-    summary = batch_gen.generate_batch(configs, args.format, args.mode, output_dir)
+        # Generate batch
+        summary = batch_gen.generate_batch(configs, args.format, args.mode, output_dir)
 
     # Print summary
     print(f"\n{'=' * 60}")
@@ -252,6 +531,8 @@ Examples:
     print(f"Total: {summary['total']}")
     print(f"✅ Successful: {summary['successful']}")
     print(f"❌ Failed: {summary['failed']}")
+    if cache:
+        print(f"♻️  From cache: {summary['cached']}")
     print(f"📁 Output: {summary['output_dir']}")
 
     # Generate report
@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""
+Prompt Suite - Benchmarks
+
+Micro-benchmarks for the prompt-factory hot paths.
+
+Usage:
+    python benchmark.py xml
+    python benchmark.py xml --sizes 64 256 1024 --legacy
+    python benchmark.py templates --save before.json
+    python benchmark.py templates --compare before.json
+    python benchmark.py generator --configs 2000 --tokenizer approx bpe
+"""
+
+import re
+import json
+import time
+import argparse
+import tracemalloc
+import multiprocessing
+from typing import Any, Callable, Dict, List, Optional
+
+from generate_prompt import PromptGenerator
+
+# gate_engine and token_counter are imported by the suites that need them, so
+# `templates --save` also runs on trees that predate those modules
+
+
+# Pre-engine checks, kept only so the benchmark can show the difference
+_LEGACY_OPENING = re.compile(r'<([^/][^>]*)>')
+_LEGACY_CLOSING = re.compile(r'</([^>]+)>')
+_LEGACY_EMPTY = re.compile(r'<([^>]+)>\s*</\1>')
+
+# The legacy checks are quadratic on adversarial input (minutes at 256KB), so
+# each legacy measurement runs in a child process with this time budget
+LEGACY_TIMEOUT = 60.0
+
+
+def _legacy_xml_checks(prompt: str):
+    len(_LEGACY_OPENING.findall(prompt)) == len(_LEGACY_CLOSING.findall(prompt))
+    _LEGACY_EMPTY.search(prompt)
+
+
+def _engine_xml_checks(prompt: str):
+    from gate_engine import PromptScan
+    scan = PromptScan(prompt)
+    scan.xml_error
+    scan.empty_tags
+
+
+def _generated_prompt(size_kb: int) -> str:
+    """A well-formed XML prompt of roughly size_kb, built from real generator output."""
+    xml = PromptGenerator().generate_xml_format({'role': 'Benchmark Engineer', 'domain': 'Testing'})
+    inner = xml[len('<mega_prompt>'):-len('</mega_prompt>')]
+    repeats = max(1, size_kb * 1024 // len(inner))
+    return '<mega_prompt>' + inner * repeats + '</mega_prompt>'
+
+
+def _adversarial_prompt(size_kb: int) -> str:
+    """Unterminated '<' runs that force the legacy backreference regex to rescan."""
+    unit = '<section a '
+    return unit * (size_kb * 1024 // len(unit))
+
+
+def _time_per_kb(check: Callable[[str], None], prompt: str, repeat: int) -> float:
+    """Best-of-`repeat` time in microseconds per KB of prompt."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        check(prompt)
+        best = min(best, time.perf_counter() - start)
+    return best * 1e6 / (len(prompt) / 1024)
+
+
+def _time_in_child(check: Callable[[str], None], prompt: str, repeat: int, conn):
+    conn.send(_time_per_kb(check, prompt, repeat))
+    conn.close()
+
+
+def _time_per_kb_bounded(check: Callable[[str], None], prompt: str, repeat: int,
+                         timeout: float) -> Optional[float]:
+    """_time_per_kb in a child process; None if it exceeds `timeout` seconds."""
+    receiver, sender = multiprocessing.Pipe(duplex=False)
+    child = multiprocessing.Process(target=_time_in_child, args=(check, prompt, repeat, sender))
+    child.start()
+    sender.close()
+
+    result = receiver.recv() if receiver.poll(timeout) else None
+    child.terminate()
+    child.join()
+    return result
+
+
+def benchmark_xml(sizes: List[int], repeat: int, legacy: bool, legacy_timeout: float):
+    """Print per-KB cost of XML structure + empty-section checks by prompt size."""
+    header = f"{'input':<12} {'size':>8} {'engine us/KB':>14}"
+    if legacy:
+        header += f" {'legacy us/KB':>14}"
+    print(header)
+    print('-' * len(header))
+
+    for label, build in (('generated', _generated_prompt), ('adversarial', _adversarial_prompt)):
+        for size_kb in sizes:
+            prompt = build(size_kb)
+            row = f"{label:<12} {size_kb:>6}KB {_time_per_kb(_engine_xml_checks, prompt, repeat):>14.2f}"
+            if legacy:
+                legacy_us = _time_per_kb_bounded(_legacy_xml_checks, prompt, repeat, legacy_timeout)
+                if legacy_us is None:
+                    row += f" {f'>{legacy_timeout:g}s':>14}"
+                else:
+                    row += f" {legacy_us:>14.2f}"
+            print(row)
+
+
+# Questionnaire answers per mode: core asks the essentials, advanced fills every field
+TEMPLATE_RESPONSES = {
+    'core': {
+        'role': 'Backend Engineer',
+        'domain': 'Web APIs',
+        'goal': 'design reliable REST services',
+        'output_type': 'code',
+    },
+    'advanced': {
+        'role': 'Senior Full-Stack Engineer',
+        'role_context': 'distributed systems and developer tooling',
+        'domain': 'SaaS platforms',
+        'goal': 'ship production-ready features end to end',
+        'output_type': 'code',
+        'success_criteria': 'Tested, documented, deployable code',
+        'tech_stack': 'Python, FastAPI, React, PostgreSQL',
+        'constraints': 'OWASP Top 10, WCAG 2.1 AA, p95 latency < 200ms',
+        'must_avoid': 'deprecated APIs, unpinned dependencies',
+        'target_audience': 'engineering team',
+        'tone': 'direct',
+        'detail_level': 'comprehensive',
+        'format_preference': 'structured',
+    },
+}
+
+TEMPLATE_FORMATS = ('xml', 'claude', 'chatgpt', 'gemini')
+
+
+def _measure_render(render: Callable[[], str], repeat: int) -> Dict[str, float]:
+    """Best-of-`repeat` time and tracemalloc peak allocation for one render."""
+    render()  # warm the section memo so only rendering is measured
+
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        render()
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    render()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return {'us': best * 1e6, 'peak_kb': peak / 1024}
+
+
+def benchmark_templates(repeat: int, save: Optional[str], compare: Optional[str]):
+    """Print per-render time and peak allocation for every format in both modes."""
+    generator = PromptGenerator()
+    results: Dict[str, Dict[str, Any]] = {}
+    for mode, responses in TEMPLATE_RESPONSES.items():
+        for fmt in TEMPLATE_FORMATS:
+            renderer = getattr(generator, f'generate_{fmt}_format')
+            results[f'{fmt}/{mode}'] = _measure_render(lambda: renderer(responses), repeat)
+
+    baseline = {}
+    if compare:
+        with open(compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+
+    header = f"{'format/mode':<18} {'us/render':>10} {'peak KB':>9}"
+    if baseline:
+        header += f" {'before us':>10} {'before KB':>10} {'speedup':>8}"
+    print(header)
+    print('-' * len(header))
+
+    for key, row in results.items():
+        line = f"{key:<18} {row['us']:>10.2f} {row['peak_kb']:>9.2f}"
+        old = baseline.get(key)
+        if old:
+            line += f" {old['us']:>10.2f} {old['peak_kb']:>10.2f} {old['us'] / row['us']:>7.2f}x"
+        print(line)
+
+    if save:
+        with open(save, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"\n💾 Saved results to: {save}")
+
+
+def _unique_configs(count: int) -> List[Dict[str, Any]]:
+    """Distinct questionnaire answers, so no shared-section or count memo is reused."""
+    output_types = ('code', 'analysis', 'content', 'research', 'automation')
+    return [
+        {
+            'role': f'Engineer {i}',
+            'domain': f'Domain {i}',
+            'goal': f'deliver project {i}',
+            'output_type': output_types[i % len(output_types)],
+        }
+        for i in range(count)
+    ]
+
+
+def benchmark_generator(configs: int, repeat: int, tokenizers: List[str],
+                        save: Optional[str], compare: Optional[str]):
+    """Print the cost of generate(config, 'all') incl. all gate checks, per tokenizer."""
+    responses = _unique_configs(configs)
+
+    results: Dict[str, Dict[str, float]] = {}
+    for tokenizer in tokenizers:
+        best = float('inf')
+        for _ in range(repeat):
+            # Fresh generator per round; distinct configs keep memos cold
+            generator = PromptGenerator(tokenizer=tokenizer)
+            start = time.perf_counter()
+            for config in responses:
+                generator.generate(config, 'all', 'core')
+            best = min(best, time.perf_counter() - start)
+        results[f'all/{tokenizer}'] = {'us': best * 1e6 / configs}
+
+    baseline = {}
+    if compare:
+        with open(compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+
+    header = f"{'format/tokenizer':<18} {'us/config':>10}"
+    if baseline:
+        header += f" {'before us':>10} {'speedup':>8}"
+    print(header)
+    print('-' * len(header))
+
+    for key, row in results.items():
+        line = f"{key:<18} {row['us']:>10.1f}"
+        old = baseline.get(key)
+        if old:
+            line += f" {old['us']:>10.1f} {old['us'] / row['us']:>7.2f}x"
+        print(line)
+
+    if save:
+        with open(save, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"\n💾 Saved results to: {save}")
+
+
+def main():
+    """Main CLI entry point."""
+    parser = argparse.ArgumentParser(
+        description='Benchmark prompt-factory hot paths',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Suites:
+  xml        XML nesting + empty-section checks; per-KB cost should stay flat up to 1 MB
+  templates  Per-render time and allocations for all 4 formats in core and advanced mode
+  generator  generate(config, 'all') incl. quality gates over distinct configs, per tokenizer
+
+Examples:
+  python benchmark.py xml
+  python benchmark.py xml --sizes 16 64 256 1024 --legacy
+
+  # Before/after: save on the old tree, compare on the new one
+  python benchmark.py templates --save before.json
+  python benchmark.py templates --compare before.json
+
+  # Gate cost of the default counter vs. the opt-in BPE estimator
+  python benchmark.py generator --configs 2000 --tokenizer approx bpe
+"""
+    )
+
+    parser.add_argument('suite', choices=['xml', 'templates', 'generator'], help='Benchmark suite to run')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[16, 64, 256, 1024],
+                       help='Prompt sizes in KB (default: 16 64 256 1024)')
+    parser.add_argument('--repeat', type=int, default=5,
+                       help='Repetitions per measurement, best time is reported (default: 5)')
+    parser.add_argument('--legacy', action='store_true',
+                       help='Also time the pre-engine regex checks at every size')
+    parser.add_argument('--legacy-timeout', type=float, default=LEGACY_TIMEOUT,
+                       help=f'Seconds allowed per legacy measurement (default: {LEGACY_TIMEOUT:g})')
+    parser.add_argument('--configs', type=int, default=2000,
+                       help='generator: number of distinct configs (default: 2000)')
+    parser.add_argument('--tokenizer', nargs='+',
+                       help='generator: token counters to time (default: the default counter)')
+    parser.add_argument('--save', help='templates/generator: write results to a JSON file')
+    parser.add_argument('--compare', help='templates/generator: show results from a saved JSON file alongside')
+
+    args = parser.parse_args()
+
+    if args.suite == 'xml':
+        benchmark_xml(args.sizes, args.repeat, args.legacy, args.legacy_timeout)
+    elif args.suite == 'templates':
+        benchmark_templates(args.repeat, args.save, args.compare)
+    elif args.suite == 'generator':
+        from token_counter import DEFAULT_COUNTER, available_counters
+        tokenizers = args.tokenizer or [DEFAULT_COUNTER]
+        unknown = [name for name in tokenizers if name not in available_counters()]
+        if unknown:
+            parser.error(f"unknown tokenizer(s): {', '.join(unknown)} "
+                         f"(choose from {', '.join(available_counters())})")
+        benchmark_generator(args.configs, args.repeat, tokenizers, args.save, args.compare)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+Prompt Suite - Gate Engine
+
+Shared single-scan engine behind the 7 quality gates.
+PromptGenerator.validate_prompt and PromptValidator.validate both read their
+gate inputs from one PromptScan instead of re-scanning the prompt per gate.
+
+Usage:
+    from gate_engine import scan_prompt
+
+    scan = scan_prompt(prompt)
+    scan.count('example'), scan.token_count, scan.placeholders
+
+Features (lowered text, tags, token count, placeholders, term counts, ...) are computed
+lazily with precompiled patterns and memoized on the scan.
+"""
+
+import re
+from itertools import islice
+from functools import cached_property
+from typing import Dict, List, Optional, Tuple
+from token_counter import DEFAULT_COUNTER, count_tokens
+
+
+# Indicator vocabularies used by the workflow, best-practice and example gates
+WORKFLOW_INDICATORS = (
+    'workflow', 'process', 'approach', 'method', 'steps',
+    'phase', 'stage', '1.', '2.', '3.', 'first', 'then', 'next'
+)
+
+BEST_PRACTICE_INDICATORS = (
+    'best practice', 'guideline', 'standard', 'recommendation',
+    'should', 'must', 'avoid', 'ensure', 'always', 'never',
+    'principle', 'rule', 'convention'
+)
+
+EXAMPLE_PHRASES = ('example', 'for instance', 'for example', 'such as')
+
+# The single tokenizer pass behind every tag feature. A tag body never spans
+# another '<', so each '<' starts at most one scan that stops at the next angle
+# bracket: tokenizing is linear in the prompt length. The lookahead captures
+# '</body>' when an opening tag is followed, after whitespace only, by its own
+# closing tag (an empty element).
+_TAG_PATTERN = re.compile(r'<(/?)([^<>]*)>(?=(\s*</\2>)|)')
+
+# Tag bodies that are elements checked for nesting; bodies such as ' 8000' or
+# '=' are prose (the name must end at whitespace, '/' or the end of the body)
+_ELEMENT_PATTERN = re.compile(r'([A-Za-z_][\w.:-]*)(\s[^<>]*|/)?')
+
+# HTML elements that never take a closing tag
+_VOID_ELEMENTS = frozenset((
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input',
+    'link', 'meta', 'source', 'track', 'wbr'
+))
+
+_PLACEHOLDER_PATTERN = re.compile(
+    r'\[(?:TODO|FILL|INSERT|PLACEHOLDER|TBD|XXX)[^\]]*\]|\[\.\.\..*?\]',
+    re.IGNORECASE
+)
+
+_EMPTY_HEADING_PATTERN = re.compile(r'##\s+([^\n]+)\s*\n\s*(?=##|$)')
+
+_EXAMPLE_HEADING_PATTERN = re.compile(r'##?\s*example|<example')
+
+# (closing slash, body, empty-element marker) of one tag
+Token = Tuple[str, str, str]
+
+# Tag body -> (name pushed by an opening tag, name popped by a closing tag).
+# Prompts reuse a handful of tag bodies, so each is classified once.
+_element_names: Dict[str, Tuple[Optional[str], Optional[str]]] = {}
+_ELEMENT_NAMES_SIZE = 4096
+
+# (message, offset) of the first XML structure error
+XmlError = Tuple[str, int]
+
+
+class PromptScan:
+    """
+    Everything the quality gates need, extracted from a prompt at most once.
+
+    Features are computed on first access and memoized, so each gate reads
+    shared results and a consumer only pays for the features it uses.
+    """
+
+    def __init__(self, prompt: str, counter: str = DEFAULT_COUNTER):
+        self.text = prompt
+        self.counter = counter
+        self._term_counts: Dict[str, int] = {}
+
+    @cached_property
+    def lowered(self) -> str:
+        return self.text.lower()
+
+    @cached_property
+    def length(self) -> int:
+        return len(self.text)
+
+    @cached_property
+    def stripped_length(self) -> int:
+        return len(self.text.strip())
+
+    @cached_property
+    def token_count(self) -> int:
+        return count_tokens(self.text, self.counter)
+
+    @cached_property
+    def placeholders(self) -> List[str]:
+        return _PLACEHOLDER_PATTERN.findall(self.text)
+
+    @cached_property
+    def empty_headings(self) -> List[str]:
+        return _EMPTY_HEADING_PATTERN.findall(self.text)
+
+    @cached_property
+    def example_headings(self) -> int:
+        return len(_EXAMPLE_HEADING_PATTERN.findall(self.lowered))
+
+    @cached_property
+    def tokens(self) -> List[Token]:
+        """Every tag in the prompt, from the single tokenizer pass."""
+        return _TAG_PATTERN.findall(self.text)
+
+    @cached_property
+    def opening_tags(self) -> List[str]:
+        return [body for slash, body, _ in self.tokens if body and not slash]
+
+    @cached_property
+    def closing_tags(self) -> List[str]:
+        return [body for slash, body, _ in self.tokens if body and slash]
+
+    @cached_property
+    def empty_tags(self) -> List[str]:
+        """Bodies of <name>   </name> pairs with only whitespace in between."""
+        return [body for slash, body, empty in self.tokens if empty and body and not slash]
+
+    @cached_property
+    def xml_error(self) -> Optional[XmlError]:
+        """First nesting error as (message, offset), or None if well nested."""
+        return check_xml_nesting(self.text, self.tokens)
+
+    def count(self, term: str) -> int:
+        """Occurrences of a lowercase indicator term in the prompt."""
+        count = self._term_counts.get(term)
+        if count is None:
+            count = self._term_counts[term] = self.lowered.count(term)
+        return count
+
+    def has(self, term: str) -> bool:
+        """Whether a lowercase indicator term appears in the prompt."""
+        count = self._term_counts.get(term)
+        if count is None:
+            # Containment stops at the first hit, unlike a full count
+            return term in self.lowered
+        return count > 0
+
+    def indicators_found(self, indicators: Tuple[str, ...]) -> int:
+        """Number of distinct indicators from `indicators` present in the prompt."""
+        return sum(1 for indicator in indicators if self.has(indicator))
+
+
+def _classify_element(body: str) -> Tuple[Optional[str], Optional[str]]:
+    """Names a tag body pushes (as an opening tag) and pops (as a closing tag)."""
+    names = _element_names.get(body)
+    if names is not None:
+        return names
+
+    match = _ELEMENT_PATTERN.fullmatch(body)
+    if match is None:
+        names = (None, None)
+    else:
+        name, tail = match.group(1), match.group(2) or ''
+        pushed = None if tail.endswith('/') or name.lower() in _VOID_ELEMENTS else name
+        popped = None if tail.strip() else name
+        names = (pushed, popped)
+
+    if len(_element_names) >= _ELEMENT_NAMES_SIZE:
+        _element_names.clear()
+    _element_names[body] = names
+    return names
+
+
+def _tag_offset(text: str, index: int) -> int:
+    """Offset of the index-th tag (only needed to report an error)."""
+    return next(islice(_TAG_PATTERN.finditer(text), index, None)).start()
+
+
+def check_xml_nesting(text: str, tokens: Optional[List[Token]] = None) -> Optional[XmlError]:
+    """
+    Check that element tags are properly nested using a tag stack.
+
+    Walks the tokenizer output once and stops at the first mismatch, so the
+    cost is O(n) in the prompt length with no regex backtracking. Self-closing
+    and HTML void tags and non-element bodies (comments, declarations,
+    comparisons) are ignored.
+
+    Args:
+        text: Prompt text
+        tokens: Tokens from PromptScan.tokens, if the prompt was already scanned
+    """
+    if tokens is None:
+        tokens = _TAG_PATTERN.findall(text)
+
+    # Fast path: names only; offsets are worked out only for an invalid prompt
+    stack: List[str] = []
+    push, pop = stack.append, stack.pop
+    get = _element_names.get
+
+    for is_closing, body, _ in tokens:
+        names = get(body) or _classify_element(body)
+        if is_closing:
+            name = names[1]
+            if name is not None and (not stack or pop() != name):
+                return _locate_nesting_error(text, tokens)
+        elif names[0] is not None:
+            push(names[0])
+
+    if stack:
+        return _locate_nesting_error(text, tokens)
+
+    return None
+
+
+def _locate_nesting_error(text: str, tokens: List[Token]) -> XmlError:
+    """Replay the tag stack with token indexes to report the first error."""
+    stack: List[Tuple[str, int]] = []
+
+    for index, (is_closing, body, _) in enumerate(tokens):
+        pushed, popped = _classify_element(body)
+        if is_closing:
+            if popped is None:
+                continue
+            if not stack:
+                return f"Unexpected closing tag </{popped}>", _tag_offset(text, index)
+            open_name, open_index = stack.pop()
+            if open_name != popped:
+                return (f"Mismatched closing tag </{popped}> (expected </{open_name}>, "
+                        f"opened at offset {_tag_offset(text, open_index)})"), _tag_offset(text, index)
+        elif pushed is not None:
+            stack.append((pushed, index))
+
+    open_name, open_index = stack[-1]
+    return f"Unclosed tag <{open_name}>", _tag_offset(text, open_index)
+
+
+def scan_prompt(prompt: str, counter: str = DEFAULT_COUNTER) -> PromptScan:
+    """Scan a prompt once for all quality gates."""
+    return PromptScan(prompt, counter)
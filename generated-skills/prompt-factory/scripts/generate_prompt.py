@@ -12,18 +12,31 @@ Usage:
 
 import json
 import argparse
-import re
 from datetime import datetime
-from typing import Dict, Any, List, Optional
-from pathlib import Path
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, Mapping
+from gate_engine import PromptScan, scan_prompt
+from prompt_templates import get_template
+from preset_index import get_preset_index
+from token_counter import DEFAULT_COUNTER, WORDS_PER_TOKEN, available_counters, get_counter
+
+
+# Bump whenever generated output changes so cached prompts are invalidated
+GENERATOR_VERSION = '1.2'
+
+# Gate 3 limit; the gate used to allow up to 8000 words
+MAX_PROMPT_TOKENS = round(8000 / WORDS_PER_TOKEN)
 
 
 class PromptGenerator:
     """Enhanced prompt generator with multi-format support and quality validation."""
 
-    def __init__(self):
+    def __init__(self, tokenizer: str = DEFAULT_COUNTER):
         self.validation_score = 0
         self.validation_issues = []
+        get_counter(tokenizer)  # fail fast on unknown counters
+        self.tokenizer = tokenizer
 
     def load_responses(self, filepath: str) -> Dict[str, Any]:
         """Load questionnaire responses from JSON file."""
@@ -31,40 +44,35 @@ class PromptGenerator:
             return json.load(f)
 
     def load_preset(self, preset_name: str) -> Dict[str, Any]:
-        """Load a quick-start preset template."""
-        preset_path = Path(__file__).parent.parent / 'templates' / 'presets'
-
-        # Map preset names to files
-        preset_map = {
-            'fullstack-engineer': 'technical/fullstack-engineer.md',
-            'ml-engineer': 'technical/ml-engineer.md',
-            'devops-engineer': 'technical/devops-engineer.md',
-            'mobile-engineer': 'technical/mobile-engineer.md',
-            'solutions-architect': 'technical/solutions-architect.md',
-            'product-manager': 'business/product-manager.md',
-            'marketing-strategist': 'business/marketing-strategist.md',
-            'business-analyst': 'business/business-analyst.md',
-            'operations-manager': 'business/operations-manager.md',
-            'content-strategist': 'creative/content-strategist.md',
-            'ux-designer': 'creative/ux-designer.md',
-            'technical-writer': 'creative/technical-writer.md',
-            'healthcare-consultant': 'specialized/healthcare-consultant.md',
-            'fintech-advisor': 'specialized/fintech-advisor.md',
-            'legal-specialist': 'specialized/legal-specialist.md',
-        }
+        """
+        Load a quick-start preset from templates/presets/ as questionnaire responses.
 
-        if preset_name not in preset_map:
-            raise ValueError(f"Unknown preset: {preset_name}")
+        Presets are read through the compiled preset index, so the markdown is
+        parsed once per presets change rather than once per call.
 
-        # Return default configuration for preset
-        # In production, this would load from actual template files
-        return {
-            'role': preset_name.replace('-', ' ').title(),
-            'preset': preset_name,
-            'template': preset_map[preset_name]
-        }
+        Raises:
+            ValueError: If no preset has that name
+        """
+        return get_preset_index().get(preset_name)
+
+    def apply_preset(self, responses: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Resolve a 'preset' key in responses (e.g. a batch row) against its preset.
+
+        Non-empty values in `responses` override the preset's defaults; responses
+        without a preset are returned unchanged.
+        """
+        preset_name = responses.get('preset')
+        if not preset_name:
+            return responses
 
-    def generate_xml_format(self, responses: Dict[str, Any]) -> str:
+        merged = self.load_preset(preset_name)
+        merged.update((key, value) for key, value in responses.items()
+                      if value not in ('', None))
+        return merged
+
+    def generate_xml_format(self, responses: Dict[str, Any],
+                              sections: Mapping[str, str] = None) -> str:
         """Generate prompt in XML format."""
         role = responses.get('role', 'Expert AI Assistant')
         role_context = responses.get('role_context', '')
@@ -100,104 +108,28 @@ class PromptGenerator:
 
         context_content = "\n".join(context_parts) if context_parts else "  <domain>General</domain>"
 
-        # Get workflow based on output type
-        workflow = self._get_workflow_for_output_type(output_type)
-
-        # Generate best practices
-        best_practices = self._get_best_practices(output_type, domain)
-
-        # Build the prompt
-        prompt = f"""<mega_prompt>
-
-<role>
-{role_text}
-</role>
-
-<mission>
-Your primary objective is to {goal}.
-
-Success is defined by: {success_criteria}
-</mission>
-
-<context>
-{context_content}
-</context>
-
-{workflow}
-
-<output_specifications>
-  <format>{output_type}</format>
-  <structure>{format_preference} format with clear organization</structure>
-  <depth_level>{detail_level}</depth_level>
-  <quality_criteria>{success_criteria}</quality_criteria>
-</output_specifications>
-
-<communication_guidelines>
-  <tone>{tone}</tone>
-  <audience>{target_audience}</audience>
-  <formatting>{format_preference}</formatting>
-  <examples_usage>Provide relevant examples when they clarify complex concepts or demonstrate best practices</examples_usage>
-</communication_guidelines>
-
-{best_practices}
-
-<critical_instructions>
-  <priority_1>
-    - Ensure all information is accurate and verified
-    - Follow ALL constraints specified in the context section
-    {f'- DO NOT include or suggest: {must_avoid}' if must_avoid else ''}
-  </priority_1>
-
-  <priority_2>
-    - Provide complete, production-ready output
-    - Include proper error handling and edge cases
-    - Maintain specified communication style
-  </priority_2>
-
-  <priority_3>
-    - Optimize for clarity and maintainability
-    - Consider scalability and future extensibility
-    - Provide actionable guidance
-  </priority_3>
-</critical_instructions>
-
-<examples>
-## Example 1: Standard Request
-**User Request:** [Typical request for this role]
-
-**Expected Response Structure:**
-- Analyze the request thoroughly
-- Apply the workflow systematically
-- Deliver output meeting quality criteria
-- Include relevant examples
-
-## Example 2: Complex Scenario
-**User Request:** [More complex request]
-
-**Expected Response Structure:**
-- Break down into manageable components
-- Address each component systematically
-- Integrate solutions coherently
-- Validate against success criteria
-</examples>
-
-<execution_trigger>
-You are now fully configured as {role}{f' specialized in {domain}' if domain else ''}.
-
-When the user provides a request:
-1. Analyze their specific needs using the workflow above
-2. Apply relevant best practices contextually
-3. Generate output meeting quality criteria
-4. Deliver complete solution in one comprehensive response
-
-Begin assisting the user now with this configuration.
-</execution_trigger>
-
-</mega_prompt>"""
-
-        return prompt
-
-    def generate_claude_format(self, responses: Dict[str, Any]) -> str:
+        sections = sections or self._sections_for(responses)
+
+        # Fill the precompiled XML skeleton
+        return get_template('xml').render(
+            role=role,
+            role_text=role_text,
+            goal=goal,
+            success_criteria=success_criteria,
+            context_content=context_content,
+            workflow=sections['workflow'],
+            output_type=output_type,
+            format_preference=format_preference,
+            detail_level=detail_level,
+            tone=tone,
+            target_audience=target_audience,
+            best_practices=sections['best_practices'],
+            avoid_rule=f'- DO NOT include or suggest: {must_avoid}' if must_avoid else '',
+            specialization=f' specialized in {domain}' if domain else ''
+        )
+
+    def generate_claude_format(self, responses: Dict[str, Any],
+                              sections: Mapping[str, str] = None) -> str:
         """Generate prompt optimized for Claude."""
         role = responses.get('role', 'Expert AI Assistant')
         domain = responses.get('domain', '')
@@ -208,68 +140,24 @@ Begin assisting the user now with this configuration.
         tone = responses.get('tone', 'professional')
         detail_level = responses.get('detail_level', 'moderate')
 
-        workflow_steps = self._get_workflow_steps(output_type)
-
-        prompt = f"""# System Configuration: {role}
-
-You are {role}{f' specialized in {domain}' if domain else ''}.
-
-## Your Mission
-
-{goal}
-
-## Your Expertise
-
-{f'Domain: {domain}' if domain else 'General expertise across domains'}
-{f'Technical Stack: {tech_stack}' if tech_stack else ''}
-
-## Your Workflow
-
-When given a task:
-{workflow_steps}
-
-## Output Standards
-
-- Format: {output_type}
-- Depth: {detail_level} detail
-- Quality: Production-ready, complete, accurate
-
-## Communication Style
-
-- Tone: {tone}
-- Clarity: Crystal clear with concrete examples
-- Structure: Well-organized with logical flow
-
-## Critical Rules
-
-**Must follow:**
-{f'- Constraints: {constraints}' if constraints else '- Follow standard best practices'}
-- Verify all information is accurate
-- Provide complete, actionable solutions
-- Include relevant examples
-
-**Always include:**
-- Clear explanations
-- Practical examples
-- Edge case handling
-- Quality validation
-
-## Best Practices
-
-{self._get_best_practices_list(output_type, domain)}
-
-## Response Examples
-
-[Include 2-3 examples of expected response patterns based on typical requests]
-
----
-
-Execute your role now, following all guidelines above. When the user makes a request, apply this configuration to deliver high-quality, comprehensive responses.
-"""
-
-        return prompt
-
-    def generate_chatgpt_format(self, responses: Dict[str, Any]) -> str:
+        sections = sections or self._sections_for(responses)
+
+        return get_template('claude').render(
+            role=role,
+            specialization=f' specialized in {domain}' if domain else '',
+            goal=goal,
+            expertise_domain=f'Domain: {domain}' if domain else 'General expertise across domains',
+            expertise_stack=f'Technical Stack: {tech_stack}' if tech_stack else '',
+            workflow_steps=sections['workflow_steps'],
+            output_type=output_type,
+            detail_level=detail_level,
+            tone=tone,
+            constraint_rule=f'- Constraints: {constraints}' if constraints else '- Follow standard best practices',
+            best_practices_list=sections['best_practices_list']
+        )
+
+    def generate_chatgpt_format(self, responses: Dict[str, Any],
+                              sections: Mapping[str, str] = None) -> str:
         """Generate prompt for ChatGPT custom instructions."""
         role = responses.get('role', 'Expert AI Assistant')
         domain = responses.get('domain', '')
@@ -281,46 +169,26 @@ Execute your role now, following all guidelines above. When the user makes a req
         detail_level = responses.get('detail_level', 'moderate')
         format_preference = responses.get('format_preference', 'mixed')
 
-        about_section = f"""I need you to act as {role}{f' specialized in {domain}' if domain else ''}.
-
-My domain: {domain if domain else 'General'}
-{f'My tech stack: {tech_stack}' if tech_stack else ''}
-{f'My constraints: {constraints}' if constraints else ''}
-
-My goal: {goal}"""
-
-        workflow_steps = self._get_workflow_steps(output_type)
-
-        response_section = f"""WORKFLOW:
-{workflow_steps}
-
-OUTPUT REQUIREMENTS:
-- Format: {output_type}
-- Style: {tone} tone, {detail_level} detail
-- Structure: {format_preference} with clear organization
-- Quality: Production-ready, complete, accurate
-
-CRITICAL RULES:
-{f'- Constraints: {constraints}' if constraints else '- Follow best practices'}
-- Verify accuracy
-- Provide complete solutions
-- Include examples
-- Handle edge cases
-
-BEST PRACTICES:
-{self._get_best_practices_list(output_type, domain)}
-
-Always provide {format_preference} responses with concrete examples and ensure {output_type} meets production quality standards."""
-
-        return f"""**What would you like ChatGPT to know about you to provide better responses?**
-
-{about_section}
-
-**How would you like ChatGPT to respond?**
-
-{response_section}"""
-
-    def generate_gemini_format(self, responses: Dict[str, Any]) -> str:
+        sections = sections or self._sections_for(responses)
+
+        return get_template('chatgpt').render(
+            role=role,
+            specialization=f' specialized in {domain}' if domain else '',
+            domain_label=domain if domain else 'General',
+            tech_stack_line=f'My tech stack: {tech_stack}' if tech_stack else '',
+            constraints_line=f'My constraints: {constraints}' if constraints else '',
+            goal=goal,
+            workflow_steps=sections['workflow_steps'],
+            output_type=output_type,
+            tone=tone,
+            detail_level=detail_level,
+            format_preference=format_preference,
+            constraint_rule=f'- Constraints: {constraints}' if constraints else '- Follow best practices',
+            best_practices_list=sections['best_practices_list']
+        )
+
+    def generate_gemini_format(self, responses: Dict[str, Any],
+                              sections: Mapping[str, str] = None) -> str:
         """Generate prompt optimized for Google Gemini."""
         role = responses.get('role', 'Expert AI Assistant')
         domain = responses.get('domain', '')
@@ -328,35 +196,44 @@ Always provide {format_preference} responses with concrete examples and ensure {
         output_type = responses.get('output_type', 'comprehensive response')
         detail_level = responses.get('detail_level', 'moderate')
 
-        workflow_simple = self._get_workflow_simple(output_type)
+        sections = sections or self._sections_for(responses)
 
-        prompt = f"""## Role Configuration
-You are: {role}{f' specialized in {domain}' if domain else ''}
+        return get_template('gemini').render(
+            role=role,
+            specialization=f' specialized in {domain}' if domain else '',
+            workflow_simple=sections['workflow_simple'],
+            output_type=output_type,
+            detail_level=detail_level
+        )
 
-## Task Approach
-{workflow_simple}
-
-## Output Format
-- Type: {output_type}
-- Detail: {detail_level}
-- Quality: Complete and production-ready
-
-## Quality Standards
-- Accurate and verified information
-- Clear, practical examples
-- Complete solutions
-- Edge case handling
-
-## Examples
-[Example 1: Show typical interaction]
-[Example 2: Show complex scenario handling]
-
-Apply this configuration to all responses. Maintain this role and follow these standards consistently.
-"""
-
-        return prompt
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def shared_sections(output_type: str, domain: str) -> Mapping[str, str]:
+        """
+        Build the sections every format draws from, once per (output_type, domain).
 
-    def _get_workflow_for_output_type(self, output_type: str) -> str:
+        Section builders are memoized, and generate() passes this shared
+        representation to each format renderer, so format_type='all' does not
+        rebuild workflows and best practices four times. Every caller gets
+        the same memoized mapping, so it is returned read-only.
+        """
+        return MappingProxyType({
+            'workflow': PromptGenerator._get_workflow_for_output_type(output_type),
+            'workflow_steps': PromptGenerator._get_workflow_steps(output_type),
+            'workflow_simple': PromptGenerator._get_workflow_simple(output_type),
+            'best_practices': PromptGenerator._get_best_practices(output_type, domain),
+            'best_practices_list': PromptGenerator._get_best_practices_list(output_type, domain),
+        })
+
+    def _sections_for(self, responses: Dict[str, Any]) -> Mapping[str, str]:
+        """Shared sections for a set of responses."""
+        # str() keeps the memo key hashable when domain arrives as a JSON list
+        return self.shared_sections(responses.get('output_type', 'comprehensive response'),
+                                    str(responses.get('domain', '')))
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _get_workflow_for_output_type(output_type: str) -> str:
         """Get detailed workflow XML for given output type."""
         workflows = {
             'code': """<workflow>
@@ -458,7 +335,9 @@ Apply this configuration to all responses. Maintain this role and follow these s
 
         return workflows.get(output_type, workflows['code'])
 
-    def _get_workflow_steps(self, output_type: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _get_workflow_steps(output_type: str) -> str:
         """Get workflow steps as numbered list."""
         workflows = {
             'code': """1. Analyze requirements and constraints
@@ -481,7 +360,9 @@ Apply this configuration to all responses. Maintain this role and follow these s
 
         return workflows.get(output_type, workflows['code'])
 
-    def _get_workflow_simple(self, output_type: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _get_workflow_simple(output_type: str) -> str:
         """Get simplified workflow for Gemini."""
         workflows = {
             'code': "Analyze → Design → Implement → Validate",
@@ -492,7 +373,9 @@ Apply this configuration to all responses. Maintain this role and follow these s
 
         return workflows.get(output_type, "Analyze → Plan → Execute → Validate")
 
-    def _get_best_practices(self, output_type: str, domain: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _get_best_practices(output_type: str, domain: str) -> str:
         """Get best practices XML section."""
         practices = {
             'code': """<best_practices>
@@ -565,7 +448,9 @@ Apply this configuration to all responses. Maintain this role and follow these s
 
         return practices.get(output_type, practices['code'])
 
-    def _get_best_practices_list(self, output_type: str, domain: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _get_best_practices_list(output_type: str, domain: str) -> str:
         """Get best practices as bullet list."""
         practices = {
             'code': """- Follow language-specific idioms and conventions
@@ -594,69 +479,65 @@ Apply this configuration to all responses. Maintain this role and follow these s
         """
         score = 0
         issues = []
+        scan = scan_prompt(prompt, self.tokenizer)
 
         # Gate 1: XML structure (if XML format)
         if format_type == 'xml':
-            if self._validate_xml_structure(prompt):
+            if self._validate_xml_structure(scan):
                 score += 1
             else:
-                issues.append("XML structure invalid: unclosed tags detected")
+                message, offset = scan.xml_error
+                issues.append(f"XML structure invalid: {message} at offset {offset}")
         else:
             score += 1  # N/A for non-XML formats
 
         # Gate 2: Completeness (no empty sections)
-        if self._validate_completeness(prompt):
+        if self._validate_completeness(scan):
             score += 1
         else:
             issues.append("Incomplete: empty sections detected")
 
         # Gate 3: Token count reasonable
-        token_count = len(prompt.split())
-        if token_count < 8000:
+        token_count = scan.token_count
+        if token_count < MAX_PROMPT_TOKENS:
             score += 1
         else:
-            issues.append(f"Token count high: ~{token_count} words (recommended < 8000)")
+            issues.append(f"Token count high: ~{token_count} tokens (recommended < {MAX_PROMPT_TOKENS})")
 
         # Gate 4: No placeholders
-        if not re.search(r'\[TODO\]|\[FILL.*?\]|\[\.\.\..*?\]', prompt):
+        if not scan.placeholders:
             score += 1
         else:
             issues.append("Placeholder text found (TODO, FILL, etc.)")
 
         # Gate 5: Workflow present
-        if 'workflow' in prompt.lower() or 'process' in prompt.lower():
+        if scan.has('workflow') or scan.has('process'):
             score += 1
         else:
             issues.append("No clear workflow/process defined")
 
         # Gate 6: Best practices mentioned
-        if 'best practice' in prompt.lower() or 'guideline' in prompt.lower():
+        if scan.has('best practice') or scan.has('guideline'):
             score += 1
         else:
             issues.append("Best practices section missing or incomplete")
 
         # Gate 7: Examples present
-        if 'example' in prompt.lower() and prompt.lower().count('example') >= 2:
+        if scan.count('example') >= 2:
             score += 1
         else:
             issues.append("Insufficient examples (need at least 2)")
 
         return score, issues
 
-    def _validate_xml_structure(self, prompt: str) -> bool:
-        """Validate XML tags are properly closed."""
-        # Find all XML tags
-        opening_tags = re.findall(r'<([^/][^>]*)>', prompt)
-        closing_tags = re.findall(r'</([^>]+)>', prompt)
+    def _validate_xml_structure(self, scan: PromptScan) -> bool:
+        """Validate XML tags are properly nested and closed."""
+        return scan.xml_error is None
 
-        # Simple validation: same count of opening and closing
-        return len(opening_tags) == len(closing_tags)
-
-    def _validate_completeness(self, prompt: str) -> bool:
+    def _validate_completeness(self, scan: PromptScan) -> bool:
         """Check for empty sections."""
         # Look for tags with no content
-        empty_pattern = r'<([^>]+)>\s*</\1>'
-        return not re.search(empty_pattern, prompt)
+        return not scan.empty_tags
 
     def generate(self, responses: Dict[str, Any], format_type: str = 'xml',
                  mode: str = 'core') -> Dict[str, Any]:
@@ -689,15 +570,18 @@ Apply this configuration to all responses. Maintain this role and follow these s
         else:
             formats_to_generate = [format_type]
 
+        # Sections shared by every requested format are built once
+        sections = self._sections_for(responses)
+
         for fmt in formats_to_generate:
             if fmt == 'xml':
-                prompt = self.generate_xml_format(responses)
+                prompt = self.generate_xml_format(responses, sections)
             elif fmt == 'claude':
-                prompt = self.generate_claude_format(responses)
+                prompt = self.generate_claude_format(responses, sections)
             elif fmt == 'chatgpt':
-                prompt = self.generate_chatgpt_format(responses)
+                prompt = self.generate_chatgpt_format(responses, sections)
             elif fmt == 'gemini':
-                prompt = self.generate_gemini_format(responses)
+                prompt = self.generate_gemini_format(responses, sections)
             else:
                 raise ValueError(f"Unknown format: {fmt}")
 
@@ -730,7 +614,7 @@ def create_markdown_document(result: Dict[str, Any], mode: str) -> str:
 - **Domain**: {domain}
 - **Output Type**: {output_type}
 - **Mode**: {mode}
-- **Generated by**: Prompt Suite v1.0
+- **Generated by**: Prompt Suite v{GENERATOR_VERSION}
 
 ---
 
@@ -847,11 +731,13 @@ Examples:
     parser.add_argument('--mode', default='core', choices=['core', 'advanced'],
                        help='Generation mode (default: core)')
     parser.add_argument('--output', required=True, help='Output markdown file path')
+    parser.add_argument('--tokenizer', default=DEFAULT_COUNTER, choices=available_counters(),
+                       help=f'Token counter for the token-count gate (default: {DEFAULT_COUNTER})')
 
     args = parser.parse_args()
 
     # Load responses or preset
-    generator = PromptGenerator()
+    generator = PromptGenerator(tokenizer=args.tokenizer)
 
     if args.preset:
         responses = generator.load_preset(args.preset)
@@ -9,21 +9,144 @@ Usage:
     python optimizer.py --prompt my-prompt.md --target-tokens 4000 --output optimized.md
     python optimizer.py --prompt prompt.md --analyze-only --report analysis.json
     python optimizer.py --prompt prompt.md --aggressive --output compact.md
+    python optimizer.py --dir ../../generated-prompts --output-dir ./optimized --parallel 8
 """
 
 import re
 import json
 import argparse
+import concurrent.futures
+from collections import Counter
+from functools import partial
 from pathlib import Path
-from typing import Dict, List, Any, Tuple
+from typing import Dict, List, Any, Tuple, Iterable, Iterator
 from datetime import datetime
+from token_counter import DEFAULT_COUNTER, available_counters, get_counter
+
+
+# Redundant phrases as (pattern, estimated token savings per match) for analysis
+REDUNDANT_PATTERNS = [
+    (r'it is important to note that', 50),
+    (r'please note that', 30),
+    (r'it should be noted', 30),
+    (r'as mentioned (?:above|before|previously)', 40),
+    (r'in order to', 20),
+    (r'for the purpose of', 30),
+    (r'due to the fact that', 40),
+    (r'at this point in time', 40),
+]
+
+# Words that could be simplified, as (complex word, simpler word)
+COMPLEX_WORDS = [
+    ('utilize', 'use'),
+    ('facilitate', 'help'),
+    ('implement', 'use'),
+    ('leverage', 'use'),
+    ('paradigm', 'model'),
+]
+
+# Redundant phrase rewrites as (pattern, replacement), applied in one pass
+REDUNDANT_REWRITES = [
+    (r'it is important to note that\s+', ''),
+    (r'please note that\s+', ''),
+    (r'it should be noted that\s+', ''),
+    (r'as mentioned (?:above|before|previously),?\s+', ''),
+    (r'in order to\s+', 'to '),
+    (r'for the purpose of\s+', 'to '),
+    (r'due to the fact that\s+', 'because '),
+    (r'at this point in time\s+', 'now '),
+    (r'has the ability to\s+', 'can '),
+]
+
+
+def _named_alternation(patterns: Iterable[str], prefix: str) -> str:
+    """Join patterns into one alternation with a named group per pattern."""
+    return '|'.join(f'(?P<{prefix}{i}>{pattern})' for i, pattern in enumerate(patterns))
+
+
+# One scan counts every redundant phrase and complex word for analyze()
+_ANALYSIS_PATTERN = re.compile(
+    _named_alternation([pattern for pattern, _ in REDUNDANT_PATTERNS], 'r') + '|' +
+    _named_alternation([rf'\b{word}\b' for word, _ in COMPLEX_WORDS], 'c'),
+    re.IGNORECASE
+)
+
+_REDUNDANCY_REWRITE_PATTERN = re.compile(
+    _named_alternation([pattern for pattern, _ in REDUNDANT_REWRITES], 'r'),
+    re.IGNORECASE
+)
+
+_FILLER_PATTERN = re.compile(
+    r'\b(?:very|really|quite|rather|fairly|pretty|basically|essentially|actually|literally)\s+'
+)
+
+# Excess newlines, repeated punctuation and trailing line whitespace in one pass
+_FORMATTING_PATTERN = re.compile(
+    r'(?P<newlines>\n\n\n+)|(?P<ellipsis>\.\.\.+)|(?P<bang>!!!+)|(?P<question>\?\?\?+)'
+    r'|(?P<trailing>[^\S\n]+(?=\n|\Z))'
+)
+
+_FORMATTING_REPLACEMENTS = {
+    'newlines': '\n\n',
+    'ellipsis': '...',
+    'bang': '!',
+    'question': '?',
+    'trailing': '',
+}
+
+
+# Worker-local optimizer, created once per process by _init_optimize_worker
+_worker_optimizer = None
+
+
+def _init_optimize_worker(aggressive: bool, tokenizer: str):
+    """Create the PromptOptimizer owned by a process-pool worker."""
+    global _worker_optimizer
+    _worker_optimizer = PromptOptimizer(aggressive=aggressive, tokenizer=tokenizer)
+
+
+def _optimize_file_in_worker(prompt_file: Path, root: Path, output_dir: Path,
+                             target_tokens: int = None) -> Dict[str, Any]:
+    """Process-pool entry point: optimize one prompt file with the worker's optimizer."""
+    return optimize_file(_worker_optimizer, prompt_file, root, output_dir, target_tokens)
+
+
+def optimize_file(optimizer: 'PromptOptimizer', prompt_file: Path, root: Path,
+                  output_dir: Path, target_tokens: int = None) -> Dict[str, Any]:
+    """Optimize a prompt file, mirroring its path below `root` into `output_dir`."""
+    try:
+        optimized, report = optimizer.optimize(prompt_file.read_text(), target_tokens)
+
+        output_file = output_dir / prompt_file.relative_to(root)
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        output_file.write_text(optimized)
+
+        return {
+            'file': str(prompt_file),
+            'status': 'success',
+            'output_file': str(output_file),
+            'original_tokens': report['original_stats']['estimated_tokens'],
+            'optimized_tokens': report['optimized_stats']['estimated_tokens'],
+            'token_reduction': report['token_reduction'],
+            'achieved_target': report['achieved_target'],
+            'quality_maintained': report['quality_maintained']
+        }
+
+    except Exception as e:
+        return {
+            'file': str(prompt_file),
+            'status': 'error',
+            'error': str(e)
+        }
 
 
 class PromptOptimizer:
     """Optimize prompts for token efficiency and clarity."""
 
-    def __init__(self, aggressive: bool = False):
+    def __init__(self, aggressive: bool = False, tokenizer: str = DEFAULT_COUNTER):
         self.aggressive = aggressive
+        self.tokenizer = tokenizer
+        self.token_counter = get_counter(tokenizer)
         self.optimizations_applied = []
 
     def analyze(self, prompt: str) -> Dict[str, Any]:
@@ -38,9 +161,10 @@ class PromptOptimizer:
 
         # Check for various optimization opportunities
         opportunities = []
+        phrase_counts = self._count_phrases(prompt)
 
         # 1. Redundant phrases
-        redundant_savings = self._check_redundancy(prompt)
+        redundant_savings = self._check_redundancy(prompt, phrase_counts)
         if redundant_savings > 0:
             opportunities.append({
                 'type': 'redundancy',
@@ -90,7 +214,7 @@ class PromptOptimizer:
             })
 
         # 6. Simplifiable language
-        language_savings = self._check_language_complexity(prompt)
+        language_savings = self._check_language_complexity(prompt, phrase_counts)
         if language_savings > 0:
             opportunities.append({
                 'type': 'language',
@@ -115,28 +239,41 @@ class PromptOptimizer:
             prompt: Original prompt text
             target_tokens: Target token count (None = reasonable reduction)
 
+        Rewrites run in priority order and stop as soon as the prompt is at
+        or below the target, so it is not compressed further than needed.
+
         Returns:
             (optimized_prompt, optimization_report)
         """
-        original_word_count = len(prompt.split())
+        count = self.token_counter.count
+        original_tokens = count(prompt)
 
         # Determine target if not specified
         if target_tokens is None:
             # Aim for 20% reduction
-            target_tokens = int(original_word_count * 0.75 * 0.8)
+            target_tokens = int(original_tokens * 0.8)
 
         optimized = prompt
         self.optimizations_applied = []
 
         # Apply optimizations in order of priority
-        optimized = self._remove_redundancy(optimized)
-        optimized = self._simplify_verbosity(optimized)
-        optimized = self._merge_sections(optimized)
-        optimized = self._consolidate_examples(optimized)
-        optimized = self._clean_formatting(optimized)
-
+        steps = [
+            self._remove_redundancy,
+            self._simplify_verbosity,
+            self._merge_sections,
+            self._consolidate_examples,
+            self._clean_formatting,
+        ]
         if self.aggressive:
-            optimized = self._aggressive_optimization(optimized)
+            steps.append(self._aggressive_optimization)
+
+        for step in steps:
+            if count(optimized) <= target_tokens:
+                self.optimizations_applied.append(f"Target of {target_tokens} tokens reached, skipped remaining steps")
+                break
+            optimized = step(optimized)
+
+        optimized_tokens = count(optimized)
 
         # Generate report
         report = {
@@ -146,47 +283,58 @@ class PromptOptimizer:
             'target_tokens': target_tokens,
             'optimizations_applied': self.optimizations_applied,
             'quality_maintained': self._validate_quality(prompt, optimized),
-            'achieved_target': len(optimized.split()) * 0.75 <= target_tokens
+            'achieved_target': optimized_tokens <= target_tokens
         }
 
         # Calculate savings
-        original_tokens = int(original_word_count * 0.75)
-        optimized_tokens = int(len(optimized.split()) * 0.75)
         report['token_reduction'] = original_tokens - optimized_tokens
         report['reduction_percentage'] = (report['token_reduction'] / original_tokens * 100) if original_tokens > 0 else 0
 
         return optimized, report
 
+    def optimize_many(self, prompt_dir: Path, output_dir: Path, target_tokens: int = None,
+                      workers: int = 4, chunk_size: int = 4) -> Iterator[Dict[str, Any]]:
+        """
+        Optimize every *.md prompt under `prompt_dir` on a process pool.
+
+        Files are streamed to workers in chunks; each worker builds one
+        PromptOptimizer with this optimizer's settings. Results are yielded
+        in file order, and optimized prompts keep their relative paths
+        under `output_dir`.
+        """
+        prompt_dir = Path(prompt_dir)
+        output_dir = Path(output_dir)
+        prompt_files = sorted(prompt_dir.rglob('*.md'))
+        worker = partial(_optimize_file_in_worker, root=prompt_dir, output_dir=output_dir,
+                         target_tokens=target_tokens)
+
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers,
+                                                    initializer=_init_optimize_worker,
+                                                    initargs=(self.aggressive, self.tokenizer)) as executor:
+            yield from executor.map(worker, prompt_files, chunksize=chunk_size)
+
     def _get_stats(self, text: str) -> Dict[str, Any]:
         """Get text statistics."""
         words = text.split()
         return {
             'characters': len(text),
             'words': len(words),
-            'estimated_tokens': int(len(words) * 0.75),
+            'estimated_tokens': self.token_counter.count(text),
             'lines': len(text.split('\n')),
             'sections': len(re.findall(r'##?\s+', text))
         }
 
-    def _check_redundancy(self, prompt: str) -> int:
-        """Check for redundant phrases."""
-        redundant_patterns = [
-            (r'it is important to note that', 50),
-            (r'please note that', 30),
-            (r'it should be noted', 30),
-            (r'as mentioned (above|before|previously)', 40),
-            (r'in order to', 20),
-            (r'for the purpose of', 30),
-            (r'due to the fact that', 40),
-            (r'at this point in time', 40),
-        ]
+    def _count_phrases(self, prompt: str) -> Counter:
+        """Count redundant phrases and complex words in a single scan."""
+        return Counter(match.lastgroup for match in _ANALYSIS_PATTERN.finditer(prompt))
 
-        total_savings = 0
-        for pattern, savings in redundant_patterns:
-            matches = len(re.findall(pattern, prompt, re.IGNORECASE))
-            total_savings += matches * savings
+    def _check_redundancy(self, prompt: str, phrase_counts: Counter = None) -> int:
+        """Check for redundant phrases."""
+        if phrase_counts is None:
+            phrase_counts = self._count_phrases(prompt)
 
-        return total_savings
+        return sum(phrase_counts[f'r{i}'] * savings
+                   for i, (_, savings) in enumerate(REDUNDANT_PATTERNS))
 
     def _check_verbosity(self, prompt: str) -> int:
         """Check for verbose explanations."""
@@ -235,45 +383,29 @@ class PromptOptimizer:
 
         return (excessive_newlines * 5) + (excessive_punct * 3)
 
-    def _check_language_complexity(self, prompt: str) -> int:
+    def _check_language_complexity(self, prompt: str, phrase_counts: Counter = None) -> int:
         """Check for overly complex language."""
-        # Words that could be simplified
-        complex_patterns = [
-            ('utilize', 'use'),
-            ('facilitate', 'help'),
-            ('implement', 'use'),
-            ('leverage', 'use'),
-            ('paradigm', 'model'),
-        ]
-
-        total_savings = 0
-        for complex_word, _ in complex_patterns:
-            matches = len(re.findall(r'\b' + complex_word + r'\b', prompt, re.IGNORECASE))
-            total_savings += matches * 5  # Small savings per word
+        if phrase_counts is None:
+            phrase_counts = self._count_phrases(prompt)
 
-        return total_savings
+        # Small savings per word that could be simplified
+        return sum(phrase_counts[f'c{i}'] * 5 for i in range(len(COMPLEX_WORDS)))
 
     def _remove_redundancy(self, prompt: str) -> str:
-        """Remove redundant phrases."""
-        redundant_phrases = {
-            r'it is important to note that\s+': '',
-            r'please note that\s+': '',
-            r'it should be noted that\s+': '',
-            r'as mentioned (above|before|previously),?\s+': '',
-            r'in order to\s+': 'to ',
-            r'for the purpose of\s+': 'to ',
-            r'due to the fact that\s+': 'because ',
-            r'at this point in time\s+': 'now ',
-            r'has the ability to\s+': 'can ',
-        }
+        """Remove redundant phrases in a single pass over the prompt."""
+        matched = set()
 
-        optimized = prompt
-        for pattern, replacement in redundant_phrases.items():
-            before = len(optimized.split())
-            optimized = re.sub(pattern, replacement, optimized, flags=re.IGNORECASE)
-            after = len(optimized.split())
-            if before != after:
-                self.optimizations_applied.append(f"Removed redundant phrase pattern: {pattern[:30]}...")
+        def replace(match):
+            index = int(match.lastgroup[1:])
+            matched.add(index)
+            return REDUNDANT_REWRITES[index][1]
+
+        optimized = _REDUNDANCY_REWRITE_PATTERN.sub(replace, prompt)
+
+        for index, (pattern, _) in enumerate(REDUNDANT_REWRITES):
+            if index in matched:
+                self.optimizations_applied.append(
+                    f"Removed redundant phrase pattern: {pattern.replace('(?:', '(')[:30]}...")
 
         return optimized
 
@@ -290,9 +422,7 @@ class PromptOptimizer:
             # If sentence is too long, try to simplify
             if len(sentence.split()) > 40:
                 # Remove filler words
-                simplified = sentence
-                simplified = re.sub(r'\b(very|really|quite|rather|fairly|pretty)\s+', '', simplified)
-                simplified = re.sub(r'\b(basically|essentially|actually|literally)\s+', '', simplified)
+                simplified = _FILLER_PATTERN.sub('', sentence)
 
                 if len(simplified.split()) < len(sentence.split()):
                     self.optimizations_applied.append(f"Simplified verbose sentence (reduced by {len(sentence.split()) - len(simplified.split())} words)")
@@ -328,19 +458,9 @@ class PromptOptimizer:
 
     def _clean_formatting(self, prompt: str) -> str:
         """Clean excessive formatting."""
-        optimized = prompt
-
-        # Reduce excessive newlines
-        optimized = re.sub(r'\n\n\n+', '\n\n', optimized)
-
-        # Reduce excessive punctuation
-        optimized = re.sub(r'\.\.\.+', '...', optimized)
-        optimized = re.sub(r'!!!+', '!', optimized)
-        optimized = re.sub(r'\?\?\?+', '?', optimized)
-
-        # Remove trailing whitespace
-        lines = [line.rstrip() for line in optimized.split('\n')]
-        optimized = '\n'.join(lines)
+        # Reduce excessive newlines and punctuation, remove trailing whitespace
+        optimized = _FORMATTING_PATTERN.sub(
+            lambda match: _FORMATTING_REPLACEMENTS[match.lastgroup], prompt)
 
         if len(optimized) < len(prompt):
             savings = len(prompt) - len(optimized)
@@ -493,21 +613,37 @@ Examples:
 
   # Aggressive optimization
   python optimizer.py --prompt my-prompt.md --aggressive --output compact.md
+
+  # Optimize a whole prompt corpus in parallel
+  python optimizer.py --dir ./generated-prompts --output-dir ./optimized --parallel 8
 """
     )
 
-    parser.add_argument('--prompt', required=True, help='Prompt file to optimize')
+    parser.add_argument('--prompt', help='Prompt file to optimize')
+    parser.add_argument('--dir', help='Directory of prompts to optimize (recursive)')
+    parser.add_argument('--output-dir', help='Output directory for optimized prompts (with --dir)')
+    parser.add_argument('--parallel', type=int, default=4,
+                       help='Number of worker processes for --dir (default: 4)')
     parser.add_argument('--analyze-only', action='store_true',
                        help='Only analyze, do not optimize')
     parser.add_argument('--target-tokens', type=int,
                        help='Target token count (default: 20%% reduction)')
     parser.add_argument('--aggressive', action='store_true',
                        help='Apply aggressive optimization (may reduce quality)')
+    parser.add_argument('--tokenizer', default=DEFAULT_COUNTER, choices=available_counters(),
+                       help=f'Token counter used for stats and targets (default: {DEFAULT_COUNTER})')
     parser.add_argument('--output', help='Output file for optimized prompt')
     parser.add_argument('--report', help='Output JSON report file')
 
     args = parser.parse_args()
 
+    if args.dir:
+        optimize_directory(parser, args)
+        return
+
+    if not args.prompt:
+        parser.error("Either --prompt or --dir is required")
+
     # Load prompt
     prompt_file = Path(args.prompt)
     if not prompt_file.exists():
@@ -516,7 +652,7 @@ Examples:
     print(f"📝 Loading prompt: {prompt_file.name}")
     prompt_text = prompt_file.read_text()
 
-    optimizer = PromptOptimizer(aggressive=args.aggressive)
+    optimizer = PromptOptimizer(aggressive=args.aggressive, tokenizer=args.tokenizer)
 
     if args.analyze_only:
         # Analysis mode
@@ -585,5 +721,57 @@ Examples:
         print(f"\n✅ Optimization successful!")
 
 
+def optimize_directory(parser: argparse.ArgumentParser, args: argparse.Namespace):
+    """CLI handler for --dir: optimize a prompt corpus on a worker pool."""
+    prompt_dir = Path(args.dir)
+    if not prompt_dir.exists():
+        parser.error(f"Directory not found: {args.dir}")
+    if not args.output_dir:
+        parser.error("--output-dir is required with --dir")
+    if args.analyze_only:
+        parser.error("--analyze-only is not supported with --dir")
+
+    print(f"📁 Optimizing prompts in: {prompt_dir} ({args.parallel} workers)")
+    if args.aggressive:
+        print(f"⚠️  Aggressive mode enabled")
+
+    optimizer = PromptOptimizer(aggressive=args.aggressive, tokenizer=args.tokenizer)
+    results = []
+    for result in optimizer.optimize_many(prompt_dir, Path(args.output_dir), args.target_tokens,
+                                          workers=args.parallel):
+        results.append(result)
+        name = Path(result['file']).name
+        if result['status'] == 'success':
+            print(f"✅ {name}: ~{result['original_tokens']} → ~{result['optimized_tokens']} tokens")
+        else:
+            print(f"❌ {name}: {result['error']}")
+
+    succeeded = [r for r in results if r['status'] == 'success']
+    failed = len(results) - len(succeeded)
+    saved = sum(r['token_reduction'] for r in succeeded)
+
+    print(f"\n{'=' * 60}")
+    print(f"✅ Optimization Complete")
+    print(f"{'=' * 60}")
+    print(f"Prompts: {len(results)} ({failed} failed)")
+    print(f"Total savings: {saved} tokens")
+    print(f"📁 Output: {args.output_dir}")
+
+    # Save JSON report
+    if args.report:
+        with open(args.report, 'w') as f:
+            json.dump({
+                'timestamp': datetime.now().isoformat(),
+                'total': len(results),
+                'failed': failed,
+                'token_reduction': saved,
+                'results': results
+            }, f, indent=2)
+        print(f"📊 JSON Report: {args.report}")
+
+    if failed:
+        exit(1)
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""
+Prompt Suite - Preset Index
+
+Loads the quick-start presets in templates/presets/**.md through a compiled
+index. The markdown is parsed once into questionnaire responses and saved as
+a binary sidecar (templates/presets/.preset_index.bin). Each process then
+memory-maps the sidecar read-only and decodes only the presets it uses.
+
+The sidecar is rebuilt whenever a preset file changes (newer mtime or size)
+or presets are added, removed or renamed. If the presets folder is read-only, the
+index is built in memory instead.
+
+A preset can list former names in an `aliases:` frontmatter field (comma
+separated); they resolve to that preset. Two presets claiming the same name or
+alias is an error.
+
+Usage:
+    from preset_index import get_preset_index
+
+    index = get_preset_index()
+    index.names()                          # ['account-manager', ...]
+    responses = index.get('fullstack-engineer')
+"""
+
+import os
+import re
+import json
+import mmap
+import struct
+import hashlib
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+
+PRESETS_DIR = Path(__file__).parent.parent / 'templates' / 'presets'
+
+INDEX_FILENAME = '.preset_index.bin'
+
+# magic, newest mtime (ns), total size, file count, file list digest, directory length
+_HEADER = struct.Struct('<8sQQI8sI')
+_MAGIC = b'PFPIDX02'
+
+_FRONTMATTER_PATTERN = re.compile(r'\A---\s*\n(.*?)\n---\s*\n', re.DOTALL)
+_SECTION_PATTERN = re.compile(r'^## +(.+?)\s*$', re.MULTILINE)
+_SUBSECTION_PATTERN = re.compile(r'^### +(.+?)\s*$', re.MULTILINE)
+
+# "**Tech Stack:** React" and "- **Tone:** Direct"
+_BOLD_FIELD_PATTERN = re.compile(r'^\s*(?:[-*]\s+)?\*\*([^*:]+):\*\*[ \t]*(.*)$', re.MULTILINE)
+
+# "communication_style: Consultative" inside a ```yaml block
+_YAML_FIELD_PATTERN = re.compile(r'^([a-z_]+):[ \t]*(.*)$', re.MULTILINE)
+
+# "- item", "* item" and "1. item"
+_LIST_ITEM_PATTERN = re.compile(r'^\s*(?:[-*]|\d+\.)\s+(.+)$', re.MULTILINE)
+
+# Number of list items kept for summary fields such as role_context
+SUMMARY_ITEMS = 3
+
+# (newest mtime in ns, total size, file count, file list digest) of the presets tree
+Fingerprint = Tuple[int, int, int, bytes]
+
+
+def _sections(text: str, pattern: re.Pattern) -> Dict[str, str]:
+    """Split markdown into {heading: body} at the headings matched by `pattern`."""
+    matches = list(pattern.finditer(text))
+    return {
+        match.group(1): text[match.end():matches[i + 1].start() if i + 1 < len(matches) else len(text)]
+        for i, match in enumerate(matches)
+    }
+
+
+def _list_items(body: str) -> List[str]:
+    return [item.replace('**', '').strip() for item in _LIST_ITEM_PATTERN.findall(body)]
+
+
+def _fields(body: str) -> Dict[str, str]:
+    """Inline `**Key:** value` and yaml `key: value` fields, keyed in lowercase."""
+    fields = {key.strip().lower(): value.strip() for key, value in _YAML_FIELD_PATTERN.findall(body)}
+    fields.update((key.strip().lower(), value.strip()) for key, value in _BOLD_FIELD_PATTERN.findall(body))
+    return fields
+
+
+def _as_goal(item: str) -> str:
+    """'Build scalable apps' -> 'build scalable apps' (acronyms such as 'API' are kept)."""
+    if len(item) > 1 and item[0].isupper() and not item[1].isupper():
+        return item[0].lower() + item[1:]
+    return item
+
+
+def parse_preset(text: str, relative_path: str) -> Dict[str, Any]:
+    """
+    Parse a preset markdown file into questionnaire responses.
+
+    Args:
+        text: Preset markdown (YAML frontmatter followed by sections)
+        relative_path: Path below templates/presets, kept as 'template'
+
+    Returns:
+        Responses dict for PromptGenerator.generate(); fields the preset
+        does not define are left out so the generator defaults apply
+    """
+    frontmatter = {}
+    match = _FRONTMATTER_PATTERN.match(text)
+    if match:
+        frontmatter = _fields(match.group(1))
+
+    sections = _sections(text, _SECTION_PATTERN)
+    config = _fields(sections.get('Default Configuration', ''))
+    style = sections.get('Communication Style', '')
+    style_fields = _fields(style)
+
+    # Goals and constraints live either in their own sections or as
+    # subsections of "Common Goals and Constraints"
+    combined = _sections(sections.get('Common Goals and Constraints', ''), _SUBSECTION_PATTERN)
+    goals = _list_items(sections.get('Common Goals', '') or combined.get('Primary Goals', ''))
+    constraints = _list_items(sections.get('Typical Constraints', '') or combined.get('Key Constraints', ''))
+
+    # Specializations are either a flat list or grouped under ### headings
+    specialization_body = sections.get('Specializations', '')
+    specializations = (list(_sections(specialization_body, _SUBSECTION_PATTERN)) or
+                       _list_items(specialization_body))
+    tone = (style_fields.get('tone') or config.get('communication_style') or
+            ', '.join(_list_items(_sections(style, _SUBSECTION_PATTERN).get('Tone', ''))[:SUMMARY_ITEMS]))
+
+    name = frontmatter.get('preset_name') or Path(relative_path).stem
+    responses = {
+        'role': frontmatter.get('role') or config.get('role') or name.replace('-', ' ').title(),
+        'role_context': config.get('expertise') or ', '.join(specializations[:SUMMARY_ITEMS]),
+        'domain': frontmatter.get('domain') or config.get('domain') or config.get('primary domain', ''),
+        'goal': _as_goal(goals[0]) if goals else '',
+        'output_type': frontmatter.get('output_type') or config.get('output type', ''),
+        'tech_stack': config.get('tech stack') or config.get('tools', ''),
+        'constraints': '; '.join(constraints),
+        'tone': tone,
+        'preset': name,
+        'category': frontmatter.get('category', Path(relative_path).parent.name),
+        'template': relative_path,
+    }
+    return {key: value for key, value in responses.items() if value}
+
+
+def preset_aliases(text: str) -> List[str]:
+    """Former names a preset answers to, from its `aliases:` frontmatter field."""
+    match = _FRONTMATTER_PATTERN.match(text)
+    if not match:
+        return []
+    aliases = _fields(match.group(1)).get('aliases', '')
+    return [alias.strip() for alias in aliases.split(',') if alias.strip()]
+
+
+def _preset_files(presets_dir: Path) -> Tuple[List[Path], Fingerprint]:
+    """Preset files in a stable order, plus the fingerprint the sidecar is checked against."""
+    files = []
+    newest = total_size = 0
+    # The file list digest catches deleted and renamed presets, which leave
+    # no newer mtime behind (folder mtimes would also change with the sidecar)
+    digest = hashlib.blake2b(digest_size=8)
+    for root, dirs, names in os.walk(presets_dir):
+        dirs.sort()
+        for filename in sorted(names):
+            if not filename.endswith('.md'):
+                continue
+            path = Path(root) / filename
+            stat = path.stat()
+            newest = max(newest, stat.st_mtime_ns)
+            total_size += stat.st_size
+            digest.update(path.relative_to(presets_dir).as_posix().encode('utf-8') + b'\0')
+            files.append(path)
+    return files, (newest, total_size, len(files), digest.digest())
+
+
+class PresetIndex:
+    """Compiled, memory-mapped index of preset responses keyed by preset name."""
+
+    def __init__(self, presets_dir: Path = PRESETS_DIR, index_path: Optional[Path] = None):
+        self.presets_dir = Path(presets_dir)
+        self.index_path = Path(index_path) if index_path else self.presets_dir / INDEX_FILENAME
+        self._buffer = None
+        self._data_start = 0
+        self._directory: Dict[str, List[int]] = {}
+        self._aliases: Dict[str, str] = {}
+        self._decoded: Dict[str, Dict[str, Any]] = {}
+        self.rebuilt = False
+        self._open()
+
+    def _open(self):
+        """Map the sidecar if it matches the presets tree, rebuilding it otherwise."""
+        files, fingerprint = _preset_files(self.presets_dir)
+
+        if not self._map(fingerprint):
+            blob = self._build(files, fingerprint)
+            self.rebuilt = True
+            try:
+                # Atomic write: concurrent workers may rebuild at the same time
+                tmp_path = self.index_path.with_suffix(f".{os.getpid()}.tmp")
+                tmp_path.write_bytes(blob)
+                tmp_path.replace(self.index_path)
+            except OSError:
+                # Read-only presets folder: serve the index from memory
+                self._load(blob)
+                return
+            if not self._map(fingerprint):
+                self._load(blob)
+
+    def _map(self, fingerprint: Fingerprint) -> bool:
+        """Memory-map the sidecar read-only; False if missing or stale."""
+        try:
+            with open(self.index_path, 'rb') as f:
+                buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            # ValueError: empty file
+            return False
+
+        if len(buffer) < _HEADER.size:
+            buffer.close()
+            return False
+        magic, *stored, directory_length = _HEADER.unpack_from(buffer)
+        if magic != _MAGIC or tuple(stored) != fingerprint:
+            buffer.close()
+            return False
+
+        self._load(buffer, directory_length)
+        return True
+
+    def _load(self, buffer, directory_length: int = None):
+        if directory_length is None:
+            directory_length = _HEADER.unpack_from(buffer)[-1]
+        start = _HEADER.size
+        self._buffer = buffer
+        directory = json.loads(bytes(buffer[start:start + directory_length]))
+        self._directory = directory['presets']
+        self._aliases = directory['aliases']
+        self._data_start = start + directory_length
+
+    def _build(self, files: List[Path], fingerprint: Fingerprint) -> bytes:
+        """
+        Parse every preset and lay the records out behind a name -> (offset, length) directory.
+
+        Raises:
+            ValueError: If two presets share a name or alias
+        """
+        presets: Dict[str, List[int]] = {}
+        aliases: Dict[str, str] = {}
+        claimed: Dict[str, str] = {}  # name or alias -> file that uses it
+        records = []
+        offset = 0
+        for path in files:
+            text = path.read_text(encoding='utf-8')
+            relative_path = path.relative_to(self.presets_dir).as_posix()
+            responses = parse_preset(text, relative_path)
+            name = responses['preset']
+            for claim in [name, *preset_aliases(text)]:
+                if claim in claimed:
+                    raise ValueError(f"Preset name '{claim}' is used by both "
+                                     f"{claimed[claim]} and {relative_path}")
+                claimed[claim] = relative_path
+                if claim != name:
+                    aliases[claim] = name
+
+            record = json.dumps(responses, sort_keys=True).encode('utf-8')
+            presets[name] = [offset, len(record)]
+            records.append(record)
+            offset += len(record)
+
+        directory = {'presets': presets, 'aliases': aliases}
+        directory_bytes = json.dumps(directory, sort_keys=True).encode('utf-8')
+        header = _HEADER.pack(_MAGIC, *fingerprint, len(directory_bytes))
+        return b''.join([header, directory_bytes, *records])
+
+    def names(self) -> List[str]:
+        """All preset names, sorted (aliases are not listed)."""
+        return sorted(self._directory)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._directory or name in self._aliases
+
+    def get(self, name: str) -> Dict[str, Any]:
+        """
+        Return a copy of the responses for preset `name` (or one of its aliases).
+
+        Records are decoded from the mapping on first use and memoized.
+
+        Raises:
+            ValueError: If no preset has that name
+        """
+        name = self._aliases.get(name, name)
+        responses = self._decoded.get(name)
+        if responses is None:
+            if name not in self._directory:
+                raise ValueError(f"Unknown preset: {name} (use one of {', '.join(self.names())})")
+            offset, length = self._directory[name]
+            start = self._data_start + offset
+            responses = self._decoded[name] = json.loads(bytes(self._buffer[start:start + length]))
+        return dict(responses)
+
+    def close(self):
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+        self._buffer = None
+
+
+@lru_cache(maxsize=None)
+def get_preset_index(presets_dir: Path = PRESETS_DIR) -> PresetIndex:
+    """Return the per-process index for `presets_dir`, opened on first use."""
+    return PresetIndex(presets_dir)
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Prompt Suite - Output Cache
+
+Content-addressed on-disk cache for generated prompt documents.
+Entries are keyed by a hash of the normalized responses, format, mode and
+generator version, so unchanged batch rows skip generation and file rewrites.
+
+Usage:
+    from prompt_cache import PromptCache
+
+    cache = PromptCache('.prompt-cache', max_bytes=256 * 1024 * 1024)
+    key = cache.key_for(config, 'all', 'core')
+    entry = cache.get(key)
+"""
+
+import os
+import json
+import hashlib
+import tempfile
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+from generate_prompt import GENERATOR_VERSION
+
+
+# Batch-only keys that never influence generated content
+NON_CONTENT_KEYS = ('name',)
+
+
+class PromptCache:
+    """On-disk prompt cache with least-recently-used eviction by size and count."""
+
+    def __init__(self, cache_dir: str, max_bytes: int = 256 * 1024 * 1024,
+                 max_entries: int = None):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def key_for(responses: Dict[str, Any], format_type: str, mode: str) -> str:
+        """Hash the content-relevant inputs of a generation request."""
+        normalized = {
+            key: value.strip() if isinstance(value, str) else value
+            for key, value in responses.items()
+            if key not in NON_CONTENT_KEYS
+        }
+        payload = json.dumps({
+            'responses': normalized,
+            'format_type': format_type,
+            'mode': mode,
+            'version': GENERATOR_VERSION
+        }, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached entry for `key`, or None on a miss."""
+        path = self._entry_path(key)
+        try:
+            entry = json.loads(path.read_text())
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+        # Touch for LRU ordering
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return entry
+
+    def put(self, key: str, result: Dict[str, Any], document: str) -> Dict[str, Any]:
+        """Store a generation result and its rendered markdown document."""
+        entry = {
+            'key': key,
+            'version': GENERATOR_VERSION,
+            'document_sha256': hashlib.sha256(document.encode('utf-8')).hexdigest(),
+            'document': document,
+            'validation': result['validation'],
+            'metadata': result['metadata']
+        }
+
+        path = self._entry_path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Atomic write through a unique temp file: batch worker threads and
+        # processes may store the same key at the same time
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f'.{key}.', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as tmp_file:
+                json.dump(entry, tmp_file)
+            os.replace(tmp_name, path)
+        except BaseException:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+            raise
+        return entry
+
+    def prune(self) -> int:
+        """Evict least-recently-used entries until size and count limits hold."""
+        entries = []
+        for path in self.cache_dir.glob('*/*.json'):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        entries.sort()
+        total_bytes = sum(size for _, size, _ in entries)
+        max_entries = len(entries) if self.max_entries is None else self.max_entries
+        removed = 0
+
+        # Oldest first; walk the sorted list instead of popping from its front
+        for _, size, path in entries:
+            if total_bytes <= self.max_bytes and len(entries) - removed <= max_entries:
+                break
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            total_bytes -= size
+            removed += 1
+
+        return removed
+
+
+def file_matches(path: Path, sha256: str) -> bool:
+    """Check whether `path` already holds content with the given SHA-256."""
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest() == sha256
+    except FileNotFoundError:
+        return False
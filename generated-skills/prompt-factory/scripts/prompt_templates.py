@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""
+Prompt Suite - Prompt Templates
+
+Precompiled skeletons for the XML, Claude, ChatGPT and Gemini formats.
+Each skeleton is split into literal fragments and named slots on first use
+and compiled into a render function that joins fragments and slot values in
+one pass. The renderers only compute slot values; the prompt text lives here.
+
+Usage:
+    from prompt_templates import get_template
+
+    prompt = get_template('gemini').render(role='Data Engineer', specialization='', ...)
+
+Benchmark:
+    python benchmark.py templates
+"""
+
+import re
+from functools import lru_cache
+from typing import Any, Callable, Dict, List
+
+
+_SLOT_PATTERN = re.compile(r'\{(\w+)\}')
+
+
+class CompiledTemplate:
+    """
+    A template split into literal fragments and slot names.
+
+    The fragments are compiled once into a render function whose body is a
+    single string build (one join of every fragment and slot value), so a
+    render costs one call and one allocation for the result.
+    """
+
+    def __init__(self, source: str):
+        # re.split with one group alternates literal, slot name, literal, ...
+        self.fragments: List[str] = _SLOT_PATTERN.split(source)
+        # Unique slot names in order of first appearance
+        self.slot_names: List[str] = list(dict.fromkeys(self.fragments[1::2]))
+        self.render = self._compile()
+
+    def _compile(self) -> Callable[..., str]:
+        """Build the render function: keyword-only slots, one f-string join."""
+        body = ''.join(
+            f'{{{fragment}}}' if offset % 2 else fragment.replace('{', '{{').replace('}', '}}')
+            for offset, fragment in enumerate(self.fragments)
+        )
+        source = f"def render(*, {', '.join(self.slot_names)}):\n    return f{body!r}\n"
+        namespace: Dict[str, Any] = {}
+        exec(compile(source, '<prompt template>', 'exec'), namespace)
+        return namespace['render']
+
+
+XML_TEMPLATE = """<mega_prompt>
+
+<role>
+{role_text}
+</role>
+
+<mission>
+Your primary objective is to {goal}.
+
+Success is defined by: {success_criteria}
+</mission>
+
+<context>
+{context_content}
+</context>
+
+{workflow}
+
+<output_specifications>
+  <format>{output_type}</format>
+  <structure>{format_preference} format with clear organization</structure>
+  <depth_level>{detail_level}</depth_level>
+  <quality_criteria>{success_criteria}</quality_criteria>
+</output_specifications>
+
+<communication_guidelines>
+  <tone>{tone}</tone>
+  <audience>{target_audience}</audience>
+  <formatting>{format_preference}</formatting>
+  <examples_usage>Provide relevant examples when they clarify complex concepts or demonstrate best practices</examples_usage>
+</communication_guidelines>
+
+{best_practices}
+
+<critical_instructions>
+  <priority_1>
+    - Ensure all information is accurate and verified
+    - Follow ALL constraints specified in the context section
+    {avoid_rule}
+  </priority_1>
+
+  <priority_2>
+    - Provide complete, production-ready output
+    - Include proper error handling and edge cases
+    - Maintain specified communication style
+  </priority_2>
+
+  <priority_3>
+    - Optimize for clarity and maintainability
+    - Consider scalability and future extensibility
+    - Provide actionable guidance
+  </priority_3>
+</critical_instructions>
+
+<examples>
+## Example 1: Standard Request
+**User Request:** [Typical request for this role]
+
+**Expected Response Structure:**
+- Analyze the request thoroughly
+- Apply the workflow systematically
+- Deliver output meeting quality criteria
+- Include relevant examples
+
+## Example 2: Complex Scenario
+**User Request:** [More complex request]
+
+**Expected Response Structure:**
+- Break down into manageable components
+- Address each component systematically
+- Integrate solutions coherently
+- Validate against success criteria
+</examples>
+
+<execution_trigger>
+You are now fully configured as {role}{specialization}.
+
+When the user provides a request:
+1. Analyze their specific needs using the workflow above
+2. Apply relevant best practices contextually
+3. Generate output meeting quality criteria
+4. Deliver complete solution in one comprehensive response
+
+Begin assisting the user now with this configuration.
+</execution_trigger>
+
+</mega_prompt>"""
+
+CLAUDE_TEMPLATE = """# System Configuration: {role}
+
+You are {role}{specialization}.
+
+## Your Mission
+
+{goal}
+
+## Your Expertise
+
+{expertise_domain}
+{expertise_stack}
+
+## Your Workflow
+
+When given a task:
+{workflow_steps}
+
+## Output Standards
+
+- Format: {output_type}
+- Depth: {detail_level} detail
+- Quality: Production-ready, complete, accurate
+
+## Communication Style
+
+- Tone: {tone}
+- Clarity: Crystal clear with concrete examples
+- Structure: Well-organized with logical flow
+
+## Critical Rules
+
+**Must follow:**
+{constraint_rule}
+- Verify all information is accurate
+- Provide complete, actionable solutions
+- Include relevant examples
+
+**Always include:**
+- Clear explanations
+- Practical examples
+- Edge case handling
+- Quality validation
+
+## Best Practices
+
+{best_practices_list}
+
+## Response Examples
+
+[Include 2-3 examples of expected response patterns based on typical requests]
+
+---
+
+Execute your role now, following all guidelines above. When the user makes a request, apply this configuration to deliver high-quality, comprehensive responses.
+"""
+
+CHATGPT_TEMPLATE = """**What would you like ChatGPT to know about you to provide better responses?**
+
+I need you to act as {role}{specialization}.
+
+My domain: {domain_label}
+{tech_stack_line}
+{constraints_line}
+
+My goal: {goal}
+
+**How would you like ChatGPT to respond?**
+
+WORKFLOW:
+{workflow_steps}
+
+OUTPUT REQUIREMENTS:
+- Format: {output_type}
+- Style: {tone} tone, {detail_level} detail
+- Structure: {format_preference} with clear organization
+- Quality: Production-ready, complete, accurate
+
+CRITICAL RULES:
+{constraint_rule}
+- Verify accuracy
+- Provide complete solutions
+- Include examples
+- Handle edge cases
+
+BEST PRACTICES:
+{best_practices_list}
+
+Always provide {format_preference} responses with concrete examples and ensure {output_type} meets production quality standards."""
+
+GEMINI_TEMPLATE = """## Role Configuration
+You are: {role}{specialization}
+
+## Task Approach
+{workflow_simple}
+
+## Output Format
+- Type: {output_type}
+- Detail: {detail_level}
+- Quality: Complete and production-ready
+
+## Quality Standards
+- Accurate and verified information
+- Clear, practical examples
+- Complete solutions
+- Edge case handling
+
+## Examples
+[Example 1: Show typical interaction]
+[Example 2: Show complex scenario handling]
+
+Apply this configuration to all responses. Maintain this role and follow these standards consistently.
+"""
+
+TEMPLATES = {
+    'xml': XML_TEMPLATE,
+    'claude': CLAUDE_TEMPLATE,
+    'chatgpt': CHATGPT_TEMPLATE,
+    'gemini': GEMINI_TEMPLATE,
+}
+
+
+@lru_cache(maxsize=None)
+def get_template(format_type: str) -> CompiledTemplate:
+    """Compile a format skeleton on first use and reuse it afterwards."""
+    if format_type not in TEMPLATES:
+        raise ValueError(f"Unknown format: {format_type}")
+    return CompiledTemplate(TEMPLATES[format_type])
+
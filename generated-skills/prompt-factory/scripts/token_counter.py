@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Prompt Suite - Token Counter
+
+Shared token counting for the generator, validator and optimizer.
+
+Counters:
+    approx    Fast approximation (default): ~4 characters per token. Cheap
+              enough for the quality gates run on every generated prompt.
+    bpe       Offline BPE-style estimator (opt-in, e.g. --tokenizer bpe):
+              splits text the way GPT-style BPE tokenizers pre-tokenize it,
+              then charges each piece by how many subword merges it
+              typically needs. Several times slower than approx.
+    tiktoken  Exact cl100k_base counts, if the optional tiktoken package
+              and its encoding files are available.
+
+Usage:
+    from token_counter import count_tokens
+
+    count_tokens(prompt)              # ~4 chars/token
+    count_tokens(prompt, 'bpe')       # closer to real BPE counts
+"""
+
+import re
+import math
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict
+
+
+DEFAULT_COUNTER = 'approx'
+
+# Rule of thumb (~0.75 English words per token) for carrying limits that were
+# set in words over to token counts
+WORDS_PER_TOKEN = 0.75
+
+# Entries kept per counter in the text-hash memo
+MEMO_SIZE = 4096
+
+# GPT-style pre-tokenization: contractions, words with their leading space,
+# 1-3 digit groups, punctuation runs, and whitespace runs
+_PRETOKENIZE_PATTERN = re.compile(
+    r"'(?:[sdmt]|ll|ve|re)| ?[^\W\d_]+| ?\d{1,3}| ?[^\s\w]+[\r\n]*|\s*[\r\n]+|\s+(?!\S)|\s+",
+    re.IGNORECASE
+)
+
+# Words up to this length are almost always a single BPE token
+_SINGLE_TOKEN_WORD_LENGTH = 10
+
+# Characters per extra token for longer (rarer) words and punctuation runs
+_CHARS_PER_SUBWORD = 4
+_CHARS_PER_PUNCT_TOKEN = 3
+
+
+class TokenCounter:
+    """
+    Base class: counts tokens and memoizes results per text hash.
+
+    Counters are shared process-wide (BatchGenerator uses them from its
+    thread pool), so the memo is guarded by a lock; counting itself runs
+    outside it.
+    """
+
+    name = 'base'
+
+    def __init__(self):
+        self._memo: 'OrderedDict[bytes, int]' = OrderedDict()
+        self._memo_lock = threading.Lock()
+
+    def count(self, text: str) -> int:
+        """Return the token count for `text`, memoized by content hash."""
+        key = hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+        with self._memo_lock:
+            cached = self._memo.get(key)
+            if cached is not None:
+                self._memo.move_to_end(key)
+                return cached
+
+        tokens = self._count(text)
+
+        with self._memo_lock:
+            self._memo[key] = tokens
+            if len(self._memo) > MEMO_SIZE:
+                self._memo.popitem(last=False)
+        return tokens
+
+    def _count(self, text: str) -> int:
+        raise NotImplementedError
+
+
+class ApproxTokenCounter(TokenCounter):
+    """Fast character-based approximation (~4 characters per token)."""
+
+    name = 'approx'
+
+    def count(self, text: str) -> int:
+        # Cheaper than hashing, so no memo
+        return math.ceil(len(text) / 4)
+
+
+class BPETokenCounter(TokenCounter):
+    """Offline BPE-style estimator built on GPT-style pre-tokenization."""
+
+    name = 'bpe'
+
+    def _count(self, text: str) -> int:
+        tokens = 0
+        for piece in _PRETOKENIZE_PATTERN.findall(text):
+            core = piece.strip()
+            if not core or core[0].isdigit() or core[0] == "'":
+                # Whitespace runs, digit groups and contractions
+                tokens += 1
+            elif core[0].isalpha():
+                length = len(core)
+                if length <= _SINGLE_TOKEN_WORD_LENGTH:
+                    tokens += 1
+                else:
+                    tokens += 1 + math.ceil((length - _SINGLE_TOKEN_WORD_LENGTH) / _CHARS_PER_SUBWORD)
+            else:
+                tokens += math.ceil(len(core) / _CHARS_PER_PUNCT_TOKEN)
+        return tokens
+
+
+class TiktokenCounter(TokenCounter):
+    """Exact counts via the optional tiktoken package, loaded on first use."""
+
+    name = 'tiktoken'
+
+    def __init__(self, encoding: str = 'cl100k_base'):
+        super().__init__()
+        self.encoding_name = encoding
+        self._encoding = None
+
+    def _count(self, text: str) -> int:
+        if self._encoding is None:
+            try:
+                import tiktoken
+            except ImportError as e:
+                raise ValueError("tiktoken counter requires: pip install tiktoken") from e
+            self._encoding = tiktoken.get_encoding(self.encoding_name)
+        return len(self._encoding.encode(text, disallowed_special=()))
+
+
+_COUNTER_FACTORIES: Dict[str, Callable[[], TokenCounter]] = {
+    'bpe': BPETokenCounter,
+    'approx': ApproxTokenCounter,
+    'tiktoken': TiktokenCounter,
+}
+
+# Counters are created lazily and shared process-wide
+_counters: Dict[str, TokenCounter] = {}
+
+
+def register_counter(name: str, factory: Callable[[], TokenCounter]):
+    """Register an additional counter backend under `name`."""
+    _COUNTER_FACTORIES[name] = factory
+    _counters.pop(name, None)
+
+
+def available_counters():
+    """Names accepted by get_counter() and count_tokens()."""
+    return sorted(_COUNTER_FACTORIES)
+
+
+def get_counter(name: str = DEFAULT_COUNTER) -> TokenCounter:
+    """Return the shared counter instance for `name`."""
+    counter = _counters.get(name)
+    if counter is None:
+        if name not in _COUNTER_FACTORIES:
+            raise ValueError(f"Unknown token counter: {name} (use one of {', '.join(available_counters())})")
+        counter = _counters[name] = _COUNTER_FACTORIES[name]()
+    return counter
+
+
+def count_tokens(text: str, counter: str = DEFAULT_COUNTER) -> int:
+    """Count tokens in `text` with the named counter."""
+    return get_counter(counter).count(text)
@@ -11,18 +11,30 @@ Usage:
     python validator.py --prompt prompt.md --fail-on-error
 """
 
-import re
 import json
 import argparse
 from pathlib import Path
 from typing import Dict, List, Any, Tuple
 from datetime import datetime
+from gate_engine import (
+    PromptScan, scan_prompt, WORKFLOW_INDICATORS, BEST_PRACTICE_INDICATORS
+)
+from token_counter import DEFAULT_COUNTER, WORDS_PER_TOKEN, available_counters, get_counter
+
+
+# Over-limit prompts below this still pass the token gate with a warning, and
+# prompts above the second limit get a "reduce tokens" recommendation. Both
+# were word counts (15000 and 6000 words) before the gate counted tokens
+TOKEN_WARNING_LIMIT = round(15000 / WORDS_PER_TOKEN)
+TOKEN_RECOMMENDATION_LIMIT = round(6000 / WORDS_PER_TOKEN)
 
 
 class PromptValidator:
     """Validate prompt quality with 7-point validation gates."""
 
-    def __init__(self):
+    def __init__(self, tokenizer: str = DEFAULT_COUNTER):
+        get_counter(tokenizer)  # fail fast on unknown counters
+        self.tokenizer = tokenizer
         self.gates = [
             ('xml_structure', 'XML Structure Valid'),
             ('completeness', 'No Empty Sections'),
@@ -44,6 +56,9 @@ class PromptValidator:
         Returns:
             Validation results dictionary
         """
+        # Scan once; every gate reads from the shared scan
+        scan = scan_prompt(prompt, self.tokenizer)
+
         # Auto-detect format if not specified
         if format_hint == 'auto':
             format_hint = self._detect_format(prompt)
@@ -62,7 +77,7 @@ class PromptValidator:
 
         # Gate 1: XML Structure
         if format_hint == 'xml':
-            passed, details = self._check_xml_structure(prompt)
+            passed, details = self._check_xml_structure(scan)
         else:
             passed, details = True, "N/A for non-XML format"
 
@@ -76,7 +91,7 @@ class PromptValidator:
             results['issues'].append(f"XML Structure: {details}")
 
         # Gate 2: Completeness
-        passed, details = self._check_completeness(prompt)
+        passed, details = self._check_completeness(scan)
         results['gates']['completeness'] = {
             'passed': passed,
             'details': details
@@ -87,7 +102,7 @@ class PromptValidator:
             results['issues'].append(f"Completeness: {details}")
 
         # Gate 3: Token Count
-        passed, details, token_count = self._check_token_count(prompt)
+        passed, details, token_count = self._check_token_count(scan)
         results['gates']['token_count'] = {
             'passed': passed,
             'details': details,
@@ -95,14 +110,14 @@ class PromptValidator:
         }
         if passed:
             results['score'] += 1
-        elif token_count < 15000:
+        elif token_count < TOKEN_WARNING_LIMIT:
             results['score'] += 1  # Warning but not failure
-            results['warnings'].append(f"Token count high: ~{token_count} words")
+            results['warnings'].append(f"Token count high: ~{token_count} tokens")
         else:
             results['issues'].append(f"Token Count: {details}")
 
         # Gate 4: No Placeholders
-        passed, details, found_placeholders = self._check_placeholders(prompt)
+        passed, details, found_placeholders = self._check_placeholders(scan)
         results['gates']['no_placeholders'] = {
             'passed': passed,
             'details': details,
@@ -114,7 +129,7 @@ class PromptValidator:
             results['issues'].append(f"Placeholders: {details}")
 
         # Gate 5: Actionable Workflow
-        passed, details = self._check_workflow(prompt)
+        passed, details = self._check_workflow(scan)
         results['gates']['actionable_workflow'] = {
             'passed': passed,
             'details': details
@@ -125,7 +140,7 @@ class PromptValidator:
             results['issues'].append(f"Workflow: {details}")
 
         # Gate 6: Best Practices
-        passed, details = self._check_best_practices(prompt)
+        passed, details = self._check_best_practices(scan)
         results['gates']['best_practices'] = {
             'passed': passed,
             'details': details
@@ -136,7 +151,7 @@ class PromptValidator:
             results['issues'].append(f"Best Practices: {details}")
 
         # Gate 7: Examples Present
-        passed, details, example_count = self._check_examples(prompt)
+        passed, details, example_count = self._check_examples(scan)
         results['gates']['examples_present'] = {
             'passed': passed,
             'details': details,
@@ -168,94 +183,56 @@ class PromptValidator:
         else:
             return 'unknown'
 
-    def _check_xml_structure(self, prompt: str) -> Tuple[bool, str]:
-        """Validate XML tags are properly closed."""
-        # Extract tag pairs
-        opening_tags = re.findall(r'<([^/\s][^>]*)>', prompt)
-        closing_tags = re.findall(r'</([^>]+)>', prompt)
-
-        # Filter out self-closing or special tags
-        opening_tags = [tag.split()[0] for tag in opening_tags if not tag.endswith('/')]
-        closing_tags = [tag.strip() for tag in closing_tags]
+    def _check_xml_structure(self, scan: PromptScan) -> Tuple[bool, str]:
+        """Validate XML tags are properly nested and closed."""
+        if scan.xml_error:
+            message, offset = scan.xml_error
+            return False, f"{message} at offset {offset}"
 
-        # Check balance
-        if len(opening_tags) != len(closing_tags):
-            return False, f"Unbalanced tags: {len(opening_tags)} opening, {len(closing_tags)} closing"
+        opening_count = sum(1 for body in scan.opening_tags
+                            if not body[0].isspace() and not body.endswith('/'))
+        return True, f"All {opening_count} tags properly closed"
 
-        # Check for unclosed specific tags
-        important_tags = ['mega_prompt', 'role', 'mission', 'context', 'workflow']
-        for tag in important_tags:
-            open_count = opening_tags.count(tag)
-            close_count = closing_tags.count(tag)
-            if open_count != close_count:
-                return False, f"Tag '{tag}' unbalanced: {open_count} open, {close_count} close"
-
-        return True, f"All {len(opening_tags)} tags properly closed"
-
-    def _check_completeness(self, prompt: str) -> Tuple[bool, str]:
+    def _check_completeness(self, scan: PromptScan) -> Tuple[bool, str]:
         """Check for empty sections or missing content."""
         # Look for empty XML tags
-        empty_xml = re.findall(r'<([^/][^>]*)>\s*</\1>', prompt)
-        if empty_xml:
-            return False, f"Empty sections found: {', '.join(set(empty_xml))}"
+        if scan.empty_tags:
+            return False, f"Empty sections found: {', '.join(set(scan.empty_tags))}"
 
         # Look for sections with only whitespace
-        section_pattern = r'##\s+([^\n]+)\s*\n\s*(?=##|$)'
-        empty_sections = re.findall(section_pattern, prompt)
-        if empty_sections:
-            return False, f"Empty heading sections: {len(empty_sections)}"
+        if scan.empty_headings:
+            return False, f"Empty heading sections: {len(scan.empty_headings)}"
 
         # Check minimum content length
-        if len(prompt.strip()) < 1000:
-            return False, f"Prompt too short: {len(prompt)} characters (minimum 1000)"
+        if scan.stripped_length < 1000:
+            return False, f"Prompt too short: {scan.length} characters (minimum 1000)"
 
         return True, "All sections have content"
 
-    def _check_token_count(self, prompt: str) -> Tuple[bool, str, int]:
+    def _check_token_count(self, scan: PromptScan) -> Tuple[bool, str, int]:
         """Check token count is reasonable."""
-        # Rough token estimation: ~0.75 words per token
-        word_count = len(prompt.split())
-        estimated_tokens = int(word_count * 0.75)
+        estimated_tokens = scan.token_count
 
         if estimated_tokens > 8000:
-            return False, f"Token count very high: ~{estimated_tokens} tokens", word_count
+            return False, f"Token count very high: ~{estimated_tokens} tokens", estimated_tokens
         elif estimated_tokens > 6000:
-            return True, f"Token count acceptable but high: ~{estimated_tokens} tokens", word_count
+            return True, f"Token count acceptable but high: ~{estimated_tokens} tokens", estimated_tokens
         else:
-            return True, f"Token count optimal: ~{estimated_tokens} tokens", word_count
+            return True, f"Token count optimal: ~{estimated_tokens} tokens", estimated_tokens
 
-    def _check_placeholders(self, prompt: str) -> Tuple[bool, str, List[str]]:
+    def _check_placeholders(self, scan: PromptScan) -> Tuple[bool, str, List[str]]:
         """Check for placeholder text that needs filling."""
-        placeholder_patterns = [
-            r'\[TODO[^\]]*\]',
-            r'\[FILL[^\]]*\]',
-            r'\[INSERT[^\]]*\]',
-            r'\[PLACEHOLDER[^\]]*\]',
-            r'\[TBD[^\]]*\]',
-            r'\[XXX[^\]]*\]',
-            r'\[\.\.\..*?\]',
-        ]
-
-        found = []
-        for pattern in placeholder_patterns:
-            matches = re.findall(pattern, prompt, re.IGNORECASE)
-            found.extend(matches)
+        found = scan.placeholders
 
         if found:
             return False, f"Found {len(found)} placeholder(s)", list(set(found))[:5]
         else:
             return True, "No placeholders found", []
 
-    def _check_workflow(self, prompt: str) -> Tuple[bool, str]:
+    def _check_workflow(self, scan: PromptScan) -> Tuple[bool, str]:
         """Check for presence of actionable workflow."""
-        workflow_indicators = [
-            'workflow', 'process', 'approach', 'method', 'steps',
-            'phase', 'stage', '1.', '2.', '3.', 'first', 'then', 'next'
-        ]
-
         # Count workflow indicators
-        indicators_found = sum(1 for indicator in workflow_indicators
-                             if indicator.lower() in prompt.lower())
+        indicators_found = scan.indicators_found(WORKFLOW_INDICATORS)
 
         if indicators_found >= 5:
             return True, f"Clear workflow present ({indicators_found} indicators)"
@@ -264,16 +241,9 @@ class PromptValidator:
         else:
             return False, f"Workflow unclear ({indicators_found} indicators, need 3+)"
 
-    def _check_best_practices(self, prompt: str) -> Tuple[bool, str]:
+    def _check_best_practices(self, scan: PromptScan) -> Tuple[bool, str]:
         """Check for inclusion of best practices."""
-        best_practice_indicators = [
-            'best practice', 'guideline', 'standard', 'recommendation',
-            'should', 'must', 'avoid', 'ensure', 'always', 'never',
-            'principle', 'rule', 'convention'
-        ]
-
-        indicators_found = sum(1 for indicator in best_practice_indicators
-                             if indicator.lower() in prompt.lower())
+        indicators_found = scan.indicators_found(BEST_PRACTICE_INDICATORS)
 
         if indicators_found >= 8:
             return True, f"Comprehensive best practices ({indicators_found} indicators)"
@@ -282,18 +252,14 @@ class PromptValidator:
         else:
             return False, f"Insufficient best practices ({indicators_found} indicators, need 5+)"
 
-    def _check_examples(self, prompt: str) -> Tuple[bool, str, int]:
+    def _check_examples(self, scan: PromptScan) -> Tuple[bool, str, int]:
         """Check for presence of examples."""
         # Count explicit example sections
-        example_sections = len(re.findall(r'##?\s*Example|<example', prompt, re.IGNORECASE))
+        example_sections = scan.example_headings
 
         # Count example indicators
-        example_words = prompt.lower().count('example')
-        for_instance = prompt.lower().count('for instance')
-        for_example = prompt.lower().count('for example')
-        such_as = prompt.lower().count('such as')
-
-        total_indicators = example_words + for_instance + for_example + such_as
+        total_indicators = (scan.count('example') + scan.count('for instance') +
+                            scan.count('for example') + scan.count('such as'))
 
         if example_sections >= 2 or total_indicators >= 4:
             return True, f"Good examples: {example_sections} sections, {total_indicators} indicators", example_sections
@@ -315,7 +281,7 @@ class PromptValidator:
         if not gates['completeness']['passed']:
             recommendations.append("Fill empty sections with relevant content")
 
-        if gates['token_count']['count'] > 6000:
+        if gates['token_count']['count'] > TOKEN_RECOMMENDATION_LIMIT:
             recommendations.append("Consider reducing token count: Remove redundancies, consolidate examples")
 
         if not gates['no_placeholders']['passed']:
@@ -431,13 +397,15 @@ Examples:
     parser.add_argument('--format', default='auto',
                        choices=['auto', 'xml', 'claude', 'chatgpt', 'gemini'],
                        help='Prompt format (default: auto-detect)')
+    parser.add_argument('--tokenizer', default=DEFAULT_COUNTER, choices=available_counters(),
+                       help=f'Token counter for the token-count gate (default: {DEFAULT_COUNTER})')
 
     args = parser.parse_args()
 
     if not args.prompt and not args.dir:
         parser.error("Either --prompt or --dir is required")
 
-    validator = PromptValidator()
+    validator = PromptValidator(tokenizer=args.tokenizer)
     results = []
 
     # Validate single prompt or directory